@@ -49,6 +49,11 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
     
+    # Business tool HTTP connection pool (per event loop)
+    TOOL_HTTP_MAX_CONNECTIONS: int = 128
+    TOOL_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 64
+    TOOL_HTTP_KEEPALIVE_EXPIRY: float = 75.0  # seconds an idle connection stays open
+    
     @field_validator("CORS_ORIGINS", mode='before')
     @classmethod
     def assemble_cors_origins(cls, v):
@@ -4,6 +4,7 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import os
 import logging
+import orjson
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -47,32 +48,32 @@ class EncryptionService:
             logger.error(f"Encryption failed: {e}")
             raise
     
+    def _decrypt_token(self, encrypted_data: str) -> bytes:
+        """Decrypt a base64 encoded token to its raw bytes"""
+        decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
+        return self.cipher_suite.decrypt(decoded_data)
+    
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt a base64 encoded encrypted string"""
         try:
-            decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_data = self.cipher_suite.decrypt(decoded_data)
-            return decrypted_data.decode()
+            return self._decrypt_token(encrypted_data).decode()
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             raise
     
     def encrypt_credentials(self, credentials: dict) -> str:
         """Encrypt a credentials dictionary"""
-        import json
         try:
-            credentials_json = json.dumps(credentials)
-            return self.encrypt(credentials_json)
+            encrypted_data = self.cipher_suite.encrypt(orjson.dumps(credentials, option=orjson.OPT_NON_STR_KEYS))
+            return base64.urlsafe_b64encode(encrypted_data).decode()
         except Exception as e:
             logger.error(f"Credentials encryption failed: {e}")
             raise
     
     def decrypt_credentials(self, encrypted_credentials: str) -> dict:
         """Decrypt credentials back to a dictionary"""
-        import json
         try:
-            decrypted_json = self.decrypt(encrypted_credentials)
-            return json.loads(decrypted_json)
+            return orjson.loads(self._decrypt_token(encrypted_credentials))
         except Exception as e:
             logger.error(f"Credentials decryption failed: {e}")
             raise
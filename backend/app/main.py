@@ -71,6 +71,12 @@ async def shutdown_event():
     except Exception as e:
         logger.warning(f"Error stopping Kafka producer: {e}")
     
+    # Close pooled connections held by business system tools
+    from app.tools.base import close_http_clients, drain_events, shutdown_tool_loop
+    await drain_events()
+    await close_http_clients()
+    await asyncio.to_thread(shutdown_tool_loop)
+    
     logger.info("Application shutdown complete")
 
 # Security middleware
@@ -1,6 +1,7 @@
 """
 Redis service for caching and session management
 """
+import asyncio
 import json
 import redis.asyncio as redis
 from typing import Optional, Any, Dict, List
@@ -17,6 +18,7 @@ class RedisService:
     def __init__(self):
         self._redis: Optional[redis.Redis] = None
         self._connected = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def connect(self):
         """Connect to Redis"""
@@ -31,6 +33,7 @@ class RedisService:
             # Test connection
             await self._redis.ping()
             self._connected = True
+            self._loop = asyncio.get_running_loop()
             logger.info("Connected to Redis successfully")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -44,6 +47,18 @@ class RedisService:
             self._connected = False
             logger.info("Disconnected from Redis")
     
+    def is_usable_in_running_loop(self) -> bool:
+        """
+        Check the client belongs to the running event loop.
+        
+        Async Redis connections are bound to the loop they were opened on, so
+        code that may run on a worker-thread loop must check this first.
+        """
+        try:
+            return self._connected and self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+    
     async def is_connected(self) -> bool:
         """Check if Redis is connected"""
         if not self._redis or not self._connected:
@@ -113,7 +113,7 @@ class ToolTrackingService:
             db_event = ToolExecutionEvent(
                 execution_id=execution_id,
                 event_type=event.type,
-                message=event.message,
+                message=event.render(),
                 event_data=event.data or {},
                 timestamp=event.timestamp
             )
@@ -2,19 +2,214 @@
 Base tool classes for business system integrations.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, AsyncIterator, Callable
 import asyncio
+import contextlib
+import importlib.util
 import logging
-import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pydantic import BaseModel, Field
 import httpx
+import ijson
+import orjson
+from ijson.common import ObjectBuilder
 from tenacity import retry, stop_after_attempt, wait_exponential
 from crewai.tools import tool
 
+from app.core.config import settings
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on every platform
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
+# HTTP/2 lets concurrent calls to one API multiplex over a single connection;
+# httpx needs the optional h2 package for it and falls back to HTTP/1.1 per host
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client per event loop: httpx clients cannot be shared across loops,
+# so the app loop and the CrewAI tool loop each hold their own.
+_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared connection-pooling client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.TOOL_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=settings.TOOL_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=settings.TOOL_HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the shared client of the running event loop, if any."""
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# CrewAI calls tools synchronously, often from the app loop's own thread while
+# crew.kickoff() blocks it. Tool coroutines therefore run on one long-lived loop
+# in a background thread, so its pooled client, caches and locks outlive a call.
+_TOOL_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_TOOL_LOOP_THREAD: Optional[threading.Thread] = None
+_TOOL_LOOP_LOCK = threading.Lock()
+
+
+def _get_tool_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop CrewAI tool calls run on, starting it if needed."""
+    global _TOOL_LOOP, _TOOL_LOOP_THREAD
+    with _TOOL_LOOP_LOCK:
+        if _TOOL_LOOP is None or _TOOL_LOOP.is_closed():
+            # uvicorn already serves the app on uvloop; use it for the tool loop too
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="crewai-tool-loop", daemon=True)
+            thread.start()
+            _TOOL_LOOP, _TOOL_LOOP_THREAD = loop, thread
+        return _TOOL_LOOP
+
+
+def run_on_tool_loop(coro) -> Any:
+    """Run ``coro`` on the shared tool loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_tool_loop()).result()
+
+
+def shutdown_tool_loop() -> None:
+    """Close the tool loop's HTTP client and stop the loop, if it was started."""
+    global _TOOL_LOOP, _TOOL_LOOP_THREAD
+    with _TOOL_LOOP_LOCK:
+        loop, thread = _TOOL_LOOP, _TOOL_LOOP_THREAD
+        _TOOL_LOOP = _TOOL_LOOP_THREAD = None
+    if loop is None or loop.is_closed():
+        return
+    
+    async def _close() -> None:
+        await drain_events()
+        await close_http_clients()
+    
+    try:
+        asyncio.run_coroutine_threadsafe(_close(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+# Strong references to fire-and-forget event deliveries so they are not
+# garbage collected before they run
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+async def drain_events() -> None:
+    """Wait for event deliveries scheduled on the running loop to finish."""
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _background_tasks if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+_CONTAINER_START = ("start_map", "start_array")
+_CONTAINER_END = ("end_map", "end_array")
+_SCALAR_EVENTS = ("string", "number", "boolean", "null")
+
+
+class _AsyncByteReader:
+    """Expose an async byte iterator through the ``read()`` API ijson expects."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire ``ttl`` seconds after being set.
+    
+    Once more than ``maxsize`` entries are stored the oldest is evicted.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter allowing ``rate`` acquisitions per ``per`` seconds.
+    
+    State is guarded by a thread lock rather than an asyncio primitive so one
+    bucket can be shared by tools running on different event loops.
+    """
+    
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.per / self.rate
+            await asyncio.sleep(wait)
+
+
 class ToolCredentials(BaseModel):
     """Base model for tool credentials."""
     integration_type: str
@@ -35,13 +230,25 @@ class ToolExecutionResult(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class ToolExecutionEvent(BaseModel):
-    """Event emitted during tool execution."""
+@dataclass(slots=True)
+class ToolExecutionEvent:
+    """
+    Event emitted during tool execution.
+    
+    A plain slotted dataclass rather than a pydantic model: several are built
+    per tool call and none of the fields need validation.
+    """
     type: str  # 'start', 'progress', 'complete', 'error'
     tool_name: str
     message: str
     data: Optional[Dict[str, Any]] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
+    # Positional ``str.format`` arguments for ``message``, applied by render()
+    args: Tuple[Any, ...] = ()
+    
+    def render(self) -> str:
+        """Human-readable message, formatted only when a consumer asks for it."""
+        return self.message.format(*self.args) if self.args else self.message
 
 
 class BaseBusinessTool(ABC):
@@ -50,6 +257,16 @@ class BaseBusinessTool(ABC):
     Provides common functionality for authentication, error handling, and logging.
     """
     
+    # Names of cached_property attributes derived from credentials; they are
+    # dropped whenever credentials are replaced
+    _credential_caches: Tuple[str, ...] = ()
+    
+    # Set on tools whose _test_connection_impl only returns {"status": "connected"}
+    _trivial_test: bool = False
+    
+    # Callbacks receiving every ToolExecutionEvent, shared by all tools
+    _event_subscribers: List[Callable[[ToolExecutionEvent], Any]] = []
+    
     def __init__(
         self, 
         credentials: ToolCredentials,
@@ -62,6 +279,16 @@ class BaseBusinessTool(ABC):
         self.name = self.__class__.__name__
         self.integration_type = credentials.integration_type
         
+    @property
+    def credentials(self) -> ToolCredentials:
+        return self._credentials
+    
+    @credentials.setter
+    def credentials(self, credentials: ToolCredentials) -> None:
+        self._credentials = credentials
+        for name in self._credential_caches:
+            self.__dict__.pop(name, None)
+    
     @property
     @abstractmethod
     def tool_name(self) -> str:
@@ -89,6 +316,14 @@ class BaseBusinessTool(ABC):
             return False
         return True
     
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager:
+        """
+        Context held around every HTTP request (each retry attempt included).
+        
+        Integrations override this to apply concurrency or rate limits.
+        """
+        return contextlib.nullcontext()
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
@@ -99,24 +334,110 @@ class BaseBusinessTool(ABC):
         url: str, 
         headers: Optional[Dict[str, str]] = None,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, str]] = None
+        params: Optional[Dict[str, str]] = None,
+        allow_status: Tuple[int, ...] = (),
+        content: Optional[bytes] = None
     ) -> httpx.Response:
-        """Make HTTP request with retry logic."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
+        """
+        Make HTTP request with retry logic.
+
+        Responses whose status code is listed in ``allow_status`` (e.g. 304)
+        are returned to the caller instead of raising. ``data`` is sent as a
+        JSON body encoded with orjson; pass an already encoded body as
+        ``content`` instead to skip that step.
+        """
+        if data is not None and content is None:
+            content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            if not headers or "Content-Type" not in headers:
+                headers = {**(headers or {}), "Content-Type": "application/json"}
+        async with self._request_slot():
+            response = await get_http_client().request(
                 method=method,
                 url=url,
                 headers=headers,
-                json=data,
-                params=params
+                content=content,
+                params=params,
+                timeout=self.timeout
             )
+        if response.status_code not in allow_status:
             response.raise_for_status()
-            return response
+        return response
+    
+    async def _stream_json_items(
+        self,
+        method: str,
+        url: str,
+        prefix: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the elements of the JSON array at ``prefix`` as they are parsed.
+        
+        ``prefix`` uses ijson notation: ``"item"`` for a top-level array,
+        ``"items.item"`` for the ``items`` array of an object. Top-level scalar
+        fields (e.g. ``total_count``) are copied into ``meta`` when given.
+        The response body is never materialized as a whole. ``content`` is an
+        already encoded request body.
+        """
+        async with self._request_slot(), get_http_client().stream(
+            method, url, headers=headers, params=params, content=content, timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            reader = _AsyncByteReader(response.aiter_bytes())
+            builder = None
+            async for path, event, value in ijson.parse_async(reader, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if path == prefix and event in _CONTAINER_END:
+                        yield builder.value
+                        builder = None
+                elif path == prefix:
+                    if event in _CONTAINER_START:
+                        builder = ObjectBuilder()
+                        builder.event(event, value)
+                    elif event in _SCALAR_EVENTS:
+                        yield value
+                elif meta is not None and event in _SCALAR_EVENTS and "." not in path:
+                    meta[path] = value
+    
+    @classmethod
+    def subscribe_events(cls, callback: Callable[[ToolExecutionEvent], Any]) -> None:
+        """Register a callback (sync or async) for tool execution events."""
+        BaseBusinessTool._event_subscribers.append(callback)
+    
+    @classmethod
+    def unsubscribe_events(cls, callback: Callable[[ToolExecutionEvent], Any]) -> None:
+        """Remove a callback registered with ``subscribe_events``."""
+        if callback in BaseBusinessTool._event_subscribers:
+            BaseBusinessTool._event_subscribers.remove(callback)
+    
+    @property
+    def _events_enabled(self) -> bool:
+        """Whether emitted events reach anyone; callers skip building events otherwise."""
+        return bool(BaseBusinessTool._event_subscribers) or logger.isEnabledFor(logging.DEBUG)
     
     async def emit_event(self, event: ToolExecutionEvent) -> None:
         """Emit tool execution event for streaming."""
-        # This will be connected to WebSocket streaming later
-        logger.info(f"Tool Event: {event.type} - {event.tool_name} - {event.message}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool Event: {event.type} - {event.tool_name} - {event.render()}")
+        for callback in BaseBusinessTool._event_subscribers:
+            outcome = callback(event)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+    
+    def emit_event_nowait(self, event: ToolExecutionEvent) -> None:
+        """
+        Schedule ``emit_event`` without waiting for subscribers.
+        
+        Deliveries run in scheduling order; use ``drain_events`` before the
+        event loop is closed.
+        """
+        task = asyncio.get_running_loop().create_task(self.emit_event(event))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     
     @abstractmethod
     async def execute(self, **kwargs) -> ToolExecutionResult:
@@ -125,14 +446,23 @@ class BaseBusinessTool(ABC):
     
     async def test_connection(self) -> ToolExecutionResult:
         """Test connection to the business system."""
-        start_time = datetime.now()
+        if self._trivial_test and self.validate_credentials():
+            return ToolExecutionResult(
+                success=True,
+                data={"status": "connected"},
+                tool_name=self.tool_name,
+                metadata={"action": "test_connection"}
+            )
+        
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Testing connection..."
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Testing connection..."
+                ))
             
             if not self.validate_credentials():
                 raise ValueError("Invalid credentials")
@@ -140,13 +470,14 @@ class BaseBusinessTool(ABC):
             # Subclasses should override this for specific connection tests
             result = await self._test_connection_impl()
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message="Connection test successful"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Connection test successful"
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -157,14 +488,15 @@ class BaseBusinessTool(ABC):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Connection test failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message=f"Connection test failed: {error_msg}"
+                ))
             
             logger.error(f"Connection test failed for {self.tool_name}: {error_msg}")
             
@@ -191,25 +523,17 @@ def CrewAITool(business_tool: BaseBusinessTool):
     @tool(business_tool.tool_name)
     def execute_business_tool(**kwargs) -> str:
         """Execute business tool operation. This tool provides real-time data from integrated business systems and supports various operations including search, create, update, and data retrieval. Parameters: query (str): Input parameters for the tool operation. Returns: str: JSON formatted results from the business tool operation."""
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        
-        def run_async_in_thread():
-            """Run the async business tool in a separate thread with its own event loop."""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
+        async def execute_and_deliver_events():
             try:
-                return new_loop.run_until_complete(business_tool.execute(**kwargs))
+                return await business_tool.execute(**kwargs)
             finally:
-                new_loop.close()
+                await drain_events()
         
-        # Run the async function in a separate thread to avoid event loop conflicts
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async_in_thread)
-            result = future.result()
+        result = run_on_tool_loop(execute_and_deliver_events())
         
         if result.success:
-            return json.dumps(result.data, default=str)
+            # Tool output is serialized exactly once, here, at the agent boundary
+            return orjson.dumps(result.data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
         else:
             return f"Error: {result.error}"
     
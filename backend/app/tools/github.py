@@ -1,25 +1,186 @@
 """
 GitHub API integration tools.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from functools import cached_property
+from types import MappingProxyType
+from urllib.parse import quote_plus
+import asyncio
 import json
+import operator
+import time
 from datetime import datetime
+import httpx
+import orjson
 
 from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
 from app.tools.registry import register_tool
 
 
-@register_tool("github", {"category": ToolCategory.SEARCH, "priority": 1})
-class GitHubSearchTool(BaseBusinessTool):
-    """Search GitHub repositories, issues, and users."""
+# Conditional-request cache: (authorization, url, params) -> (etag, parsed body).
+# GitHub answers a matching If-None-Match with an empty 304 that does not
+# count against the rate limit, so repeat reads skip both transfer and parsing.
+_ETAG_CACHE: "OrderedDict[Tuple[str, str, Tuple], Tuple[str, Any]]" = OrderedDict()
+_ETAG_CACHE_MAX = 1024
+
+# Pause writes once fewer than this many requests remain in the rate-limit window
+_RATE_LIMIT_FLOOR = 10
+_MAX_RATE_LIMIT_SLEEP = 60.0
+
+# Headers sent with every GitHub API request
+_STATIC_HEADERS = MappingProxyType({
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "BusinessPlatform/1.0"
+})
+
+_name_get = operator.itemgetter("name")
+_full_name_get = operator.itemgetter("full_name")
+
+
+def _auth_headers(auth_value: str) -> Dict[str, str]:
+    """Request headers for the given Authorization value."""
+    return {**_STATIC_HEADERS, "Authorization": auth_value}
+
+
+async def _get_json_cached(
+    tool: BaseBusinessTool,
+    url: str,
+    headers: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None
+) -> Any:
+    """GET a GitHub resource, revalidating previously seen bodies by ETag."""
+    key = (headers.get("Authorization", ""), url, tuple(sorted(params.items())) if params else ())
+    cached = _ETAG_CACHE.get(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
     
-    @property
-    def tool_name(self) -> str:
-        return "github_search"
+    response = await tool._make_request("GET", url, headers=headers, params=params, allow_status=(304,))
+    if response.status_code == 304 and cached is not None:
+        _ETAG_CACHE.move_to_end(key)
+        return cached[1]
     
-    @property
-    def description(self) -> str:
-        return "Search GitHub repositories, issues, pull requests, or users. Supports GitHub's powerful search syntax."
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        _ETAG_CACHE[key] = (etag, data)
+        _ETAG_CACHE.move_to_end(key)
+        if len(_ETAG_CACHE) > _ETAG_CACHE_MAX:
+            _ETAG_CACHE.popitem(last=False)
+    return data
+
+
+async def _respect_rate_limit(response: httpx.Response) -> None:
+    """Sleep when GitHub asks us to (Retry-After) or the remaining budget runs low."""
+    headers = response.headers
+    delay = 0.0
+    
+    retry_after = headers.get("Retry-After")
+    remaining = headers.get("X-RateLimit-Remaining")
+    if retry_after:
+        delay = float(retry_after)
+    elif remaining is not None and int(remaining) < _RATE_LIMIT_FLOOR:
+        reset = headers.get("X-RateLimit-Reset")
+        delay = float(reset) - time.time() if reset else 1.0
+    
+    if delay > 0:
+        await asyncio.sleep(min(delay, _MAX_RATE_LIMIT_SLEEP))
+
+
+def _login(item: Dict[str, Any], key: str) -> Optional[str]:
+    """``item[key]["login"]``, or None when the nested object is absent."""
+    try:
+        return item[key]["login"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _project_repository(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": item.get("name"),
+        "full_name": item.get("full_name"),
+        "description": item.get("description"),
+        "url": item.get("html_url"),
+        "stars": item.get("stargazers_count", 0),
+        "forks": item.get("forks_count", 0),
+        "language": item.get("language"),
+        "created_at": item.get("created_at"),
+        "updated_at": item.get("updated_at"),
+        "owner": _login(item, "owner")
+    }
+
+
+def _project_issue(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": item.get("title"),
+        "number": item.get("number"),
+        "state": item.get("state"),
+        "url": item.get("html_url"),
+        "repository": (item.get("repository_url") or "").rpartition("/")[2] or None,
+        "user": _login(item, "user"),
+        "created_at": item.get("created_at"),
+        "updated_at": item.get("updated_at"),
+        "labels": list(map(_name_get, item.get("labels") or ()))
+    }
+
+
+def _project_user(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "login": item.get("login"),
+        "name": item.get("name"),
+        "url": item.get("html_url"),
+        "avatar_url": item.get("avatar_url"),
+        "type": item.get("type"),
+        "public_repos": item.get("public_repos"),
+        "followers": item.get("followers")
+    }
+
+
+def _project_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        details = commit["commit"]
+        author = details["author"]
+        message, name, date = details.get("message"), author.get("name"), author.get("date")
+    except (KeyError, TypeError, AttributeError):
+        details = commit.get("commit") or {}
+        message, name, date = details.get("message"), None, None
+    return {
+        "sha": commit.get("sha"),
+        "message": message,
+        "author": name,
+        "date": date,
+        "url": commit.get("html_url")
+    }
+
+
+_ITEM_DATE_FIELDS = ("created_at", "updated_at")
+_COMMIT_DATE_FIELDS = ("date",)
+
+
+def _parse_dates(item: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    """Replace GitHub ISO-8601 timestamps in ``item`` with datetimes, in place."""
+    for field in fields:
+        value = item.get(field)
+        if value:
+            item[field] = datetime.fromisoformat(value)
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+# Per search type projection of raw GitHub items
+_SEARCH_PROJECTIONS = {
+    "repositories": _project_repository,
+    "issues": _project_issue,
+    "users": _project_user
+}
+
+
+class _GitHubTool(BaseBusinessTool):
+    """Shared credential handling for the GitHub tools."""
+    
+    _credential_caches = ("_auth_value",)
     
     @property
     def required_credentials(self) -> List[str]:
@@ -43,21 +204,30 @@ class GitHubSearchTool(BaseBusinessTool):
             
         return token
     
+    @cached_property
+    def _auth_value(self) -> str:
+        """Authorization header value, built once per credentials."""
+        return f"token {self._get_access_token()}"
+
+
+@register_tool("github", {"category": ToolCategory.SEARCH, "priority": 1})
+class GitHubSearchTool(_GitHubTool):
+    """Search GitHub repositories, issues, and users."""
+    
+    @property
+    def tool_name(self) -> str:
+        return "github_search"
+    
+    @property
+    def description(self) -> str:
+        return "Search GitHub repositories, issues, pull requests, or users. Supports GitHub's powerful search syntax."
+    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test GitHub connection."""
-        token = self._get_access_token()
-        if not token:
-            raise ValueError("No access token found in credentials")
-            
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "BusinessPlatform/1.0"
-        }
+        headers = _auth_headers(self._auth_value)
         
         url = "https://api.github.com/user"
-        response = await self._make_request("GET", url, headers=headers)
-        user_info = response.json()
+        user_info = await _get_json_cached(self, url, headers)
         
         return {
             "user": user_info.get("login", "Unknown"),
@@ -71,92 +241,58 @@ class GitHubSearchTool(BaseBusinessTool):
         query: str,
         search_type: str = "repositories",
         per_page: int = 20,
+        parse_dates: bool = False,
         **kwargs
     ) -> ToolExecutionResult:
-        """Execute GitHub search."""
-        start_time = datetime.now()
+        """
+        Execute GitHub search.
+        
+        With ``parse_dates`` the ``created_at``/``updated_at`` fields are
+        returned as ``datetime`` objects instead of ISO-8601 strings.
+        """
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Searching GitHub {search_type}: {query}"
-            ))
-            
-            headers = {
-                "Authorization": f"token {self._get_access_token()}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "BusinessPlatform/1.0"
-            }
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message=f"Searching GitHub {search_type}: {query}"
+                ))
             
-            # Build search URL
-            url = f"https://api.github.com/search/{search_type}"
-            params = {
-                "q": query,
-                "per_page": per_page
-            }
+            headers = _auth_headers(self._auth_value)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Executing GitHub search..."
-            ))
+            # Build search URL; the query string is encoded once here rather than by httpx
+            url = f"https://api.github.com/search/{search_type}?q={quote_plus(query)}&per_page={per_page}"
             
-            response = await self._make_request("GET", url, headers=headers, params=params)
-            result_data = response.json()
-            
-            # Process results based on search type
-            items = result_data.get("items", [])
-            processed_items = []
-            
-            for item in items:
-                if search_type == "repositories":
-                    processed_item = {
-                        "name": item.get("name"),
-                        "full_name": item.get("full_name"),
-                        "description": item.get("description"),
-                        "url": item.get("html_url"),
-                        "stars": item.get("stargazers_count", 0),
-                        "forks": item.get("forks_count", 0),
-                        "language": item.get("language"),
-                        "created_at": item.get("created_at"),
-                        "updated_at": item.get("updated_at"),
-                        "owner": item.get("owner", {}).get("login")
-                    }
-                elif search_type == "issues":
-                    processed_item = {
-                        "title": item.get("title"),
-                        "number": item.get("number"),
-                        "state": item.get("state"),
-                        "url": item.get("html_url"),
-                        "repository": item.get("repository_url", "").split("/")[-1] if item.get("repository_url") else None,
-                        "user": item.get("user", {}).get("login"),
-                        "created_at": item.get("created_at"),
-                        "updated_at": item.get("updated_at"),
-                        "labels": [label.get("name") for label in item.get("labels", [])]
-                    }
-                elif search_type == "users":
-                    processed_item = {
-                        "login": item.get("login"),
-                        "name": item.get("name"),
-                        "url": item.get("html_url"),
-                        "avatar_url": item.get("avatar_url"),
-                        "type": item.get("type"),
-                        "public_repos": item.get("public_repos"),
-                        "followers": item.get("followers")
-                    }
-                else:
-                    processed_item = item
-                
-                processed_items.append(processed_item)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Executing GitHub search..."
+                ))
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(processed_items)} {search_type}"
-            ))
+            # Stream the items array so large pages are projected as they arrive
+            result_data: Dict[str, Any] = {}
+            project = _SEARCH_PROJECTIONS.get(search_type, _identity)
+            processed_items = [
+                project(item)
+                async for item in self._stream_json_items(
+                    "GET", url, "items.item", headers=headers, meta=result_data
+                )
+            ]
+            if parse_dates:
+                for item in processed_items:
+                    _parse_dates(item, _ITEM_DATE_FIELDS)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message=f"Found {len(processed_items)} {search_type}"
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -172,14 +308,15 @@ class GitHubSearchTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Search failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message=f"Search failed: {error_msg}"
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -191,7 +328,7 @@ class GitHubSearchTool(BaseBusinessTool):
 
 
 @register_tool("github", {"category": ToolCategory.CREATE, "priority": 2})
-class GitHubCreateIssueTool(BaseBusinessTool):
+class GitHubCreateIssueTool(_GitHubTool):
     """Create issues in GitHub repositories."""
     
     @property
@@ -202,35 +339,9 @@ class GitHubCreateIssueTool(BaseBusinessTool):
     def description(self) -> str:
         return "Create a new issue in a GitHub repository. Requires repository owner/name, title, and optionally body, labels, and assignees."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        # GitHub tools are flexible with token key names
-        return []  # We'll validate manually in _get_access_token()
-    
-    def _get_access_token(self) -> str:
-        """Get access token from credentials, supporting multiple key names."""
-        creds = self.credentials.credentials
-        
-        # Try common GitHub token key names
-        token = (creds.get("access_token") or 
-                creds.get("api_key") or 
-                creds.get("token") or 
-                creds.get("personal_access_token") or
-                creds.get("github_token") or "")
-                
-        if not token:
-            available_keys = list(creds.keys())
-            raise ValueError(f"No GitHub token found. Available credential keys: {available_keys}. Expected one of: access_token, api_key, token, personal_access_token, github_token")
-            
-        return token
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting user repositories."""
-        headers = {
-            "Authorization": f"token {self._get_access_token()}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "BusinessPlatform/1.0"
-        }
+        headers = _auth_headers(self._auth_value)
         
         url = "https://api.github.com/user/repos"
         params = {"per_page": 5}
@@ -239,7 +350,7 @@ class GitHubCreateIssueTool(BaseBusinessTool):
         repos = response.json()
         
         return {
-            "accessible_repos": [repo.get("full_name") for repo in repos],
+            "accessible_repos": list(map(_full_name_get, repos)),
             "total_repos": len(repos)
         }
     
@@ -253,52 +364,78 @@ class GitHubCreateIssueTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Create a GitHub issue."""
-        start_time = datetime.now()
+        results = await self.execute_many([{
+            "repository": repository,
+            "title": title,
+            "body": body,
+            "labels": labels,
+            "assignees": assignees
+        }])
+        return results[0]
+    
+    async def execute_many(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[ToolExecutionResult]:
+        """
+        Create several GitHub issues concurrently.
+        
+        Each item takes the same arguments as ``execute``. At most
+        ``max_concurrency`` requests are in flight to stay clear of GitHub's
+        secondary rate limits. Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return list(await asyncio.gather(
+            *(self._create_issue(semaphore, **item) for item in items)
+        ))
+    
+    async def _create_issue(
+        self,
+        semaphore: asyncio.Semaphore,
+        repository: Optional[str] = None,
+        title: Optional[str] = None,
+        body: str = "",
+        labels: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None,
+        **kwargs
+    ) -> ToolExecutionResult:
+        """Create a single issue, holding a slot of ``semaphore`` for the request."""
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Creating issue in {repository}"
-            ))
-            
-            headers = {
-                "Authorization": f"token {self._get_access_token()}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "BusinessPlatform/1.0"
-            }
+            # Batch items are unchecked input; report a bad one as its own
+            # failure rather than failing the whole gather
+            if not repository or not title:
+                raise ValueError("An issue needs both a repository and a title")
             
-            # Build issue data
-            issue_data = {
-                "title": title,
-                "body": body
-            }
-            
-            if labels:
-                issue_data["labels"] = labels
-            
-            if assignees:
-                issue_data["assignees"] = assignees
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message=f"Creating issue in {repository}"
+                ))
             
-            # Create issue
-            url = f"https://api.github.com/repos/{repository}/issues"
+            headers = _auth_headers(self._auth_value)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Submitting issue creation..."
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Submitting issue creation..."
+                ))
             
-            response = await self._make_request("POST", url, headers=headers, data=issue_data)
-            result_data = response.json()
+            async with semaphore:
+                result_data = await self._post_issue(headers, repository, title, body, labels, assignees)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Created issue #{result_data.get('number')}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message=f"Created issue #{result_data.get('number')}"
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -316,14 +453,15 @@ class GitHubCreateIssueTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Issue creation failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message=f"Issue creation failed: {error_msg}"
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -332,10 +470,42 @@ class GitHubCreateIssueTool(BaseBusinessTool):
                 execution_time=execution_time,
                 metadata={"action": "create", "repository": repository}
             )
+    
+    async def _post_issue(
+        self,
+        headers: Dict[str, str],
+        repository: str,
+        title: str,
+        body: str,
+        labels: Optional[List[str]],
+        assignees: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """POST one issue and back off if GitHub signals the rate limit is close."""
+        # Build issue data
+        issue_data = {
+            "title": title,
+            "body": body
+        }
+        
+        if labels:
+            issue_data["labels"] = labels
+        
+        if assignees:
+            issue_data["assignees"] = assignees
+        
+        url = f"https://api.github.com/repos/{repository}/issues"
+        response = await self._make_request(
+            "POST",
+            url,
+            headers={**headers, "Content-Type": "application/json"},
+            content=orjson.dumps(issue_data)
+        )
+        await _respect_rate_limit(response)
+        return response.json()
 
 
 @register_tool("github", {"category": ToolCategory.READ, "priority": 3})
-class GitHubGetRepositoryTool(BaseBusinessTool):
+class GitHubGetRepositoryTool(_GitHubTool):
     """Get detailed information about a GitHub repository."""
     
     @property
@@ -346,27 +516,7 @@ class GitHubGetRepositoryTool(BaseBusinessTool):
     def description(self) -> str:
         return "Get detailed information about a GitHub repository including statistics, languages, branches, and recent commits."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        # GitHub tools are flexible with token key names
-        return []  # We'll validate manually in _get_access_token()
-    
-    def _get_access_token(self) -> str:
-        """Get access token from credentials, supporting multiple key names."""
-        creds = self.credentials.credentials
-        
-        # Try common GitHub token key names
-        token = (creds.get("access_token") or 
-                creds.get("api_key") or 
-                creds.get("token") or 
-                creds.get("personal_access_token") or
-                creds.get("github_token") or "")
-                
-        if not token:
-            available_keys = list(creds.keys())
-            raise ValueError(f"No GitHub token found. Available credential keys: {available_keys}. Expected one of: access_token, api_key, token, personal_access_token, github_token")
-            
-        return token
+    _trivial_test = True
     
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
@@ -376,40 +526,42 @@ class GitHubGetRepositoryTool(BaseBusinessTool):
         self, 
         repository: str,
         include_commits: bool = True,
+        parse_dates: bool = False,
         **kwargs
     ) -> ToolExecutionResult:
-        """Get repository information."""
-        start_time = datetime.now()
+        """
+        Get repository information.
+        
+        With ``parse_dates`` the repository and commit timestamps are returned
+        as ``datetime`` objects instead of ISO-8601 strings.
+        """
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Getting repository info for {repository}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message=f"Getting repository info for {repository}"
+                ))
             
-            headers = {
-                "Authorization": f"token {self._get_access_token()}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "BusinessPlatform/1.0"
-            }
+            headers = _auth_headers(self._auth_value)
             
             # Get repository info
             repo_url = f"https://api.github.com/repos/{repository}"
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Fetching repository details..."
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Fetching repository details..."
+                ))
             
-            repo_response = await self._make_request("GET", repo_url, headers=headers)
-            repo_data = repo_response.json()
+            repo_data = await _get_json_cached(self, repo_url, headers)
             
             # Get languages
             languages_url = f"https://api.github.com/repos/{repository}/languages"
-            languages_response = await self._make_request("GET", languages_url, headers=headers)
-            languages_data = languages_response.json()
+            languages_data = await _get_json_cached(self, languages_url, headers)
             
             result = {
                 "name": repo_data.get("name"),
@@ -426,45 +578,43 @@ class GitHubGetRepositoryTool(BaseBusinessTool):
                 "default_branch": repo_data.get("default_branch"),
                 "created_at": repo_data.get("created_at"),
                 "updated_at": repo_data.get("updated_at"),
-                "owner": repo_data.get("owner", {}).get("login"),
+                "owner": _login(repo_data, "owner"),
                 "is_private": repo_data.get("private", False),
                 "is_fork": repo_data.get("fork", False)
             }
             
             # Get recent commits if requested
             if include_commits:
+                if self._events_enabled:
+                    await self.emit_event(ToolExecutionEvent(
+                        type="progress",
+                        tool_name=self.tool_name,
+                        message="Fetching recent commits..."
+                    ))
+                
+                commits_url = f"https://api.github.com/repos/{repository}/commits?per_page=10"
+                
+                result["recent_commits"] = [
+                    _project_commit(commit)
+                    async for commit in self._stream_json_items(
+                        "GET", commits_url, "item", headers=headers
+                    )
+                ]
+                if parse_dates:
+                    for commit in result["recent_commits"]:
+                        _parse_dates(commit, _COMMIT_DATE_FIELDS)
+            
+            if parse_dates:
+                _parse_dates(result, _ITEM_DATE_FIELDS)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
                 await self.emit_event(ToolExecutionEvent(
-                    type="progress",
+                    type="complete",
                     tool_name=self.tool_name,
-                    message="Fetching recent commits..."
+                    message="Retrieved repository information"
                 ))
-                
-                commits_url = f"https://api.github.com/repos/{repository}/commits"
-                commits_params = {"per_page": 10}
-                
-                commits_response = await self._make_request("GET", commits_url, headers=headers, params=commits_params)
-                commits_data = commits_response.json()
-                
-                recent_commits = []
-                for commit in commits_data:
-                    commit_info = {
-                        "sha": commit.get("sha"),
-                        "message": commit.get("commit", {}).get("message"),
-                        "author": commit.get("commit", {}).get("author", {}).get("name"),
-                        "date": commit.get("commit", {}).get("author", {}).get("date"),
-                        "url": commit.get("html_url")
-                    }
-                    recent_commits.append(commit_info)
-                
-                result["recent_commits"] = recent_commits
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message="Retrieved repository information"
-            ))
             
             return ToolExecutionResult(
                 success=True,
@@ -475,14 +625,15 @@ class GitHubGetRepositoryTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Failed to get repository info: {error_msg}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message=f"Failed to get repository info: {error_msg}"
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -494,7 +645,7 @@ class GitHubGetRepositoryTool(BaseBusinessTool):
 
 
 @register_tool("github", {"category": ToolCategory.READ, "priority": 1})
-class GitHubListRepositoriesTool(BaseBusinessTool):
+class GitHubListRepositoriesTool(_GitHubTool):
     """List all repositories for the authenticated user."""
     
     @property
@@ -505,35 +656,9 @@ class GitHubListRepositoriesTool(BaseBusinessTool):
     def description(self) -> str:
         return "Get a list of all repositories (public and private) for the authenticated user."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        # GitHub tools are flexible with token key names
-        return []  # We'll validate manually in _get_access_token()
-    
-    def _get_access_token(self) -> str:
-        """Get access token from credentials, supporting multiple key names."""
-        creds = self.credentials.credentials
-        
-        # Try common GitHub token key names
-        token = (creds.get("access_token") or 
-                creds.get("api_key") or 
-                creds.get("token") or 
-                creds.get("personal_access_token") or
-                creds.get("github_token") or "")
-                
-        if not token:
-            available_keys = list(creds.keys())
-            raise ValueError(f"No GitHub token found. Available credential keys: {available_keys}. Expected one of: access_token, api_key, token, personal_access_token, github_token")
-            
-        return token
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting user repositories."""
-        headers = {
-            "Authorization": f"token {self._get_access_token()}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "BusinessPlatform/1.0"
-        }
+        headers = _auth_headers(self._auth_value)
         
         url = "https://api.github.com/user/repos"
         params = {"per_page": 5}
@@ -542,35 +667,33 @@ class GitHubListRepositoriesTool(BaseBusinessTool):
         repos = response.json()
         
         return {
-            "accessible_repos": [repo.get("full_name") for repo in repos],
+            "accessible_repos": list(map(_full_name_get, repos)),
             "total_repos": len(repos)
         }
     
     async def execute(self, **kwargs) -> ToolExecutionResult:
         """List all user repositories."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Fetching all user repositories..."
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Fetching all user repositories..."
+                ))
             
-            headers = {
-                "Authorization": f"token {self._get_access_token()}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "BusinessPlatform/1.0"
-            }
+            headers = _auth_headers(self._auth_value)
             
             url = "https://api.github.com/user/repos"
             params = {"per_page": 100, "sort": "updated"}
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Retrieving repository list..."
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Retrieving repository list..."
+                ))
             
             response = await self._make_request("GET", url, headers=headers, params=params)
             repos = response.json()
@@ -591,13 +714,14 @@ class GitHubListRepositoriesTool(BaseBusinessTool):
                     "size": repo.get("size", 0)
                 })
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Retrieved {len(processed_repos)} repositories"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message=f"Retrieved {len(processed_repos)} repositories"
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -608,14 +732,15 @@ class GitHubListRepositoriesTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Failed to list repositories: {error_msg}"
-            ))
+            if self._events_enabled:
+                await self.emit_event(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message=f"Failed to list repositories: {error_msg}"
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -1,16 +1,317 @@
 """
 HubSpot API integration tools.
+
+These tools run on uvloop (both under uvicorn and on the CrewAITool
+background loop) and must stay purely await-driven: no blocking I/O or
+selector-specific loop APIs.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple, AsyncIterator
+import asyncio
+import hashlib
 import json
-from datetime import datetime
+import time
+import weakref
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+
+import orjson
 
-from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
+from app.services.cache_service import cache_service, CacheNamespaces
+from app.services.redis_service import redis_service
+from app.tools.base import AsyncTokenBucket, BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
 from app.tools.registry import register_tool
 
+_HUBSPOT_API = "https://api.hubapi.com"
+_ACCOUNT_INFO_URL = f"{_HUBSPOT_API}/account-info/v3/details"
+_CONTACTS_URL = f"{_HUBSPOT_API}/crm/v3/objects/contacts"
+_CONTACT_SEARCH_URL = f"{_CONTACTS_URL}/search"
+_CONTACT_BATCH_CREATE_URL = f"{_CONTACTS_URL}/batch/create"
+_CONTACT_PROPERTIES_URL = f"{_HUBSPOT_API}/crm/v3/properties/contacts"
+_DEAL_SEARCH_URL = f"{_HUBSPOT_API}/crm/v3/objects/deals/search"
+
+# Search results go stale quickly; single-contact lookups change less often.
+_SEARCH_CACHE_TTL = timedelta(seconds=10)
+_LOOKUP_CACHE_TTL = timedelta(seconds=30)
+# Stale entries are kept this much longer to serve as a fallback on errors
+_STALE_GRACE = timedelta(minutes=10)
+
+# HubSpot allows 100 requests per 10 seconds for private apps; stay inside
+# that budget and cap parallel requests so bursts don't turn into 429 retries
+_MAX_CONCURRENT_REQUESTS = 10
+_RATE_LIMIT = (100, 10.0)
+# The limit applies per account, so buckets are keyed by the token digest
+_RATE_LIMITS: Dict[str, AsyncTokenBucket] = {}
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Calls currently in progress, per event loop, keyed by cache key and
+# whether a stale fallback was asked for
+_INFLIGHT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, bool], asyncio.Task]]" = weakref.WeakKeyDictionary()
+
+
+def _cache_key(tool: "_HubSpotTool", **inputs) -> str:
+    """Stable cache key for a tool call, scoped to the HubSpot account token."""
+    payload = orjson.dumps(
+        [tool.tool_name, tool._token_digest, inputs],
+        option=orjson.OPT_SORT_KEYS
+    )
+    return f"hubspot:{hashlib.sha256(payload).hexdigest()}"
+
+
+async def _coalesced(
+    key: Tuple[str, bool],
+    fetch: Callable[[], Awaitable[ToolExecutionResult]]
+) -> ToolExecutionResult:
+    """
+    Run ``fetch()`` once for all concurrent callers using the same ``key``.
+    
+    The shared task is shielded so a cancelled caller does not cancel it for
+    the others.
+    """
+    inflight = _INFLIGHT.setdefault(asyncio.get_running_loop(), {})
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _cached_result(
+    tool: BaseBusinessTool,
+    key: str,
+    ttl: timedelta,
+    cache_fallback: bool,
+    fetch: Callable[[], Awaitable[ToolExecutionResult]]
+) -> ToolExecutionResult:
+    """
+    Serve ``fetch()`` through the Redis cache.
+    
+    Entries record when they go stale; fresh ones are returned directly,
+    stale ones only when the live call fails and ``cache_fallback`` is set.
+    Caching is skipped on event loops other than the one Redis is bound to.
+    """
+    use_cache = redis_service.is_usable_in_running_loop()
+    entry = await cache_service.get(CacheNamespaces.INTEGRATION_DATA, key) if use_cache else None
+    if not isinstance(entry, dict):
+        entry = None
+    
+    now = time.time()
+    if entry and entry["stale_at"] > now:
+        return ToolExecutionResult(
+            success=True,
+            data=entry["data"],
+            tool_name=tool.tool_name,
+            metadata={**entry["metadata"], "cached": True}
+        )
+    
+    result = await fetch()
+    
+    if result.success:
+        if use_cache:
+            await cache_service.set(
+                CacheNamespaces.INTEGRATION_DATA,
+                key,
+                {
+                    "stored_at": now,
+                    "stale_at": now + ttl.total_seconds(),
+                    "data": result.data,
+                    "metadata": result.metadata
+                },
+                ttl + _STALE_GRACE
+            )
+    elif cache_fallback and entry:
+        return ToolExecutionResult(
+            success=True,
+            data=entry["data"],
+            tool_name=tool.tool_name,
+            metadata={**entry["metadata"], "cached": True, "stale": True, "error": result.error}
+        )
+    
+    return result
+
+
+_DEFAULT_CONTACT_PROPERTIES: Tuple[str, ...] = (
+    "firstname", "lastname", "email", "phone", "company",
+    "jobtitle", "country", "city", "createdate", "lastmodifieddate"
+)
+
+# Search filter shapes; only the value is filled in per request
+_CONTACT_FILTER_TEMPLATES = tuple(
+    MappingProxyType({"propertyName": prop, "operator": "CONTAINS_TOKEN"})
+    for prop in ("firstname", "lastname", "email", "company")
+)
+_DEAL_NAME_FILTER = MappingProxyType({"propertyName": "dealname", "operator": "CONTAINS_TOKEN"})
+_DEAL_STAGE_FILTER = MappingProxyType({"propertyName": "dealstage", "operator": "EQ"})
+
+# Search pages with more results than this are parsed incrementally
+_STREAM_THRESHOLD = 20
+
+# Page size used when collecting several search pages
+_SEARCH_PAGE_SIZE = 100
+
+# Maximum inputs accepted by HubSpot batch endpoints
+_BATCH_SIZE = 100
+
+_DEFAULT_DEAL_PROPERTIES: Tuple[str, ...] = (
+    "dealname", "amount", "dealstage", "closedate",
+    "pipeline", "dealtype", "createdate", "hs_lastmodifieddate"
+)
+
+
+@lru_cache(maxsize=64)
+def _join_props(properties: Tuple[str, ...]) -> str:
+    """Comma-joined property list for query strings, memoized per tuple."""
+    return ",".join(properties)
+
+
+def _project_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": record.get("id"),
+        "properties": record.get("properties", {}),
+        "created_at": record.get("createdAt"),
+        "updated_at": record.get("updatedAt")
+    }
+
+
+async def _search_records(
+    tool: "_HubSpotTool",
+    url: str,
+    search_request: Dict[str, Any],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """
+    POST a CRM search and project its results.
+    
+    Pages larger than ``_STREAM_THRESHOLD`` are parsed incrementally so
+    records are projected as they arrive; small ones are cheaper to decode
+    in one go.
+    """
+    body = orjson.dumps(search_request)
+    if limit > _STREAM_THRESHOLD:
+        return [
+            _project_record(record)
+            async for record in tool._stream_json_items(
+                "POST", url, "results.item", headers=tool._headers, content=body
+            )
+        ]
+    
+    response = await tool._make_request("POST", url, headers=tool._headers, content=body)
+    return [_project_record(record) for record in orjson.loads(response.content).get("results") or ()]
+
+
+async def _search_all(
+    tool: "_HubSpotTool",
+    url: str,
+    search_request: Dict[str, Any],
+    max_total: int
+) -> List[Dict[str, Any]]:
+    """
+    Collect up to ``max_total`` search results across pages.
+    
+    After the first page confirms more results exist, the remaining pages
+    are requested concurrently by ``after`` offset.
+    """
+    def page(index: int) -> Awaitable[List[Dict[str, Any]]]:
+        request = {**search_request, "limit": _SEARCH_PAGE_SIZE, "after": index * _SEARCH_PAGE_SIZE}
+        return _search_records(tool, url, request, _SEARCH_PAGE_SIZE)
+    
+    records = await page(0)
+    if len(records) < _SEARCH_PAGE_SIZE:
+        return records[:max_total]
+    
+    page_count = -(-max_total // _SEARCH_PAGE_SIZE)
+    for results in await asyncio.gather(*(page(index) for index in range(1, page_count))):
+        records.extend(results)
+        if len(results) < _SEARCH_PAGE_SIZE:
+            break
+    return records[:max_total]
+
+
+def _contact_properties(
+    email: str,
+    firstname: Optional[str] = None,
+    lastname: Optional[str] = None,
+    company: Optional[str] = None,
+    phone: Optional[str] = None,
+    jobtitle: Optional[str] = None,
+    website: Optional[str] = None,
+    **kwargs
+) -> Dict[str, str]:
+    """Build the HubSpot property map for a new contact."""
+    properties = {"email": email}
+    
+    if firstname:
+        properties["firstname"] = firstname
+    if lastname:
+        properties["lastname"] = lastname
+    if company:
+        properties["company"] = company
+    if phone:
+        properties["phone"] = phone
+    if jobtitle:
+        properties["jobtitle"] = jobtitle
+    if website:
+        properties["website"] = website
+    
+    # Add any additional properties from kwargs
+    for key, value in kwargs.items():
+        if key not in properties and value is not None:
+            properties[key] = str(value)
+    
+    return properties
+
+
+class _HubSpotTool(BaseBusinessTool):
+    """Shared credential handling for the HubSpot tools."""
+    
+    _credential_caches = ("_auth_header", "_headers", "_token_digest")
+    
+    @property
+    def required_credentials(self) -> List[str]:
+        return ["access_token"]
+    
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Bound concurrent HubSpot requests and respect the account rate limit."""
+        loop = asyncio.get_running_loop()
+        semaphore = _SEMAPHORES.get(loop)
+        if semaphore is None:
+            semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        async with semaphore:
+            await self._rate_limit.acquire()
+            yield
+    
+    @property
+    def _rate_limit(self) -> AsyncTokenBucket:
+        """This account's request bucket, shared by every tool using the token."""
+        bucket = _RATE_LIMITS.get(self._token_digest)
+        if bucket is None:
+            bucket = _RATE_LIMITS.setdefault(self._token_digest, AsyncTokenBucket(*_RATE_LIMIT))
+        return bucket
+    
+    @cached_property
+    def _auth_header(self) -> str:
+        return f"Bearer {self.credentials.credentials['access_token']}"
+    
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, built once per credentials. Do not mutate."""
+        return {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json"
+        }
+    
+    @cached_property
+    def _token_digest(self) -> str:
+        """Digest identifying the HubSpot account in cache and rate limit keys."""
+        token = self.credentials.credentials.get("access_token", "")
+        return hashlib.sha256(token.encode()).hexdigest()
+
 
 @register_tool("hubspot", {"category": ToolCategory.SEARCH, "priority": 1})
-class HubSpotSearchContactsTool(BaseBusinessTool):
+class HubSpotSearchContactsTool(_HubSpotTool):
     """Search and retrieve HubSpot contacts."""
     
     @property
@@ -21,22 +322,15 @@ class HubSpotSearchContactsTool(BaseBusinessTool):
     def description(self) -> str:
         return "Search HubSpot contacts by name, email, company, or other properties. Returns contact details including email, phone, company, and custom properties."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["access_token"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test HubSpot connection."""
-        headers = {
-            "Authorization": f"Bearer {self.credentials.credentials['access_token']}",
-            "Content-Type": "application/json"
-        }
+        headers = self._headers
         
         # Test with account info endpoint
-        url = "https://api.hubapi.com/account-info/v3/details"
+        url = _ACCOUNT_INFO_URL
         
         response = await self._make_request("GET", url, headers=headers)
-        account_info = response.json()
+        account_info = orjson.loads(response.content)
         
         return {
             "portal_id": account_info.get("portalId"),
@@ -51,71 +345,86 @@ class HubSpotSearchContactsTool(BaseBusinessTool):
         email: Optional[str] = None,
         limit: int = 20,
         properties: Optional[List[str]] = None,
+        cache_fallback: bool = True,
+        fetch_all: bool = False,
+        max_total: int = 500,
         **kwargs
     ) -> ToolExecutionResult:
-        """Search HubSpot contacts."""
-        start_time = datetime.now()
+        """
+        Search HubSpot contacts.
+        
+        Results are cached in Redis for a few seconds; with ``cache_fallback``
+        a stale cached result is returned if HubSpot fails. Identical
+        concurrent calls share a single request. With ``fetch_all`` up to
+        ``max_total`` results are collected, fetching pages concurrently;
+        it does not apply to email lookups.
+        """
+        total = max_total if fetch_all else None
+        key = _cache_key(self, query=query, email=email, limit=limit, properties=properties, total=total)
+        ttl = _LOOKUP_CACHE_TTL if email else _SEARCH_CACHE_TTL
+        return await _coalesced((key, cache_fallback), lambda: _cached_result(
+            self, key, ttl, cache_fallback,
+            lambda: self._search(query, email, limit, properties, total)
+        ))
+    
+    async def _search(
+        self,
+        query: str,
+        email: Optional[str],
+        limit: int,
+        properties: Optional[List[str]],
+        total: Optional[int] = None
+    ) -> ToolExecutionResult:
+        """Search HubSpot contacts without caching."""
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Searching HubSpot contacts"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Searching HubSpot contacts"
+                ))
             
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['access_token']}",
-                "Content-Type": "application/json"
-            }
+            headers = self._headers
             
             # Default properties to retrieve
-            if not properties:
-                properties = [
-                    "firstname", "lastname", "email", "phone", "company", 
-                    "jobtitle", "country", "city", "createdate", "lastmodifieddate"
-                ]
+            properties = tuple(properties) if properties else _DEFAULT_CONTACT_PROPERTIES
             
             # If searching by email, use specific endpoint
             if email:
-                url = f"https://api.hubapi.com/crm/v3/objects/contacts/{email}"
+                url = f"{_CONTACTS_URL}/{email}"
                 params = {
                     "idProperty": "email",
-                    "properties": ",".join(properties)
+                    "properties": _join_props(properties)
                 }
                 
-                await self.emit_event(ToolExecutionEvent(
-                    type="progress",
-                    tool_name=self.tool_name,
-                    message=f"Searching for contact by email: {email}"
-                ))
-                
-                response = await self._make_request("GET", url, headers=headers, params=params)
-                contact_data = response.json()
+                if self._events_enabled:
+                    self.emit_event_nowait(ToolExecutionEvent(
+                        type="progress",
+                        tool_name=self.tool_name,
+                        message="Searching for contact by email: {}",
+                        args=(email,)
+                    ))
                 
-                contacts = [{
-                    "id": contact_data.get("id"),
-                    "properties": contact_data.get("properties", {}),
-                    "created_at": contact_data.get("createdAt"),
-                    "updated_at": contact_data.get("updatedAt")
-                }]
+                response = await self._make_request(
+                    "GET", url, headers=headers, params=params, allow_status=(404,)
+                )
+                # An unknown email is an empty result, not an error
+                if response.status_code == 404:
+                    contacts = []
+                else:
+                    contacts = [_project_record(orjson.loads(response.content))]
                 
             else:
                 # Use search endpoint
-                url = "https://api.hubapi.com/crm/v3/objects/contacts/search"
+                url = _CONTACT_SEARCH_URL
                 
                 # Build search filters
                 filter_groups = []
                 if query:
                     # Search in multiple fields
-                    filters = []
-                    search_properties = ["firstname", "lastname", "email", "company"]
-                    for prop in search_properties:
-                        filters.append({
-                            "propertyName": prop,
-                            "operator": "CONTAINS_TOKEN",
-                            "value": query
-                        })
-                    
+                    filters = [{**template, "value": query} for template in _CONTACT_FILTER_TEMPLATES]
                     filter_groups.append({"filters": filters})
                 
                 search_request = {
@@ -125,31 +434,27 @@ class HubSpotSearchContactsTool(BaseBusinessTool):
                     "after": 0
                 }
                 
-                await self.emit_event(ToolExecutionEvent(
-                    type="progress",
+                if self._events_enabled:
+                    self.emit_event_nowait(ToolExecutionEvent(
+                        type="progress",
+                        tool_name=self.tool_name,
+                        message="Executing contact search..."
+                    ))
+                
+                contacts = await (
+                    _search_all(self, url, search_request, total) if total
+                    else _search_records(self, url, search_request, limit)
+                )
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
                     tool_name=self.tool_name,
-                    message="Executing contact search..."
+                    message="Found {} contacts",
+                    args=(len(contacts),)
                 ))
-                
-                response = await self._make_request("POST", url, headers=headers, data=search_request)
-                result_data = response.json()
-                
-                contacts = []
-                for contact in result_data.get("results", []):
-                    contacts.append({
-                        "id": contact.get("id"),
-                        "properties": contact.get("properties", {}),
-                        "created_at": contact.get("createdAt"),
-                        "updated_at": contact.get("updatedAt")
-                    })
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(contacts)} contacts"
-            ))
             
             return ToolExecutionResult(
                 success=True,
@@ -165,14 +470,16 @@ class HubSpotSearchContactsTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Contact search failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Contact search failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -184,7 +491,7 @@ class HubSpotSearchContactsTool(BaseBusinessTool):
 
 
 @register_tool("hubspot", {"category": ToolCategory.CREATE, "priority": 2})
-class HubSpotCreateContactTool(BaseBusinessTool):
+class HubSpotCreateContactTool(_HubSpotTool):
     """Create new HubSpot contacts."""
     
     @property
@@ -195,21 +502,14 @@ class HubSpotCreateContactTool(BaseBusinessTool):
     def description(self) -> str:
         return "Create a new HubSpot contact. Requires email and optionally firstname, lastname, company, phone, and other properties."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["access_token"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting contact properties."""
-        headers = {
-            "Authorization": f"Bearer {self.credentials.credentials['access_token']}",
-            "Content-Type": "application/json"
-        }
+        headers = self._headers
         
-        url = "https://api.hubapi.com/crm/v3/properties/contacts"
+        url = _CONTACT_PROPERTIES_URL
         
         response = await self._make_request("GET", url, headers=headers)
-        properties = response.json()
+        properties = orjson.loads(response.content)
         
         return {
             "available_properties": len(properties.get("results", [])),
@@ -228,61 +528,44 @@ class HubSpotCreateContactTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Create a new HubSpot contact."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Creating HubSpot contact: {email}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Creating HubSpot contact: {}",
+                    args=(email,)
+                ))
             
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['access_token']}",
-                "Content-Type": "application/json"
-            }
+            headers = self._headers
             
-            # Build contact properties
-            properties = {"email": email}
-            
-            if firstname:
-                properties["firstname"] = firstname
-            if lastname:
-                properties["lastname"] = lastname
-            if company:
-                properties["company"] = company
-            if phone:
-                properties["phone"] = phone
-            if jobtitle:
-                properties["jobtitle"] = jobtitle
-            if website:
-                properties["website"] = website
-            
-            # Add any additional properties from kwargs
-            for key, value in kwargs.items():
-                if key not in properties and value is not None:
-                    properties[key] = str(value)
-            
-            contact_data = {"properties": properties}
-            
-            url = "https://api.hubapi.com/crm/v3/objects/contacts"
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Submitting contact creation..."
-            ))
+            contact_data = {"properties": _contact_properties(
+                email, firstname, lastname, company, phone, jobtitle, website, **kwargs
+            )}
             
-            response = await self._make_request("POST", url, headers=headers, data=contact_data)
-            result_data = response.json()
+            url = _CONTACTS_URL
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Submitting contact creation..."
+                ))
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Created contact with ID: {result_data.get('id')}"
-            ))
+            response = await self._make_request("POST", url, headers=headers, content=orjson.dumps(contact_data))
+            result_data = orjson.loads(response.content)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Created contact with ID: {}",
+                    args=(result_data.get("id"),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -298,14 +581,16 @@ class HubSpotCreateContactTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Contact creation failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Contact creation failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -314,10 +599,111 @@ class HubSpotCreateContactTool(BaseBusinessTool):
                 execution_time=execution_time,
                 metadata={"action": "create", "email": email}
             )
+    
+    async def execute_batch(self, contacts: List[Dict[str, Any]]) -> ToolExecutionResult:
+        """
+        Create many contacts through HubSpot's batch create endpoint.
+        
+        Each item takes the same arguments as ``execute``. Contacts are sent
+        in chunks of up to 100, concurrently. HubSpot rejects a whole chunk if
+        any contact in it is invalid; such chunks are reported under
+        ``failed`` while the other chunks still go through.
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Creating {} HubSpot contacts",
+                    args=(len(contacts),)
+                ))
+            
+            # Items HubSpot would reject anyway are reported by position and
+            # kept out of the chunks, so they cannot sink a valid batch
+            failed: List[Dict[str, Any]] = []
+            inputs = []
+            for index, contact in enumerate(contacts):
+                if not isinstance(contact, dict) or not contact.get("email"):
+                    failed.append({"index": index, "error": "A contact needs an email"})
+                else:
+                    inputs.append({"properties": _contact_properties(**contact)})
+            
+            chunks = [inputs[i:i + _BATCH_SIZE] for i in range(0, len(inputs), _BATCH_SIZE)]
+            outcomes = await asyncio.gather(
+                *(self._create_chunk(chunk) for chunk in chunks),
+                return_exceptions=True
+            )
+            
+            created = [
+                contact
+                for outcome in outcomes if not isinstance(outcome, Exception)
+                for contact in outcome
+            ]
+            failed.extend(
+                {"emails": [item["properties"]["email"] for item in chunk], "error": str(outcome)}
+                for chunk, outcome in zip(chunks, outcomes) if isinstance(outcome, Exception)
+            )
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete" if not failed else "error",
+                    tool_name=self.tool_name,
+                    message="Created {} of {} contacts",
+                    args=(len(created), len(contacts))
+                ))
+            
+            return ToolExecutionResult(
+                success=not failed,
+                data={"contacts": created, "created": len(created), "failed": failed},
+                error=failed[0]["error"] if failed else None,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "batch_create", "count": len(contacts)}
+            )
+            
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
+            error_msg = str(e)
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Batch contact creation failed: {}",
+                    args=(error_msg,)
+                ))
+            
+            return ToolExecutionResult(
+                success=False,
+                error=error_msg,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "batch_create", "count": len(contacts)}
+            )
+    
+    async def _create_chunk(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create one batch of at most 100 contacts."""
+        url = _CONTACT_BATCH_CREATE_URL
+        response = await self._make_request("POST", url, headers=self._headers, content=orjson.dumps({"inputs": inputs}))
+        # HubSpot does not guarantee results come back in input order
+        return [
+            {
+                "contact_id": result.get("id"),
+                "email": result.get("properties", {}).get("email"),
+                "properties": result.get("properties", {}),
+                "created_at": result.get("createdAt"),
+                "updated_at": result.get("updatedAt")
+            }
+            for result in orjson.loads(response.content).get("results") or ()
+        ]
 
 
 @register_tool("hubspot", {"category": ToolCategory.SEARCH, "priority": 3})
-class HubSpotSearchDealsTool(BaseBusinessTool):
+class HubSpotSearchDealsTool(_HubSpotTool):
     """Search and retrieve HubSpot deals."""
     
     @property
@@ -328,9 +714,7 @@ class HubSpotSearchDealsTool(BaseBusinessTool):
     def description(self) -> str:
         return "Search HubSpot deals by name, stage, amount, or other properties. Returns deal details including amount, stage, close date, and associated contacts."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["access_token"]
+    _trivial_test = True
     
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
@@ -342,49 +726,62 @@ class HubSpotSearchDealsTool(BaseBusinessTool):
         deal_stage: Optional[str] = None,
         limit: int = 20,
         properties: Optional[List[str]] = None,
+        cache_fallback: bool = True,
+        fetch_all: bool = False,
+        max_total: int = 500,
         **kwargs
     ) -> ToolExecutionResult:
-        """Search HubSpot deals."""
-        start_time = datetime.now()
+        """
+        Search HubSpot deals.
+        
+        Results are cached in Redis for a few seconds; with ``cache_fallback``
+        a stale cached result is returned if HubSpot fails. Identical
+        concurrent calls share a single request. With ``fetch_all`` up to
+        ``max_total`` results are collected, fetching pages concurrently.
+        """
+        total = max_total if fetch_all else None
+        key = _cache_key(self, query=query, deal_stage=deal_stage, limit=limit, properties=properties, total=total)
+        return await _coalesced((key, cache_fallback), lambda: _cached_result(
+            self, key, _SEARCH_CACHE_TTL, cache_fallback,
+            lambda: self._search(query, deal_stage, limit, properties, total)
+        ))
+    
+    async def _search(
+        self,
+        query: str,
+        deal_stage: Optional[str],
+        limit: int,
+        properties: Optional[List[str]],
+        total: Optional[int] = None
+    ) -> ToolExecutionResult:
+        """Search HubSpot deals without caching."""
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Searching HubSpot deals"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Searching HubSpot deals"
+                ))
             
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['access_token']}",
-                "Content-Type": "application/json"
-            }
+            headers = self._headers
             
             # Default properties to retrieve
             if not properties:
-                properties = [
-                    "dealname", "amount", "dealstage", "closedate", 
-                    "pipeline", "dealtype", "createdate", "hs_lastmodifieddate"
-                ]
+                properties = _DEFAULT_DEAL_PROPERTIES
             
-            url = "https://api.hubapi.com/crm/v3/objects/deals/search"
+            url = _DEAL_SEARCH_URL
             
             # Build search filters
             filter_groups = []
             filters = []
             
             if query:
-                filters.append({
-                    "propertyName": "dealname",
-                    "operator": "CONTAINS_TOKEN",
-                    "value": query
-                })
+                filters.append({**_DEAL_NAME_FILTER, "value": query})
             
             if deal_stage:
-                filters.append({
-                    "propertyName": "dealstage",
-                    "operator": "EQ",
-                    "value": deal_stage
-                })
+                filters.append({**_DEAL_STAGE_FILTER, "value": deal_stage})
             
             if filters:
                 filter_groups.append({"filters": filters})
@@ -396,32 +793,27 @@ class HubSpotSearchDealsTool(BaseBusinessTool):
                 "after": 0
             }
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Executing deal search..."
-            ))
-            
-            response = await self._make_request("POST", url, headers=headers, data=search_request)
-            result_data = response.json()
-            
-            deals = []
-            for deal in result_data.get("results", []):
-                deal_info = {
-                    "id": deal.get("id"),
-                    "properties": deal.get("properties", {}),
-                    "created_at": deal.get("createdAt"),
-                    "updated_at": deal.get("updatedAt")
-                }
-                deals.append(deal_info)
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Executing deal search..."
+                ))
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            deals = await (
+                _search_all(self, url, search_request, total) if total
+                else _search_records(self, url, search_request, limit)
+            )
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(deals)} deals"
-            ))
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Found {} deals",
+                    args=(len(deals),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -438,14 +830,16 @@ class HubSpotSearchDealsTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Deal search failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Deal search failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -1,16 +1,136 @@
 """
 Jira API integration tools.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import base64
 import json
-from datetime import datetime
+import time
+from functools import cached_property, lru_cache
 
-from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
+import orjson
+
+from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory, TTLCache
 from app.tools.registry import register_tool
 
+# Jira caps /search at 100 issues per page; larger searches fetch the
+# remaining pages concurrently, a bounded number at a time
+_SEARCH_PAGE_SIZE = 100
+_MAX_CONCURRENT_PAGES = 10
+
+# Issue fields JiraSearchTool projects into its results
+_SEARCH_FIELDS = (
+    "key", "summary", "status", "assignee", "reporter",
+    "priority", "created", "updated", "issuetype"
+)
+
+# Jira's bulk edit and bulk transition endpoints accept up to 1000 issues;
+# updates to a handful of issues go through the single-issue path instead
+_BULK_MAX_ISSUES = 1000
+_BULK_THRESHOLD = 3
+
+# Status name -> transition id per (site, project, issue type), so repeat
+# status updates can skip the transitions lookup. Transition ids belong to a
+# workflow and each issue type may have its own, so the type is part of the key
+_TRANSITION_IDS = TTLCache(maxsize=256, ttl=600)
+
+# Lower-cased priority name -> priority id per site, for bulk edits
+_PRIORITY_IDS = TTLCache(maxsize=64, ttl=600)
+
+
+def _nested(fields: Dict[str, Any], key: str, attr: str) -> Any:
+    """``fields[key][attr]``, or None when the field is absent or null."""
+    try:
+        return fields[key][attr]
+    except (KeyError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _adf_paragraph(text: str) -> Dict[str, Any]:
+    """
+    Wrap plain text as a single-paragraph Atlassian Document Format document.
+    
+    The result is shared between calls with the same text; do not mutate it.
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}]
+            }
+        ]
+    }
+
+
+class _JiraTool(BaseBusinessTool):
+    """Shared credential handling for the Jira tools."""
+    
+    _credential_caches = ("_auth_header", "_headers", "_base_url", "_api_url", "_browse_url")
+    
+    # Intermediate "progress" events are only emitted in verbose mode
+    emit_progress: bool = False
+    
+    @property
+    def required_credentials(self) -> List[str]:
+        return ["domain", "email", "api_token"]  # Basic Auth approach
+    
+    @cached_property
+    def _auth_header(self) -> str:
+        creds = self.credentials.credentials
+        token = base64.b64encode(f"{creds['email']}:{creds['api_token']}".encode()).decode()
+        return f"Basic {token}"
+    
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, built once per credentials. Do not mutate."""
+        return {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": self._auth_header
+        }
+    
+    @cached_property
+    def _base_url(self) -> str:
+        return f"https://{self.credentials.credentials['domain']}.atlassian.net"
+    
+    @cached_property
+    def _api_url(self) -> str:
+        return f"{self._base_url}/rest/api/3"
+    
+    @cached_property
+    def _browse_url(self) -> str:
+        return f"{self._base_url}/browse/"
+    
+    def _transition_cache_key(self, issue_key: str, issue_type: str) -> Tuple[str, str, str]:
+        return self._base_url, issue_key.split("-")[0], issue_type.lower()
+    
+    async def _fetch_transition_ids(self, issue_key: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Get an issue's type and its transitions as lower-cased status name -> id.
+        
+        Both come from one issue request with the transitions expanded.
+        """
+        issue_url = f"{self._api_url}/issue/{issue_key}"
+        response = await self._make_request(
+            "GET", issue_url, headers=self._headers, params={"fields": "issuetype", "expand": "transitions"}
+        )
+        issue = orjson.loads(response.content)
+        issue_type = _nested(issue.get("fields") or {}, "issuetype", "name")
+        available = {
+            transition.get("to", {}).get("name", "").lower(): transition["id"]
+            for transition in issue.get("transitions", [])
+        }
+        if issue_type:
+            cache_key = self._transition_cache_key(issue_key, issue_type)
+            _TRANSITION_IDS[cache_key] = {**_TRANSITION_IDS.get(cache_key, {}), **available}
+        return issue_type, available
+
 
 @register_tool("jira", {"category": ToolCategory.SEARCH, "priority": 1})
-class JiraSearchTool(BaseBusinessTool):
+class JiraSearchTool(_JiraTool):
     """Search for Jira issues using JQL queries."""
     
     @property
@@ -21,119 +141,146 @@ class JiraSearchTool(BaseBusinessTool):
     def description(self) -> str:
         return "Search for Jira issues using JQL (Jira Query Language) queries. Returns issue details including key, summary, status, assignee, and more."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["domain", "email", "api_token"]  # Basic Auth approach
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test Jira connection."""
-        creds = self.credentials.credentials
-        
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        url = f"{self._api_url}/myself"
         
-        # Use basic auth with email/token
-        import base64
-        auth_string = f"{creds['email']}:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
-        
-        url = f"https://{creds['domain']}.atlassian.net/rest/api/3/myself"
-        
-        response = await self._make_request("GET", url, headers=headers)
-        user_info = response.json()
+        response = await self._make_request("GET", url, headers=self._headers)
+        user_info = orjson.loads(response.content)
         
         return {
             "user": user_info.get("displayName", "Unknown"),
             "email": user_info.get("emailAddress", "Unknown"),
             "account_id": user_info.get("accountId", "Unknown"),
-            "domain": creds['domain']
+            "domain": self.credentials.credentials["domain"]
+        }
+    
+    def _project_issue(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a raw search hit to the fields the tool returns."""
+        fields = issue.get("fields") or {}
+        key = issue.get("key")
+        issue_data = {
+            "key": key,
+            "summary": fields.get("summary"),
+            "status": _nested(fields, "status", "name"),
+            "assignee": _nested(fields, "assignee", "displayName"),
+            "reporter": _nested(fields, "reporter", "displayName"),
+            "priority": _nested(fields, "priority", "name"),
+            "issue_type": _nested(fields, "issuetype", "name"),
+            "created": fields.get("created"),
+            "updated": fields.get("updated"),
+            "url": f"{self._browse_url}{key}"
         }
+        if "description" in fields:
+            issue_data["description"] = fields["description"]
+        return issue_data
+    
+    async def _search_page(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        start_at: int,
+        size: int,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Stream one page of search hits, projecting each issue as it is parsed."""
+        body = orjson.dumps({**payload, "startAt": start_at, "maxResults": size})
+        return [
+            self._project_issue(issue)
+            async for issue in self._stream_json_items(
+                "POST", url, "issues.item", headers=self._headers, meta=meta, content=body
+            )
+        ]
+    
+    async def _search_pages(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        max_results: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Collect up to ``max_results`` projected issues and the total match count.
+        
+        The first page reports ``total``; any further pages are then
+        requested concurrently by ``startAt`` offset.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+        
+        async def page(start_at: int, size: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._search_page(url, payload, start_at, size)
+        
+        meta: Dict[str, Any] = {}
+        issues = await self._search_page(url, payload, 0, min(max_results, _SEARCH_PAGE_SIZE), meta)
+        total = meta.get("total", 0)
+        
+        wanted = min(max_results, total)
+        pages = await asyncio.gather(*(
+            page(start_at, min(_SEARCH_PAGE_SIZE, wanted - start_at))
+            for start_at in range(_SEARCH_PAGE_SIZE, wanted, _SEARCH_PAGE_SIZE)
+        ))
+        for results in pages:
+            issues.extend(results)
+        return issues, total
     
-    async def execute(self, query: str = "", max_results: int = 20, **kwargs) -> ToolExecutionResult:
+    async def execute(
+        self,
+        query: str = "",
+        max_results: int = 20,
+        include_description: bool = False,
+        **kwargs
+    ) -> ToolExecutionResult:
         """Execute Jira search."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Searching Jira issues with query: {query}"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            # Prepare headers with auth
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-            
-            import base64
-            auth_string = f"{creds['email']}:{creds['api_token']}"
-            auth_bytes = auth_string.encode('utf-8')
-            headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Searching Jira issues with query: {}",
+                    args=(query,)
+                ))
             
             # Build search URL
-            url = f"https://{creds['domain']}.atlassian.net/rest/api/3/search"
+            url = f"{self._api_url}/search"
             
             # Default query if none provided
             if not query:
                 query = "order by updated DESC"
             
-            # Search payload
+            # Search payload; descriptions can be large ADF documents, so
+            # they are only requested when asked for
+            fields = [*_SEARCH_FIELDS, "description"] if include_description else list(_SEARCH_FIELDS)
             payload = {
                 "jql": query,
-                "maxResults": max_results,
-                "fields": [
-                    "key", "summary", "status", "assignee", "reporter", 
-                    "priority", "created", "updated", "description", "issuetype"
-                ],
-                "expand": ["names"]
+                "fields": fields
             }
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Executing JQL query..."
-            ))
+            if self.emit_progress and self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Executing JQL query..."
+                ))
             
-            response = await self._make_request("POST", url, headers=headers, data=payload)
-            result_data = response.json()
-            
-            # Process results
-            issues = []
-            for issue in result_data.get("issues", []):
-                fields = issue.get("fields", {})
-                issue_data = {
-                    "key": issue.get("key"),
-                    "summary": fields.get("summary"),
-                    "status": fields.get("status", {}).get("name"),
-                    "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-                    "reporter": fields.get("reporter", {}).get("displayName"),
-                    "priority": fields.get("priority", {}).get("name"),
-                    "issue_type": fields.get("issuetype", {}).get("name"),
-                    "created": fields.get("created"),
-                    "updated": fields.get("updated"),
-                    "url": f"https://{creds['domain']}.atlassian.net/browse/{issue.get('key')}"
-                }
-                issues.append(issue_data)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(issues)} issues"
-            ))
+            issues, total = await self._search_pages(url, payload, max_results)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Found {} issues",
+                    args=(len(issues),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
                 data={
                     "issues": issues,
-                    "total": result_data.get("total", 0),
+                    "total": total,
                     "query": query,
                     "max_results": max_results
                 },
@@ -143,14 +290,16 @@ class JiraSearchTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Search failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Search failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -162,7 +311,7 @@ class JiraSearchTool(BaseBusinessTool):
 
 
 @register_tool("jira", {"category": ToolCategory.CREATE, "priority": 2})
-class JiraCreateIssueTool(BaseBusinessTool):
+class JiraCreateIssueTool(_JiraTool):
     """Create new Jira issues."""
     
     @property
@@ -173,27 +322,12 @@ class JiraCreateIssueTool(BaseBusinessTool):
     def description(self) -> str:
         return "Create a new Jira issue. Requires project key, issue type, summary, and optionally description, assignee, priority."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["domain", "email", "api_token"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting projects list."""
-        creds = self.credentials.credentials
+        url = f"{self._api_url}/project"
         
-        headers = {
-            "Accept": "application/json",
-        }
-        
-        import base64
-        auth_string = f"{creds['email']}:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
-        
-        url = f"https://{creds['domain']}.atlassian.net/rest/api/3/project"
-        
-        response = await self._make_request("GET", url, headers=headers)
-        projects = response.json()
+        response = await self._make_request("GET", url, headers=self._headers)
+        projects = orjson.loads(response.content)
         
         return {
             "available_projects": len(projects),
@@ -211,28 +345,18 @@ class JiraCreateIssueTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Create a new Jira issue."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Creating Jira issue in project {project_key}"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-            
-            import base64
-            auth_string = f"{creds['email']}:{creds['api_token']}"
-            auth_bytes = auth_string.encode('utf-8')
-            headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Creating Jira issue in project {}",
+                    args=(project_key,)
+                ))
             
-            url = f"https://{creds['domain']}.atlassian.net/rest/api/3/issue"
+            url = f"{self._api_url}/issue"
             
             # Build issue payload
             issue_fields = {
@@ -243,16 +367,7 @@ class JiraCreateIssueTool(BaseBusinessTool):
             }
             
             if description:
-                issue_fields["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description}]
-                        }
-                    ]
-                }
+                issue_fields["description"] = _adf_paragraph(description)
             
             if assignee:
                 # Try to find user by email or account ID
@@ -260,32 +375,35 @@ class JiraCreateIssueTool(BaseBusinessTool):
             
             payload = {"fields": issue_fields}
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Submitting issue creation request..."
-            ))
+            if self.emit_progress and self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Submitting issue creation request..."
+                ))
             
-            response = await self._make_request("POST", url, headers=headers, data=payload)
-            result_data = response.json()
+            response = await self._make_request("POST", url, headers=self._headers, content=orjson.dumps(payload))
+            result_data = orjson.loads(response.content)
             
             issue_key = result_data.get("key")
             issue_id = result_data.get("id")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Created issue {issue_key}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Created issue {}",
+                    args=(issue_key,)
+                ))
             
             return ToolExecutionResult(
                 success=True,
                 data={
                     "issue_key": issue_key,
                     "issue_id": issue_id,
-                    "url": f"https://{creds['domain']}.atlassian.net/browse/{issue_key}",
+                    "url": f"{self._browse_url}{issue_key}",
                     "project": project_key,
                     "summary": summary,
                     "issue_type": issue_type
@@ -296,14 +414,16 @@ class JiraCreateIssueTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Issue creation failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Issue creation failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -315,7 +435,7 @@ class JiraCreateIssueTool(BaseBusinessTool):
 
 
 @register_tool("jira", {"category": ToolCategory.UPDATE, "priority": 3})
-class JiraUpdateIssueTool(BaseBusinessTool):
+class JiraUpdateIssueTool(_JiraTool):
     """Update existing Jira issues."""
     
     @property
@@ -326,31 +446,77 @@ class JiraUpdateIssueTool(BaseBusinessTool):
     def description(self) -> str:
         return "Update an existing Jira issue. Can modify status, assignee, priority, summary, description, and other fields."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["domain", "email", "api_token"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting issue types."""
-        creds = self.credentials.credentials
+        url = f"{self._api_url}/issuetype"
         
-        headers = {
-            "Accept": "application/json",
+        response = await self._make_request("GET", url, headers=self._headers)
+        issue_types = orjson.loads(response.content)
+        
+        return {
+            "available_issue_types": [it.get("name") for it in issue_types[:5]]
         }
+    
+    async def _transition_issue(self, issue_key: str, status: str, issue_type: Optional[str] = None) -> None:
+        """
+        Move an issue to the transition whose target status matches ``status``.
+        
+        A cached transition id is only used when the caller names the issue
+        type; otherwise the issue's own transitions are looked up.
+        """
+        transitions_url = f"{self._api_url}/issue/{issue_key}/transitions"
         
-        import base64
-        auth_string = f"{creds['email']}:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+        # Try the transition id seen last time for this project and issue type;
+        # Jira answers 400 when it isn't available from the current status
+        cache_key = self._transition_cache_key(issue_key, issue_type) if issue_type else None
+        transition_id = _TRANSITION_IDS.get(cache_key, {}).get(status.lower()) if cache_key else None
+        if transition_id is not None:
+            response = await self._make_request(
+                "POST",
+                transitions_url,
+                headers=self._headers,
+                content=orjson.dumps({"transition": {"id": transition_id}}),
+                allow_status=(400,)
+            )
+            if response.status_code != 400:
+                self._emit_transitioned(status)
+                return
+            _TRANSITION_IDS.pop(cache_key)
         
-        url = f"https://{creds['domain']}.atlassian.net/rest/api/3/issuetype"
+        _, available = await self._fetch_transition_ids(issue_key)
+        transition_id = available.get(status.lower())
+        if transition_id is not None:
+            # Perform status transition
+            await self._make_request(
+                "POST", 
+                transitions_url, 
+                headers=self._headers, 
+                content=orjson.dumps({"transition": {"id": transition_id}})
+            )
+            self._emit_transitioned(status)
+    
+    def _emit_transitioned(self, status: str) -> None:
+        if self.emit_progress and self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
+                type="progress",
+                tool_name=self.tool_name,
+                message="Transitioned to status: {}",
+                args=(status,)
+            ))
+    
+    async def _update_fields(self, issue_key: str, update_fields: Dict[str, Any]) -> None:
+        """Write the non-status field changes for an issue."""
+        update_url = f"{self._api_url}/issue/{issue_key}"
+        update_payload = {"fields": update_fields}
         
-        response = await self._make_request("GET", url, headers=headers)
-        issue_types = response.json()
+        await self._make_request("PUT", update_url, headers=self._headers, content=orjson.dumps(update_payload))
         
-        return {
-            "available_issue_types": [it.get("name") for it in issue_types[:5]]
-        }
+        if self.emit_progress and self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
+                type="progress",
+                tool_name=self.tool_name,
+                message="Updated issue fields"
+            ))
     
     async def execute(
         self, 
@@ -360,29 +526,25 @@ class JiraUpdateIssueTool(BaseBusinessTool):
         priority: Optional[str] = None,
         summary: Optional[str] = None,
         description: Optional[str] = None,
+        issue_type: Optional[str] = None,
         **kwargs
     ) -> ToolExecutionResult:
-        """Update a Jira issue."""
-        start_time = datetime.now()
+        """
+        Update a Jira issue.
+        
+        Passing the issue's ``issue_type`` lets a status change reuse a cached
+        transition id instead of looking up the issue's transitions first.
+        """
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Updating Jira issue {issue_key}"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-            
-            import base64
-            auth_string = f"{creds['email']}:{creds['api_token']}"
-            auth_bytes = auth_string.encode('utf-8')
-            headers["Authorization"] = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Updating Jira issue {}",
+                    args=(issue_key,)
+                ))
             
             # Build update fields
             update_fields = {}
@@ -397,70 +559,23 @@ class JiraUpdateIssueTool(BaseBusinessTool):
                 update_fields["assignee"] = {"emailAddress": assignee}
             
             if description:
-                update_fields["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description}]
-                        }
-                    ]
-                }
-            
-            # Handle status transition separately
+                update_fields["description"] = _adf_paragraph(description)
+            
+            # Transition first: a rejected status change stops the field edit
             if status:
-                # First get available transitions
-                transitions_url = f"https://{creds['domain']}.atlassian.net/rest/api/3/issue/{issue_key}/transitions"
-                transitions_response = await self._make_request("GET", transitions_url, headers=headers)
-                transitions = transitions_response.json().get("transitions", [])
-                
-                # Find transition that matches status
-                target_transition = None
-                for transition in transitions:
-                    if transition.get("to", {}).get("name", "").lower() == status.lower():
-                        target_transition = transition
-                        break
-                
-                if target_transition:
-                    # Perform status transition
-                    transition_payload = {
-                        "transition": {"id": target_transition["id"]}
-                    }
-                    
-                    await self._make_request(
-                        "POST", 
-                        transitions_url, 
-                        headers=headers, 
-                        data=transition_payload
-                    )
-                    
-                    await self.emit_event(ToolExecutionEvent(
-                        type="progress",
-                        tool_name=self.tool_name,
-                        message=f"Transitioned to status: {status}"
-                    ))
-            
-            # Update other fields if any
+                await self._transition_issue(issue_key, status, issue_type)
             if update_fields:
-                update_url = f"https://{creds['domain']}.atlassian.net/rest/api/3/issue/{issue_key}"
-                update_payload = {"fields": update_fields}
-                
-                await self._make_request("PUT", update_url, headers=headers, data=update_payload)
-                
-                await self.emit_event(ToolExecutionEvent(
-                    type="progress",
-                    tool_name=self.tool_name,
-                    message="Updated issue fields"
-                ))
+                await self._update_fields(issue_key, update_fields)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Successfully updated issue {issue_key}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Successfully updated issue {}",
+                    args=(issue_key,)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -468,7 +583,7 @@ class JiraUpdateIssueTool(BaseBusinessTool):
                     "issue_key": issue_key,
                     "updated_fields": list(update_fields.keys()),
                     "status_updated": status is not None,
-                    "url": f"https://{creds['domain']}.atlassian.net/browse/{issue_key}"
+                    "url": f"{self._browse_url}{issue_key}"
                 },
                 tool_name=self.tool_name,
                 execution_time=execution_time,
@@ -476,14 +591,16 @@ class JiraUpdateIssueTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Update failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Update failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -491,4 +608,235 @@ class JiraUpdateIssueTool(BaseBusinessTool):
                 tool_name=self.tool_name,
                 execution_time=execution_time,
                 metadata={"action": "update", "issue_key": issue_key}
-            )
\ No newline at end of file
+            )
+
+
+@register_tool("jira", {"category": ToolCategory.UPDATE, "priority": 4})
+class JiraBulkUpdateTool(_JiraTool):
+    """Apply the same update to many Jira issues."""
+    
+    @property
+    def tool_name(self) -> str:
+        return "jira_bulk_update_issues"
+    
+    @property
+    def description(self) -> str:
+        return "Apply the same status, priority, summary or description change to many Jira issues at once. Takes a list of issue keys."
+    
+    async def _test_connection_impl(self) -> Dict[str, Any]:
+        """Test by getting the current user."""
+        url = f"{self._api_url}/myself"
+        
+        response = await self._make_request("GET", url, headers=self._headers)
+        user_info = orjson.loads(response.content)
+        
+        return {"user": user_info.get("displayName", "Unknown")}
+    
+    async def _priority_id(self, priority: str) -> str:
+        """Resolve a priority name to its id; the bulk edit API only accepts ids."""
+        priority_ids = _PRIORITY_IDS.get(self._base_url)
+        if priority_ids is None:
+            response = await self._make_request("GET", f"{self._api_url}/priority", headers=self._headers)
+            priority_ids = {item["name"].lower(): item["id"] for item in orjson.loads(response.content)}
+            _PRIORITY_IDS[self._base_url] = priority_ids
+        try:
+            return priority_ids[priority.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown Jira priority: {priority}")
+    
+    async def _edit_fields(
+        self,
+        issue_keys: List[str],
+        priority: Optional[str],
+        summary: Optional[str],
+        description: Optional[str]
+    ) -> List[str]:
+        """Submit bulk field edits and return the ids of the queued Jira tasks."""
+        actions = []
+        edited: Dict[str, Any] = {}
+        if priority:
+            actions.append("priority")
+            edited["priority"] = {"priorityId": await self._priority_id(priority)}
+        if summary:
+            actions.append("summary")
+            edited["singleLineTextFields"] = [{"fieldId": "summary", "text": summary}]
+        if description:
+            actions.append("description")
+            edited["richTextFields"] = [{"fieldId": "description", "richText": {"adfValue": _adf_paragraph(description)}}]
+        
+        url = f"{self._api_url}/bulk/issues/fields"
+        responses = await asyncio.gather(*(
+            self._make_request("POST", url, headers=self._headers, content=orjson.dumps({
+                "selectedIssueIdsOrKeys": issue_keys[start:start + _BULK_MAX_ISSUES],
+                "selectedActions": actions,
+                "editedFieldsInput": edited
+            }))
+            for start in range(0, len(issue_keys), _BULK_MAX_ISSUES)
+        ))
+        return [orjson.loads(response.content).get("taskId") for response in responses]
+    
+    async def _issue_types(self, issue_keys: List[str]) -> Dict[str, str]:
+        """Map issue keys to their issue type names, a search page at a time."""
+        url = f"{self._api_url}/search"
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+        
+        async def page(keys: List[str]) -> List[Tuple[str, Optional[str]]]:
+            # "warn" keeps unknown keys from failing the whole search
+            body = orjson.dumps({
+                "jql": f"key in ({','.join(keys)})",
+                "fields": ["issuetype"],
+                "maxResults": len(keys),
+                "validateQuery": "warn"
+            })
+            async with semaphore:
+                return [
+                    (issue.get("key"), _nested(issue.get("fields") or {}, "issuetype", "name"))
+                    async for issue in self._stream_json_items(
+                        "POST", url, "issues.item", headers=self._headers, content=body
+                    )
+                ]
+        
+        pages = await asyncio.gather(*(
+            page(issue_keys[start:start + _SEARCH_PAGE_SIZE])
+            for start in range(0, len(issue_keys), _SEARCH_PAGE_SIZE)
+        ))
+        return {key: issue_type for results in pages for key, issue_type in results if issue_type}
+    
+    async def _transition(self, issue_keys: List[str], status: str) -> List[str]:
+        """
+        Submit bulk transitions and return the ids of the queued Jira tasks.
+        
+        Issues are grouped by project and issue type, since each type may
+        follow its own workflow; one request is sent per group. Each group
+        uses the transition id for ``status`` cached for that project and
+        type, or the one available to its first issue.
+        """
+        issue_types = await self._issue_types(issue_keys)
+        
+        # Issues the search could not place (e.g. moved since) are looked up
+        # one by one, which also tells us their type
+        available: Dict[str, Dict[str, str]] = {}
+        for issue_key in issue_keys:
+            if issue_key not in issue_types:
+                issue_type, available[issue_key] = await self._fetch_transition_ids(issue_key)
+                issue_types[issue_key] = issue_type or ""
+        
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for issue_key in issue_keys:
+            groups.setdefault((issue_key.split("-")[0], issue_types[issue_key]), []).append(issue_key)
+        
+        async def transition_input(group: Tuple[str, str], keys: List[str]) -> Dict[str, Any]:
+            project, issue_type = group
+            transition_id = None
+            if issue_type:
+                cache_key = self._transition_cache_key(keys[0], issue_type)
+                transition_id = _TRANSITION_IDS.get(cache_key, {}).get(status.lower())
+            if transition_id is None:
+                transitions = available.get(keys[0])
+                if transitions is None:
+                    _, transitions = await self._fetch_transition_ids(keys[0])
+                transition_id = transitions.get(status.lower())
+            if transition_id is None:
+                raise ValueError(f"No transition to status {status} for {issue_type or 'issues'} in project {project}")
+            return {"selectedIssueIdsOrKeys": keys, "transitionId": transition_id}
+        
+        inputs = await asyncio.gather(*(transition_input(group, keys) for group, keys in groups.items()))
+        
+        url = f"{self._api_url}/bulk/issues/transition"
+        responses = await asyncio.gather(*(
+            self._make_request("POST", url, headers=self._headers, content=orjson.dumps({
+                "bulkTransitionInputs": [{
+                    **group,
+                    "selectedIssueIdsOrKeys": group["selectedIssueIdsOrKeys"][start:start + _BULK_MAX_ISSUES]
+                }]
+            }))
+            for group in inputs
+            for start in range(0, len(group["selectedIssueIdsOrKeys"]), _BULK_MAX_ISSUES)
+        ))
+        return [orjson.loads(response.content).get("taskId") for response in responses]
+    
+    async def execute(
+        self,
+        issue_keys: List[str],
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        **kwargs
+    ) -> ToolExecutionResult:
+        """
+        Update every issue in ``issue_keys`` the same way.
+        
+        Jira runs bulk operations as background tasks; the result lists
+        the task ids to poll. With ``_BULK_THRESHOLD`` issues or fewer the
+        single-issue update is used for each issue instead.
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Updating {} Jira issues",
+                    args=(len(issue_keys),)
+                ))
+            
+            if len(issue_keys) <= _BULK_THRESHOLD:
+                single = JiraUpdateIssueTool(self.credentials)
+                results = await asyncio.gather(*(
+                    single.execute(
+                        issue_key=issue_key, status=status, priority=priority,
+                        summary=summary, description=description
+                    )
+                    for issue_key in issue_keys
+                ))
+                failed = {issue_key: result.error for issue_key, result in zip(issue_keys, results) if not result.success}
+                data = {"issue_keys": issue_keys, "bulk": False, "failed": failed}
+            else:
+                requests = []
+                if priority or summary or description:
+                    requests.append(self._edit_fields(issue_keys, priority, summary, description))
+                if status:
+                    requests.append(self._transition(issue_keys, status))
+                task_ids = [task_id for tasks in await asyncio.gather(*requests) for task_id in tasks]
+                data = {"issue_keys": issue_keys, "bulk": True, "task_ids": task_ids}
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Submitted updates for {} issues",
+                    args=(len(issue_keys),)
+                ))
+            
+            return ToolExecutionResult(
+                success=not data.get("failed"),
+                data=data,
+                error=f"{len(data['failed'])} issue updates failed" if data.get("failed") else None,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "bulk_update", "issue_count": len(issue_keys)}
+            )
+            
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
+            error_msg = str(e)
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Bulk update failed: {}",
+                    args=(error_msg,)
+                ))
+            
+            return ToolExecutionResult(
+                success=False,
+                error=error_msg,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "bulk_update", "issue_count": len(issue_keys)}
+            )
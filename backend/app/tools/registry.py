@@ -1,12 +1,14 @@
 """
 Tool Registry System for dynamic tool loading and management.
 """
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, List, Optional, Type, Any, Tuple
+import asyncio
+import hashlib
 import logging
-from collections import defaultdict
 from datetime import datetime
+from itertools import chain
 
-from app.tools.base import BaseBusinessTool, ToolCredentials, CrewAITool
+from app.tools.base import BaseBusinessTool, ToolCredentials, CrewAITool, TTLCache
 from app.models.integration import Integration
 from app.core.encryption import encryption_service
 
@@ -21,8 +23,17 @@ class ToolRegistry:
     
     def __init__(self):
         self._tool_classes: Dict[str, Type[BaseBusinessTool]] = {}
-        self._active_tools: Dict[str, Dict[str, BaseBusinessTool]] = defaultdict(dict)
+        self._active_tools: Dict[str, Dict[str, BaseBusinessTool]] = {}
+        # CrewAI wrappers per integration id, built on first use
+        self._crewai_wrappers: Dict[str, List[CrewAITool]] = {}
+        # Kept current on load/unload so stats don't walk every integration
+        self._total_active_tools = 0
+        self._tool_names: Dict[str, Tuple[str, ...]] = {}
+        # (ciphertext digest, decrypted credentials) per integration id
+        self._decrypted_credentials = TTLCache(maxsize=1024, ttl=300)
         self._tool_metadata: Dict[str, Dict[str, Any]] = {}
+        # (key, class) pairs per lower-cased integration type
+        self._tools_by_type: Dict[str, List[Tuple[str, Type[BaseBusinessTool]]]] = {}
         
     def register_tool_class(
         self, 
@@ -34,21 +45,21 @@ class ToolRegistry:
         key = f"{integration_type}_{tool_class.__name__}"
         self._tool_classes[key] = tool_class
         self._tool_metadata[key] = metadata or {}
+        self._tools_by_type.setdefault(integration_type.lower(), []).append((key, tool_class))
         
         logger.info(f"Registered tool class: {key}")
     
     def get_available_tools(self, integration_type: str) -> List[Dict[str, Any]]:
         """Get available tools for an integration type."""
         tools = []
-        for key, tool_class in self._tool_classes.items():
-            if key.startswith(f"{integration_type}_"):
-                tools.append({
-                    "name": tool_class.__name__,
-                    "tool_name": tool_class.tool_name if hasattr(tool_class, 'tool_name') else key,
-                    "description": tool_class.__doc__ or "No description available",
-                    "integration_type": integration_type,
-                    "metadata": self._tool_metadata.get(key, {})
-                })
+        for key, tool_class in self._tools_by_type.get(integration_type.lower(), ()):
+            tools.append({
+                "name": tool_class.__name__,
+                "tool_name": tool_class.tool_name if hasattr(tool_class, 'tool_name') else key,
+                "description": tool_class.__doc__ or "No description available",
+                "integration_type": integration_type,
+                "metadata": self._tool_metadata.get(key, {})
+            })
         return tools
     
     async def load_tools_for_integration(
@@ -60,9 +71,7 @@ class ToolRegistry:
         
         try:
             # Decrypt credentials
-            decrypted_creds = encryption_service.decrypt_credentials(
-                integration.encrypted_credentials
-            )
+            decrypted_creds = self._decrypt_credentials(integration)
             
             # Create tool credentials
             credentials = ToolCredentials(
@@ -72,26 +81,35 @@ class ToolRegistry:
             )
             
             # Find and instantiate tools for this integration type
-            for key, tool_class in self._tool_classes.items():
-                if key.startswith(f"{integration.integration_type.lower()}_"):
-                    try:
-                        tool = tool_class(credentials)
-                        
-                        # Test connection before adding to active tools
-                        test_result = await tool.test_connection()
-                        if test_result.success:
-                            tools.append(tool)
-                            
-                            # Store in active tools
-                            self._active_tools[str(integration.id)][tool.tool_name] = tool
-                            
-                            logger.info(f"Successfully loaded tool: {tool.tool_name} for integration {integration.id}")
-                        else:
-                            logger.warning(f"Tool connection test failed: {tool.tool_name} - {test_result.error}")
-                            
-                    except Exception as e:
-                        logger.error(f"Failed to load tool {tool_class.__name__}: {str(e)}")
-                        continue
+            candidates = []
+            for key, tool_class in self._tools_by_type.get(integration.integration_type.lower(), ()):
+                try:
+                    candidates.append(tool_class(credentials))
+                except Exception as e:
+                    logger.error(f"Failed to load tool {tool_class.__name__}: {str(e)}")
+            
+            # Test connections concurrently before adding to active tools
+            results = await asyncio.gather(
+                *(tool.test_connection() for tool in candidates),
+                return_exceptions=True
+            )
+            for tool, test_result in zip(candidates, results):
+                if isinstance(test_result, Exception):
+                    logger.error(f"Failed to load tool {type(tool).__name__}: {str(test_result)}")
+                elif test_result.success:
+                    tools.append(tool)
+                    
+                    # Store in active tools
+                    integration_tools = self._active_tools.setdefault(str(integration.id), {})
+                    if tool.tool_name not in integration_tools:
+                        self._total_active_tools += 1
+                    integration_tools[tool.tool_name] = tool
+                    self._tool_names[str(integration.id)] = tuple(integration_tools)
+                    self._crewai_wrappers.pop(str(integration.id), None)
+                    
+                    logger.info(f"Successfully loaded tool: {tool.tool_name} for integration {integration.id}")
+                else:
+                    logger.warning(f"Tool connection test failed: {tool.tool_name} - {test_result.error}")
             
             logger.info(f"Loaded {len(tools)} tools for integration {integration.id}")
             return tools
@@ -100,28 +118,50 @@ class ToolRegistry:
             logger.error(f"Failed to load tools for integration {integration.id}: {str(e)}")
             return []
     
+    def _decrypt_credentials(self, integration: Integration) -> Dict[str, Any]:
+        """Decrypt integration credentials, reusing recent results for unchanged ciphertext."""
+        integration_id = str(integration.id)
+        digest = hashlib.blake2b(integration.encrypted_credentials.encode(), digest_size=16).digest()
+        cached = self._decrypted_credentials.get(integration_id)
+        if cached is not None and cached[0] == digest:
+            return dict(cached[1])
+        
+        decrypted_creds = encryption_service.decrypt_credentials(integration.encrypted_credentials)
+        self._decrypted_credentials[integration_id] = (digest, decrypted_creds)
+        return dict(decrypted_creds)
+    
     def get_tools_for_integration(self, integration_id: str) -> List[BaseBusinessTool]:
         """Get active tools for an integration."""
         return list(self._active_tools.get(integration_id, {}).values())
     
     def get_crewai_tools_for_integration(self, integration_id: str) -> List[CrewAITool]:
         """Get CrewAI-compatible tools for an integration."""
-        business_tools = self.get_tools_for_integration(integration_id)
-        return [CrewAITool(tool) for tool in business_tools]
+        return list(self._crewai_tools(integration_id))
+    
+    def _crewai_tools(self, integration_id: str) -> List[CrewAITool]:
+        """Cached CrewAI wrappers for an integration. Do not mutate."""
+        wrappers = self._crewai_wrappers.get(integration_id)
+        if wrappers is None:
+            wrappers = [CrewAITool(tool) for tool in self.get_tools_for_integration(integration_id)]
+            if integration_id in self._active_tools:
+                self._crewai_wrappers[integration_id] = wrappers
+        return wrappers
     
     def get_all_crewai_tools_for_user(self, user_integrations: List[Integration]) -> List[CrewAITool]:
         """Get all CrewAI tools for a user's active integrations."""
-        all_tools = []
-        for integration in user_integrations:
-            if integration.is_active:
-                tools = self.get_crewai_tools_for_integration(str(integration.id))
-                all_tools.extend(tools)
-        return all_tools
+        return list(chain.from_iterable(
+            self._crewai_tools(str(integration.id))
+            for integration in user_integrations
+            if integration.is_active
+        ))
     
     def unload_tools_for_integration(self, integration_id: str) -> None:
         """Unload tools for an integration."""
+        self._crewai_wrappers.pop(integration_id, None)
+        self._decrypted_credentials.pop(integration_id)
+        self._tool_names.pop(integration_id, None)
         if integration_id in self._active_tools:
-            del self._active_tools[integration_id]
+            self._total_active_tools -= len(self._active_tools.pop(integration_id))
             logger.info(f"Unloaded tools for integration {integration_id}")
     
     def get_tool_by_name(self, integration_id: str, tool_name: str) -> Optional[BaseBusinessTool]:
@@ -133,11 +173,8 @@ class ToolRegistry:
         stats = {
             "total_tool_classes": len(self._tool_classes),
             "active_integrations": len(self._active_tools),
-            "total_active_tools": sum(len(tools) for tools in self._active_tools.values()),
-            "tools_by_integration": {
-                integration_id: list(tools.keys()) 
-                for integration_id, tools in self._active_tools.items()
-            }
+            "total_active_tools": self._total_active_tools,
+            "tools_by_integration": dict(self._tool_names)
         }
         return stats
 
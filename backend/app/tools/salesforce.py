@@ -1,31 +1,110 @@
 """
 Salesforce API integration tools.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+import asyncio
+import hashlib
 import json
-from datetime import datetime
+import time
+import weakref
+from functools import cached_property
+from itertools import islice
+from urllib.parse import urlencode
 
-from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
+import httpx
+import orjson
+
+from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory, TTLCache
 from app.tools.registry import register_tool
 
+_API_PATH = "/services/data/v58.0"
 
-@register_tool("salesforce", {"category": ToolCategory.SEARCH, "priority": 1})
-class SalesforceQueryTool(BaseBusinessTool):
-    """Query Salesforce records using SOQL."""
-    
-    @property
-    def tool_name(self) -> str:
-        return "salesforce_query"
+# SOQL result batch sizes the REST API accepts per request
+_QUERY_BATCH_SIZE = 2000
+_QUERY_MIN_BATCH_SIZE = 200
+# Queries for more rows than this are parsed while the response streams in
+_QUERY_STREAM_THRESHOLD = 1000
+
+# The sObject Collections API takes at most 200 records per request
+_COLLECTION_SIZE = 200
+
+# Salesforce sessions last two hours by default; refresh well before that
+_TOKEN_TTL = 3300.0
+_TOKEN_REFRESH_MARGIN = 60.0
+
+# (access_token, instance_url, expires_at) per (client_id, username, sandbox,
+# secrets digest). The digest keeps a session from being handed to anyone who
+# only knows the username and connected app, without the secrets behind it.
+_TOKEN_CACHE: Dict[Tuple[str, str, bool, str], Tuple[str, str, float]] = {}
+# Per event loop, so concurrent calls share a single token request
+_TOKEN_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, bool, str], asyncio.Lock]]" = weakref.WeakKeyDictionary()
+
+# Default queries for the common objects, keyed by lower-cased object type
+_SOQL_TEMPLATES = {
+    "account": "SELECT Id, Name, Type, Industry, Phone, Website FROM Account LIMIT {limit}",
+    "contact": "SELECT Id, FirstName, LastName, Email, Phone, Account.Name FROM Contact LIMIT {limit}",
+    "opportunity": "SELECT Id, Name, StageName, Amount, CloseDate, Account.Name FROM Opportunity LIMIT {limit}",
+    "lead": "SELECT Id, FirstName, LastName, Email, Company, Status FROM Lead LIMIT {limit}",
+}
+
+# Summary of the (large, rarely changing) /sobjects listing per instance URL
+_SOBJECTS_SUMMARIES = TTLCache(maxsize=256, ttl=3600)
+# Parsed sObject describe results per (instance_url, sobject)
+_DESCRIBES = TTLCache(maxsize=256, ttl=3600)
+
+
+def _api_headers(access_token: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json"
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+    return headers
+
+
+def _chunked(items: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _SalesforceTool(BaseBusinessTool):
+    """Shared OAuth handling for the Salesforce tools."""
     
-    @property
-    def description(self) -> str:
-        return "Query Salesforce records using SOQL (Salesforce Object Query Language). Can search Accounts, Contacts, Opportunities, Leads, and other objects."
+    _credential_caches = ("_token_key",)
     
     @property
     def required_credentials(self) -> List[str]:
         return ["username", "password", "security_token", "client_id", "client_secret", "sandbox"]
     
-    async def _get_access_token(self) -> str:
+    @cached_property
+    def _token_key(self) -> Tuple[str, str, bool, str]:
+        creds = self.credentials.credentials
+        secrets = orjson.dumps([creds["client_secret"], creds["password"], creds["security_token"]])
+        return (
+            creds["client_id"], creds["username"], bool(creds.get("sandbox", False)),
+            hashlib.sha256(secrets).hexdigest()
+        )
+    
+    async def _get_access_token(self) -> Tuple[str, str]:
+        """Get a Salesforce access token and instance URL, reusing a cached session."""
+        key = self._token_key
+        cached = _TOKEN_CACHE.get(key)
+        if cached is not None and time.monotonic() < cached[2] - _TOKEN_REFRESH_MARGIN:
+            return cached[0], cached[1]
+        
+        locks = _TOKEN_LOCKS.setdefault(asyncio.get_running_loop(), {})
+        async with locks.setdefault(key, asyncio.Lock()):
+            cached = _TOKEN_CACHE.get(key)
+            if cached is not None and time.monotonic() < cached[2] - _TOKEN_REFRESH_MARGIN:
+                return cached[0], cached[1]
+            
+            access_token, instance_url = await self._fetch_access_token()
+            _TOKEN_CACHE[key] = (access_token, instance_url, time.monotonic() + _TOKEN_TTL)
+            return access_token, instance_url
+    
+    async def _fetch_access_token(self) -> Tuple[str, str]:
         """Get Salesforce access token using OAuth Username-Password flow."""
         creds = self.credentials.credentials
         
@@ -46,24 +125,132 @@ class SalesforceQueryTool(BaseBusinessTool):
             "Content-Type": "application/x-www-form-urlencoded"
         }
         
-        response = await self._make_request("POST", token_url, headers=headers, data=data)
+        response = await self._make_request("POST", token_url, headers=headers, content=urlencode(data).encode())
         token_data = response.json()
         
         return token_data["access_token"], token_data["instance_url"]
     
-    async def _test_connection_impl(self) -> Dict[str, Any]:
-        """Test Salesforce connection."""
-        access_token, instance_url = await self._get_access_token()
+    async def _api_request(
+        self,
+        method: str,
+        path: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Call the Salesforce REST API at ``path`` on the org's instance.
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        An expired or revoked session (401) drops the cached token and the
+        call is retried once with a fresh one.
+        """
+        for attempt in range(2):
+            access_token, instance_url = await self._get_access_token()
+            response = await self._make_request(
+                method, f"{instance_url}{path}", headers=_api_headers(access_token, extra_headers),
+                allow_status=(401,), **kwargs
+            )
+            if response.status_code != 401:
+                return response
+            _TOKEN_CACHE.pop(self._token_key, None)
+        response.raise_for_status()
+    
+    async def _stream_records(
+        self,
+        path: str,
+        records: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream one page of query results at ``path`` into ``records``.
+        
+        Records are appended, without their ``attributes``, as they are parsed;
+        the page's top-level fields (``totalSize``, ``nextRecordsUrl``, ...)
+        are returned. A 401 is retried once with a fresh session, like
+        ``_api_request``.
+        """
+        for attempt in range(2):
+            access_token, instance_url = await self._get_access_token()
+            meta: Dict[str, Any] = {}
+            try:
+                async for record in self._stream_json_items(
+                    "GET", f"{instance_url}{path}", "records.item",
+                    headers=_api_headers(access_token, extra_headers), params=params, meta=meta
+                ):
+                    record.pop("attributes", None)
+                    records.append(record)
+                return meta
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 401 or attempt:
+                    raise
+                _TOKEN_CACHE.pop(self._token_key, None)
+    
+    async def _describe(self, sobject: str) -> Dict[str, Any]:
+        """Describe ``sobject``, reusing the org's cached metadata."""
+        _, instance_url = await self._get_access_token()
+        key = (instance_url, sobject)
+        described = _DESCRIBES.get(key)
+        if described is None:
+            response = await self._api_request("GET", f"{_API_PATH}/sobjects/{sobject}/describe")
+            described = orjson.loads(response.content)
+            _DESCRIBES[key] = described
+        return described
+    
+    async def _save_collection(
+        self,
+        method: str,
+        object_type: str,
+        records: List[Dict[str, Any]]
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Create (POST) or update (PATCH) records through /composite/sobjects.
+        
+        Returns ``(record_id, error)`` per record in input order. A failed
+        request marks every record of its chunk as failed.
+        """
+        chunks = list(_chunked(records, _COLLECTION_SIZE))
+        responses = await asyncio.gather(
+            *(
+                self._api_request(method, f"{_API_PATH}/composite/sobjects", content=orjson.dumps({
+                    "allOrNone": False,
+                    "records": [{"attributes": {"type": object_type}, **record} for record in chunk]
+                }))
+                for chunk in chunks
+            ),
+            return_exceptions=True
+        )
         
+        outcomes: List[Tuple[Optional[str], Optional[str]]] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                outcomes.extend((None, str(response)) for _ in chunk)
+                continue
+            for saved in orjson.loads(response.content):
+                if saved.get("success"):
+                    outcomes.append((saved.get("id"), None))
+                else:
+                    messages = [error.get("message", "") for error in saved.get("errors") or []]
+                    outcomes.append((saved.get("id"), "; ".join(messages) or "Record was not saved"))
+        return outcomes
+
+
+@register_tool("salesforce", {"category": ToolCategory.SEARCH, "priority": 1})
+class SalesforceQueryTool(_SalesforceTool):
+    """Query Salesforce records using SOQL."""
+    
+    @property
+    def tool_name(self) -> str:
+        return "salesforce_query"
+    
+    @property
+    def description(self) -> str:
+        return "Query Salesforce records using SOQL (Salesforce Object Query Language). Can search Accounts, Contacts, Opportunities, Leads, and other objects."
+    
+    async def _test_connection_impl(self) -> Dict[str, Any]:
+        """Test Salesforce connection."""
         # Get organization info
-        url = f"{instance_url}/services/data/v58.0/sobjects/Organization/describe"
-        response = await self._make_request("GET", url, headers=headers)
-        org_info = response.json()
+        org_info = await self._describe("Organization")
+        _, instance_url = await self._get_access_token()
         
         return {
             "organization": org_info.get("label", "Unknown"),
@@ -80,63 +267,78 @@ class SalesforceQueryTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Execute SOQL query."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Querying Salesforce {object_type} records"
-            ))
-            
-            access_token, instance_url = await self._get_access_token()
+            # Fetch the session while the request is being prepared
+            session = asyncio.create_task(self._get_access_token())
             
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Querying Salesforce {} records",
+                    args=(object_type,)
+                ))
             
             # Build SOQL query if not provided
             if not query:
-                if object_type.lower() == "account":
-                    query = f"SELECT Id, Name, Type, Industry, Phone, Website FROM Account LIMIT {limit}"
-                elif object_type.lower() == "contact":
-                    query = f"SELECT Id, FirstName, LastName, Email, Phone, Account.Name FROM Contact LIMIT {limit}"
-                elif object_type.lower() == "opportunity":
-                    query = f"SELECT Id, Name, StageName, Amount, CloseDate, Account.Name FROM Opportunity LIMIT {limit}"
-                elif object_type.lower() == "lead":
-                    query = f"SELECT Id, FirstName, LastName, Email, Company, Status FROM Lead LIMIT {limit}"
-                else:
-                    query = f"SELECT Id, Name FROM {object_type} LIMIT {limit}"
+                template = _SOQL_TEMPLATES.get(object_type.lower())
+                query = template.format(limit=limit) if template else f"SELECT Id, Name FROM {object_type} LIMIT {limit}"
             
             # Execute query
-            query_url = f"{instance_url}/services/data/v58.0/query"
             params = {"q": query}
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Executing SOQL query..."
-            ))
-            
-            response = await self._make_request("GET", query_url, headers=headers, params=params)
-            result_data = response.json()
-            
-            records = result_data.get("records", [])
-            
-            # Process records to remove metadata
-            processed_records = []
-            for record in records:
-                clean_record = {k: v for k, v in record.items() if not k.startswith("attributes")}
-                processed_records.append(clean_record)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(processed_records)} records"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Executing SOQL query..."
+                ))
+            
+            # Size batches to the limit (within the 200-2000 the API accepts) so
+            # queries without their own LIMIT don't pull a full default batch
+            batch_size = min(max(limit, _QUERY_MIN_BATCH_SIZE), _QUERY_BATCH_SIZE)
+            headers = {"Sforce-Query-Options": f"batchSize={batch_size}"}
+            
+            await session
+            if limit > _QUERY_STREAM_THRESHOLD:
+                records: List[Dict[str, Any]] = []
+                result_data = await self._stream_records(f"{_API_PATH}/query", records, params=params, extra_headers=headers)
+                
+                # Follow the query cursor until enough rows are collected
+                next_url = result_data.get("nextRecordsUrl")
+                while next_url and len(records) < limit:
+                    page = await self._stream_records(next_url, records, extra_headers=headers)
+                    next_url = page.get("nextRecordsUrl")
+            else:
+                response = await self._api_request("GET", f"{_API_PATH}/query", params=params, extra_headers=headers)
+                result_data = orjson.loads(response.content)
+                
+                records = result_data.get("records", [])
+                
+                # Follow the query cursor until enough rows are collected
+                next_url = result_data.get("nextRecordsUrl")
+                while next_url and len(records) < limit:
+                    response = await self._api_request("GET", next_url, extra_headers=headers)
+                    page = orjson.loads(response.content)
+                    records.extend(page.get("records", []))
+                    next_url = page.get("nextRecordsUrl")
+                
+                # Process records to remove metadata
+                for record in records:
+                    record.pop("attributes", None)
+            processed_records = records
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Found {} records",
+                    args=(len(processed_records),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -152,14 +354,16 @@ class SalesforceQueryTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Query failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Query failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -171,7 +375,7 @@ class SalesforceQueryTool(BaseBusinessTool):
 
 
 @register_tool("salesforce", {"category": ToolCategory.CREATE, "priority": 2})
-class SalesforceCreateRecordTool(BaseBusinessTool):
+class SalesforceCreateRecordTool(_SalesforceTool):
     """Create new Salesforce records."""
     
     @property
@@ -182,54 +386,26 @@ class SalesforceCreateRecordTool(BaseBusinessTool):
     def description(self) -> str:
         return "Create new Salesforce records (Accounts, Contacts, Leads, Opportunities, etc.). Requires object type and field values."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["username", "password", "security_token", "client_id", "client_secret", "sandbox"]
-    
-    async def _get_access_token(self) -> str:
-        """Get Salesforce access token."""
-        creds = self.credentials.credentials
-        
-        login_url = "https://test.salesforce.com" if creds.get("sandbox", False) else "https://login.salesforce.com"
-        token_url = f"{login_url}/services/oauth2/token"
-        
-        data = {
-            "grant_type": "password",
-            "client_id": creds["client_id"],
-            "client_secret": creds["client_secret"],
-            "username": creds["username"],
-            "password": f"{creds['password']}{creds['security_token']}"
-        }
-        
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        
-        response = await self._make_request("POST", token_url, headers=headers, data=data)
-        token_data = response.json()
-        
-        return token_data["access_token"], token_data["instance_url"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting available objects."""
-        access_token, instance_url = await self._get_access_token()
+        _, instance_url = await self._get_access_token()
+        summary = _SOBJECTS_SUMMARIES.get(instance_url)
+        if summary is not None:
+            return dict(summary)
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"{instance_url}/services/data/v58.0/sobjects"
-        response = await self._make_request("GET", url, headers=headers)
-        sobjects = response.json()
+        response = await self._api_request("GET", f"{_API_PATH}/sobjects")
+        sobjects = orjson.loads(response.content)["sobjects"]
         
-        createable_objects = [
-            obj["name"] for obj in sobjects["sobjects"] 
-            if obj.get("createable", False)
-        ][:10]
+        createable_objects = list(islice(
+            (obj["name"] for obj in sobjects if obj.get("createable", False)), 10
+        ))
         
-        return {
+        summary = {
             "createable_objects": createable_objects,
-            "total_objects": len(sobjects["sobjects"])
+            "total_objects": len(sobjects)
         }
+        _SOBJECTS_SUMMARIES[instance_url] = summary
+        return dict(summary)
     
     async def execute(
         self, 
@@ -238,78 +414,97 @@ class SalesforceCreateRecordTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Create a new Salesforce record."""
-        start_time = datetime.now()
+        results = await self.execute_many([fields], object_type)
+        return results[0]
+    
+    async def execute_many(self, records: List[Dict[str, Any]], object_type: str) -> List[ToolExecutionResult]:
+        """
+        Create several records of ``object_type`` through the sObject Collections API.
         
-        try:
-            await self.emit_event(ToolExecutionEvent(
+        Records are sent up to 200 per request, concurrently. Each record
+        succeeds or fails on its own; results are returned in input order.
+        """
+        start_time = time.perf_counter()
+        
+        # Fetch the session while the request is being prepared
+        session = asyncio.create_task(self._get_access_token())
+        
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
                 type="start",
                 tool_name=self.tool_name,
-                message=f"Creating {object_type} record"
+                message="Creating {} {} record(s)",
+                args=(len(records), object_type)
             ))
-            
-            access_token, instance_url = await self._get_access_token()
-            
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Create record
-            create_url = f"{instance_url}/services/data/v58.0/sobjects/{object_type}"
-            
-            await self.emit_event(ToolExecutionEvent(
+        
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
                 type="progress",
                 tool_name=self.tool_name,
                 message="Submitting record creation..."
             ))
-            
-            response = await self._make_request("POST", create_url, headers=headers, data=fields)
-            result_data = response.json()
-            
-            record_id = result_data.get("id")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Created {object_type} with ID: {record_id}"
-            ))
-            
-            return ToolExecutionResult(
-                success=True,
-                data={
-                    "id": record_id,
-                    "object_type": object_type,
-                    "fields": fields,
-                    "success": result_data.get("success", True)
-                },
-                tool_name=self.tool_name,
-                execution_time=execution_time,
-                metadata={"action": "create", "object_type": object_type}
-            )
+        
+        try:
+            # An auth failure fails every record now instead of re-fetching per chunk
+            await session
+            outcomes = await self._save_collection("POST", object_type, records)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            results = [
+                ToolExecutionResult(
+                    success=error is None,
+                    data={
+                        "id": record_id,
+                        "object_type": object_type,
+                        "fields": fields,
+                        "success": error is None
+                    },
+                    error=error,
+                    tool_name=self.tool_name,
+                    execution_time=execution_time,
+                    metadata={"action": "create", "object_type": object_type}
+                )
+                for fields, (record_id, error) in zip(records, outcomes)
+            ]
+            created = sum(result.success for result in results)
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete" if created == len(results) else "error",
+                    tool_name=self.tool_name,
+                    message="Created {} of {} {} record(s)",
+                    args=(created, len(results), object_type)
+                ))
+            
+            return results
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Record creation failed: {error_msg}"
-            ))
-            
-            return ToolExecutionResult(
-                success=False,
-                error=error_msg,
-                tool_name=self.tool_name,
-                execution_time=execution_time,
-                metadata={"action": "create", "object_type": object_type}
-            )
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Record creation failed: {}",
+                    args=(error_msg,)
+                ))
+            
+            return [
+                ToolExecutionResult(
+                    success=False,
+                    error=error_msg,
+                    tool_name=self.tool_name,
+                    execution_time=execution_time,
+                    metadata={"action": "create", "object_type": object_type}
+                )
+                for _ in records
+            ]
 
 
 @register_tool("salesforce", {"category": ToolCategory.UPDATE, "priority": 3})
-class SalesforceUpdateRecordTool(BaseBusinessTool):
+class SalesforceUpdateRecordTool(_SalesforceTool):
     """Update existing Salesforce records."""
     
     @property
@@ -320,35 +515,9 @@ class SalesforceUpdateRecordTool(BaseBusinessTool):
     def description(self) -> str:
         return "Update existing Salesforce records. Requires record ID, object type, and fields to update."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["username", "password", "security_token", "client_id", "client_secret", "sandbox"]
-    
-    async def _get_access_token(self) -> str:
-        """Get Salesforce access token."""
-        creds = self.credentials.credentials
-        
-        login_url = "https://test.salesforce.com" if creds.get("sandbox", False) else "https://login.salesforce.com"
-        token_url = f"{login_url}/services/oauth2/token"
-        
-        data = {
-            "grant_type": "password",
-            "client_id": creds["client_id"],
-            "client_secret": creds["client_secret"],
-            "username": creds["username"],
-            "password": f"{creds['password']}{creds['security_token']}"
-        }
-        
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        
-        response = await self._make_request("POST", token_url, headers=headers, data=data)
-        token_data = response.json()
-        
-        return token_data["access_token"], token_data["instance_url"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
-        access_token, instance_url = await self._get_access_token()
+        _, instance_url = await self._get_access_token()
         return {"status": "connected", "instance_url": instance_url}
     
     async def execute(
@@ -359,71 +528,91 @@ class SalesforceUpdateRecordTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Update a Salesforce record."""
-        start_time = datetime.now()
+        results = await self.execute_many([{**fields, "Id": record_id}], object_type)
+        return results[0]
+    
+    async def execute_many(self, records: List[Dict[str, Any]], object_type: str) -> List[ToolExecutionResult]:
+        """
+        Update several records of ``object_type`` through the sObject Collections API.
         
-        try:
-            await self.emit_event(ToolExecutionEvent(
+        Every record carries its ``Id`` alongside the fields to change.
+        Records are sent up to 200 per request, concurrently. Each record
+        succeeds or fails on its own; results are returned in input order.
+        """
+        start_time = time.perf_counter()
+        
+        # Fetch the session while the request is being prepared
+        session = asyncio.create_task(self._get_access_token())
+        
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
                 type="start",
                 tool_name=self.tool_name,
-                message=f"Updating {object_type} record {record_id}"
+                message="Updating {} {} record(s)",
+                args=(len(records), object_type)
             ))
-            
-            access_token, instance_url = await self._get_access_token()
-            
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Update record
-            update_url = f"{instance_url}/services/data/v58.0/sobjects/{object_type}/{record_id}"
-            
-            await self.emit_event(ToolExecutionEvent(
+        
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
                 type="progress",
                 tool_name=self.tool_name,
                 message="Submitting record update..."
             ))
-            
-            response = await self._make_request("PATCH", update_url, headers=headers, data=fields)
-            
-            # 204 No Content indicates successful update
-            success = response.status_code == 204
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Successfully updated {object_type} record"
-            ))
-            
-            return ToolExecutionResult(
-                success=success,
-                data={
-                    "id": record_id,
-                    "object_type": object_type,
-                    "updated_fields": list(fields.keys()),
-                    "fields": fields
-                },
-                tool_name=self.tool_name,
-                execution_time=execution_time,
-                metadata={"action": "update", "object_type": object_type}
-            )
+        
+        try:
+            # An auth failure fails every record now instead of re-fetching per chunk
+            await session
+            outcomes = await self._save_collection("PATCH", object_type, records)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            results = []
+            for record, (_, error) in zip(records, outcomes):
+                fields = {key: value for key, value in record.items() if key != "Id"}
+                results.append(ToolExecutionResult(
+                    success=error is None,
+                    data={
+                        "id": record["Id"],
+                        "object_type": object_type,
+                        "updated_fields": list(fields.keys()),
+                        "fields": fields
+                    },
+                    error=error,
+                    tool_name=self.tool_name,
+                    execution_time=execution_time,
+                    metadata={"action": "update", "object_type": object_type}
+                ))
+            updated = sum(result.success for result in results)
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete" if updated == len(results) else "error",
+                    tool_name=self.tool_name,
+                    message="Updated {} of {} {} record(s)",
+                    args=(updated, len(results), object_type)
+                ))
+            
+            return results
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Record update failed: {error_msg}"
-            ))
-            
-            return ToolExecutionResult(
-                success=False,
-                error=error_msg,
-                tool_name=self.tool_name,
-                execution_time=execution_time,
-                metadata={"action": "update", "object_type": object_type}
-            )
\ No newline at end of file
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Record update failed: {}",
+                    args=(error_msg,)
+                ))
+            
+            return [
+                ToolExecutionResult(
+                    success=False,
+                    error=error_msg,
+                    tool_name=self.tool_name,
+                    execution_time=execution_time,
+                    metadata={"action": "update", "object_type": object_type}
+                )
+                for _ in records
+            ]
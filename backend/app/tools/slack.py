@@ -1,16 +1,129 @@
 """
 Slack API integration tools.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import hashlib
 import json
-from datetime import datetime
+import random
+import time
+from datetime import datetime, timezone
+from functools import cached_property
 
-from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
+import httpx
+import orjson
+
+from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory, AsyncTokenBucket
 from app.tools.registry import register_tool
 
+_API_URL = "https://slack.com/api/"
+
+# Slack's per-method rate limit tiers, as (calls, per seconds)
+_RATE_LIMIT_TIERS = {
+    "chat.postMessage": (5, 5.0),
+    "conversations.list": (20, 60.0),
+    "conversations.history": (50, 60.0),
+}
+# Client-side buckets per (method, token digest): Slack limits each workspace
+# separately, so one busy tenant must not throttle the others
+_RATE_LIMITS: Dict[Tuple[str, str], AsyncTokenBucket] = {}
+# Retries of a rate limited (429) call, each after the advertised Retry-After
+_RATE_LIMITED_RETRIES = 3
+
+# Slack recommends no more than 200 results per conversations.list page
+_CHANNEL_PAGE_SIZE = 200
+
+# Histories longer than this are post-processed in a worker thread
+_THREADED_PROCESSING_THRESHOLD = 500
+
+
+def _project_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce raw history entries to the returned fields, with UTC ISO-8601 timestamps."""
+    return [
+        {
+            "ts": message.get("ts"),
+            "user": message.get("user"),
+            "text": message.get("text", ""),
+            "type": message.get("type", "message"),
+            "subtype": message.get("subtype"),
+            "bot_id": message.get("bot_id"),
+            "username": message.get("username"),
+            "timestamp": datetime.fromtimestamp(float(message["ts"]), timezone.utc).isoformat() if message.get("ts") else None
+        }
+        for message in messages
+    ]
+
+
+def _project_channel(channel: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": channel.get("id"),
+        "name": channel.get("name"),
+        "is_private": channel.get("is_private", False),
+        "is_archived": channel.get("is_archived", False),
+        "is_general": channel.get("is_general", False),
+        "num_members": channel.get("num_members", 0),
+        "topic": channel.get("topic", {}).get("value", ""),
+        "purpose": channel.get("purpose", {}).get("value", ""),
+        "created": channel.get("created")
+    }
+
+
+class _SlackTool(BaseBusinessTool):
+    """Shared credential handling for the Slack tools."""
+    
+    _credential_caches = ("_headers", "_token_digest")
+    
+    @property
+    def required_credentials(self) -> List[str]:
+        return ["bot_token"]
+    
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, built once per credentials. Do not mutate."""
+        return {
+            "Authorization": f"Bearer {self.credentials.credentials['bot_token']}",
+            "Content-Type": "application/json"
+        }
+    
+    @cached_property
+    def _token_digest(self) -> str:
+        """Digest identifying the Slack workspace token in rate limit keys."""
+        return hashlib.sha256(self.credentials.credentials["bot_token"].encode()).hexdigest()
+    
+    def _rate_limit(self, api_method: str) -> Optional[AsyncTokenBucket]:
+        """Return this token's bucket for ``api_method``, if the method is limited."""
+        tier = _RATE_LIMIT_TIERS.get(api_method)
+        if tier is None:
+            return None
+        key = (api_method, self._token_digest)
+        bucket = _RATE_LIMITS.get(key)
+        if bucket is None:
+            bucket = _RATE_LIMITS.setdefault(key, AsyncTokenBucket(*tier))
+        return bucket
+    
+    async def _call(self, http_method: str, api_method: str, **kwargs) -> httpx.Response:
+        """
+        Call the Slack Web API method ``api_method``.
+        
+        Calls wait for the token's rate limit bucket for the method, and a 429 response is
+        retried after its Retry-After delay (plus jitter) up to three times.
+        """
+        bucket = self._rate_limit(api_method)
+        for attempt in range(_RATE_LIMITED_RETRIES + 1):
+            if bucket is not None:
+                await bucket.acquire()
+            response = await self._make_request(
+                http_method, _API_URL + api_method, headers=self._headers, allow_status=(429,), **kwargs
+            )
+            if response.status_code != 429 or attempt == _RATE_LIMITED_RETRIES:
+                break
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)) + random.uniform(0, 1))
+        response.raise_for_status()
+        return response
+
 
 @register_tool("slack", {"category": ToolCategory.COMMUNICATION, "priority": 1})
-class SlackSendMessageTool(BaseBusinessTool):
+class SlackSendMessageTool(_SlackTool):
     """Send messages to Slack channels or users."""
     
     @property
@@ -21,21 +134,10 @@ class SlackSendMessageTool(BaseBusinessTool):
     def description(self) -> str:
         return "Send messages to Slack channels or direct messages to users. Supports rich formatting, mentions, and attachments."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["bot_token"]
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test Slack connection by getting bot info."""
-        headers = {
-            "Authorization": f"Bearer {self.credentials.credentials['bot_token']}",
-            "Content-Type": "application/json"
-        }
-        
-        url = "https://slack.com/api/auth.test"
-        
-        response = await self._make_request("POST", url, headers=headers)
-        auth_data = response.json()
+        response = await self._call("POST", "auth.test")
+        auth_data = orjson.loads(response.content)
         
         if not auth_data.get("ok"):
             raise ValueError(f"Slack auth failed: {auth_data.get('error', 'Unknown error')}")
@@ -57,19 +159,16 @@ class SlackSendMessageTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Send a message to Slack."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Sending message to {channel}"
-            ))
-            
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['bot_token']}",
-                "Content-Type": "application/json"
-            }
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Sending message to {}",
+                    args=(channel,)
+                ))
             
             # Build message payload
             message_data = {
@@ -86,35 +185,38 @@ class SlackSendMessageTool(BaseBusinessTool):
             if attachments:
                 message_data["attachments"] = attachments
             
-            url = "https://slack.com/api/chat.postMessage"
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Sending message to Slack..."
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Sending message to Slack..."
+                ))
             
-            response = await self._make_request("POST", url, headers=headers, data=message_data)
-            result_data = response.json()
+            response = await self._call("POST", "chat.postMessage", content=orjson.dumps(message_data))
+            result_data = orjson.loads(response.content)
             
             if not result_data.get("ok"):
                 raise ValueError(f"Slack API error: {result_data.get('error', 'Unknown error')}")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message="Message sent successfully"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Message sent successfully"
+                ))
+            
+            message_ts = result_data.get("ts")
+            posted_channel = result_data.get("channel")
             
             return ToolExecutionResult(
                 success=True,
                 data={
-                    "message_ts": result_data.get("ts"),
-                    "channel": result_data.get("channel"),
+                    "message_ts": message_ts,
+                    "channel": posted_channel,
                     "text": text,
-                    "permalink": f"https://slack.com/archives/{result_data.get('channel')}/p{result_data.get('ts', '').replace('.', '')}"
+                    "permalink": f"https://slack.com/archives/{posted_channel}/p{(message_ts or '').replace('.', '')}"
                 },
                 tool_name=self.tool_name,
                 execution_time=execution_time,
@@ -122,14 +224,16 @@ class SlackSendMessageTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Message sending failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Message sending failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -141,7 +245,7 @@ class SlackSendMessageTool(BaseBusinessTool):
 
 
 @register_tool("slack", {"category": ToolCategory.READ, "priority": 2})
-class SlackGetChannelsTool(BaseBusinessTool):
+class SlackGetChannelsTool(_SlackTool):
     """Get list of Slack channels."""
     
     @property
@@ -152,14 +256,21 @@ class SlackGetChannelsTool(BaseBusinessTool):
     def description(self) -> str:
         return "Get a list of Slack channels that the bot has access to, including public channels, private channels, and DMs."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["bot_token"]
+    _trivial_test = True
     
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
         return {"status": "connected"}
     
+    async def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of conversations.list."""
+        response = await self._call("GET", "conversations.list", params=params)
+        result_data = orjson.loads(response.content)
+        
+        if not result_data.get("ok"):
+            raise ValueError(f"Slack API error: {result_data.get('error', 'Unknown error')}")
+        return result_data
+    
     async def execute(
         self, 
         types: str = "public_channel,private_channel",
@@ -167,61 +278,53 @@ class SlackGetChannelsTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Get Slack channels."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Getting Slack channels"
-            ))
-            
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['bot_token']}",
-                "Content-Type": "application/json"
-            }
-            
-            url = "https://slack.com/api/conversations.list"
-            params = {
-                "types": types,
-                "limit": limit
-            }
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Fetching channel list..."
-            ))
-            
-            response = await self._make_request("GET", url, headers=headers, params=params)
-            result_data = response.json()
-            
-            if not result_data.get("ok"):
-                raise ValueError(f"Slack API error: {result_data.get('error', 'Unknown error')}")
-            
-            # Process channels
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Getting Slack channels"
+                ))
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Fetching channel list..."
+                ))
+            
+            # Slack pages on an opaque cursor, so pages are fetched in turn;
+            # the next one is requested before the current one is processed
             channels = []
-            for channel in result_data.get("channels", []):
-                channel_info = {
-                    "id": channel.get("id"),
-                    "name": channel.get("name"),
-                    "is_private": channel.get("is_private", False),
-                    "is_archived": channel.get("is_archived", False),
-                    "is_general": channel.get("is_general", False),
-                    "num_members": channel.get("num_members", 0),
-                    "topic": channel.get("topic", {}).get("value", ""),
-                    "purpose": channel.get("purpose", {}).get("value", ""),
-                    "created": channel.get("created")
-                }
-                channels.append(channel_info)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Retrieved {len(channels)} channels"
-            ))
+            page = await self._fetch_page({"types": types, "limit": min(limit, _CHANNEL_PAGE_SIZE)})
+            while True:
+                page_channels = page.get("channels", [])
+                cursor = page.get("response_metadata", {}).get("next_cursor")
+                remaining = limit - len(channels) - len(page_channels)
+                next_page = None
+                if cursor and remaining > 0:
+                    next_page = asyncio.create_task(self._fetch_page({
+                        "types": types,
+                        "limit": min(remaining, _CHANNEL_PAGE_SIZE),
+                        "cursor": cursor
+                    }))
+                channels.extend(_project_channel(channel) for channel in page_channels)
+                if next_page is None:
+                    break
+                page = await next_page
+            del channels[limit:]
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Retrieved {} channels",
+                    args=(len(channels),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -235,14 +338,16 @@ class SlackGetChannelsTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Failed to get channels: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Failed to get channels: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -254,7 +359,7 @@ class SlackGetChannelsTool(BaseBusinessTool):
 
 
 @register_tool("slack", {"category": ToolCategory.READ, "priority": 3})
-class SlackGetMessagesTool(BaseBusinessTool):
+class SlackGetMessagesTool(_SlackTool):
     """Get messages from a Slack channel."""
     
     @property
@@ -265,9 +370,7 @@ class SlackGetMessagesTool(BaseBusinessTool):
     def description(self) -> str:
         return "Get recent messages from a Slack channel. Can retrieve message history with timestamps, users, and content."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["bot_token"]
+    _trivial_test = True
     
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
@@ -282,21 +385,17 @@ class SlackGetMessagesTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Get messages from a Slack channel."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Getting messages from {channel}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Getting messages from {}",
+                    args=(channel,)
+                ))
             
-            headers = {
-                "Authorization": f"Bearer {self.credentials.credentials['bot_token']}",
-                "Content-Type": "application/json"
-            }
-            
-            url = "https://slack.com/api/conversations.history"
             params = {
                 "channel": channel,
                 "limit": limit
@@ -307,40 +406,35 @@ class SlackGetMessagesTool(BaseBusinessTool):
             if latest:
                 params["latest"] = latest
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Fetching message history..."
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="progress",
+                    tool_name=self.tool_name,
+                    message="Fetching message history..."
+                ))
             
-            response = await self._make_request("GET", url, headers=headers, params=params)
-            result_data = response.json()
+            response = await self._call("GET", "conversations.history", params=params)
+            result_data = orjson.loads(response.content)
             
             if not result_data.get("ok"):
                 raise ValueError(f"Slack API error: {result_data.get('error', 'Unknown error')}")
             
-            # Process messages
-            messages = []
-            for message in result_data.get("messages", []):
-                message_info = {
-                    "ts": message.get("ts"),
-                    "user": message.get("user"),
-                    "text": message.get("text", ""),
-                    "type": message.get("type", "message"),
-                    "subtype": message.get("subtype"),
-                    "bot_id": message.get("bot_id"),
-                    "username": message.get("username"),
-                    "timestamp": datetime.fromtimestamp(float(message.get("ts", 0))).isoformat() if message.get("ts") else None
-                }
-                messages.append(message_info)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Retrieved {len(messages)} messages"
-            ))
+            # Process messages; large histories are formatted off the event loop
+            raw_messages = result_data.get("messages", [])
+            if len(raw_messages) > _THREADED_PROCESSING_THRESHOLD:
+                messages = await asyncio.to_thread(_project_messages, raw_messages)
+            else:
+                messages = _project_messages(raw_messages)
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Retrieved {} messages",
+                    args=(len(messages),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -355,14 +449,16 @@ class SlackGetMessagesTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Failed to get messages: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Failed to get messages: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
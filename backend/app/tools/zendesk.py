@@ -1,17 +1,118 @@
 """
 Zendesk API integration tools.
 """
-from typing import Dict, Any, List, Optional
-import json
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import base64
-from datetime import datetime
+import time
+from functools import cached_property, lru_cache
+
+import orjson
 
 from app.tools.base import BaseBusinessTool, ToolExecutionResult, ToolExecutionEvent, ToolCategory
 from app.tools.registry import register_tool
 
+# update_many accepts at most 100 tickets per request
+_UPDATE_MANY_SIZE = 100
+
+
+def _ticket_updates(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee_email: Optional[str] = None,
+    comment: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the ``ticket`` body of an update from the update tool's arguments."""
+    ticket_updates: Dict[str, Any] = {}
+    
+    if status:
+        ticket_updates["status"] = status
+    
+    if priority:
+        ticket_updates["priority"] = priority
+    
+    if assignee_email:
+        ticket_updates["assignee"] = {"email": assignee_email}
+    
+    if tags:
+        ticket_updates["tags"] = tags
+    
+    if comment:
+        ticket_updates["comment"] = {
+            "body": comment,
+            "public": True
+        }
+    
+    return ticket_updates
+
+
+@lru_cache(maxsize=16)
+def _search_template(typed: bool, has_query: bool, has_status: bool, has_priority: bool) -> str:
+    """Search query template for one combination of search arguments."""
+    parts = []
+    if typed:
+        parts.append("type:ticket")
+    if has_query:
+        parts.append("{query}")
+    if has_status:
+        parts.append("status:{status}")
+    if has_priority:
+        parts.append("priority:{priority}")
+    return " ".join(parts)
+
+
+def _project_ticket(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": result.get("id"),
+        "subject": result.get("subject"),
+        "description": result.get("description"),
+        "status": result.get("status"),
+        "priority": result.get("priority"),
+        "type": result.get("type"),
+        "requester_id": result.get("requester_id"),
+        "assignee_id": result.get("assignee_id"),
+        "created_at": result.get("created_at"),
+        "updated_at": result.get("updated_at"),
+        "url": result.get("url"),
+        "tags": result.get("tags", [])
+    }
+
+
+class _ZendeskTool(BaseBusinessTool):
+    """Shared credential handling for the Zendesk tools."""
+    
+    _credential_caches = ("_auth_header", "_headers", "_base_url", "_api_url")
+    
+    @property
+    def required_credentials(self) -> List[str]:
+        return ["subdomain", "email", "api_token"]
+    
+    @cached_property
+    def _auth_header(self) -> str:
+        creds = self.credentials.credentials
+        token = base64.b64encode(f"{creds['email']}/token:{creds['api_token']}".encode()).decode()
+        return f"Basic {token}"
+    
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, built once per credentials. Do not mutate."""
+        return {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json"
+        }
+    
+    @cached_property
+    def _base_url(self) -> str:
+        return f"https://{self.credentials.credentials['subdomain']}.zendesk.com"
+    
+    @cached_property
+    def _api_url(self) -> str:
+        return f"{self._base_url}/api/v2"
+
 
 @register_tool("zendesk", {"category": ToolCategory.SEARCH, "priority": 1})
-class ZendeskSearchTicketsTool(BaseBusinessTool):
+class ZendeskSearchTicketsTool(_ZendeskTool):
     """Search and retrieve Zendesk tickets."""
     
     @property
@@ -22,35 +123,19 @@ class ZendeskSearchTicketsTool(BaseBusinessTool):
     def description(self) -> str:
         return "Search Zendesk tickets by status, priority, requester, or custom queries. Returns ticket details including ID, subject, status, priority, and more."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["subdomain", "email", "api_token"]
-    
-    async def _get_auth_header(self) -> str:
-        """Get basic auth header for Zendesk API."""
-        creds = self.credentials.credentials
-        auth_string = f"{creds['email']}/token:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        return f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test Zendesk connection."""
         creds = self.credentials.credentials
         
-        headers = {
-            "Authorization": await self._get_auth_header(),
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://{creds['subdomain']}.zendesk.com/api/v2/account/settings.json"
+        url = f"{self._api_url}/account/settings.json"
         
-        response = await self._make_request("GET", url, headers=headers)
-        settings = response.json()
+        response = await self._make_request("GET", url, headers=self._headers)
+        settings = orjson.loads(response.content)
         
         return {
             "account": settings.get("settings", {}).get("branding", {}).get("title", "Unknown"),
             "subdomain": creds['subdomain'],
-            "url": f"https://{creds['subdomain']}.zendesk.com"
+            "url": self._base_url
         }
     
     async def execute(
@@ -62,85 +147,55 @@ class ZendeskSearchTicketsTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Search Zendesk tickets."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Searching Zendesk tickets"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            headers = {
-                "Authorization": await self._get_auth_header(),
-                "Content-Type": "application/json"
-            }
-            
-            # Build search query
-            search_query_parts = []
-            
-            if query:
-                search_query_parts.append(query)
-            
-            if status:
-                search_query_parts.append(f"status:{status}")
-            
-            if priority:
-                search_query_parts.append(f"priority:{priority}")
-            
-            search_query = " ".join(search_query_parts) if search_query_parts else "type:ticket"
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Searching Zendesk tickets"
+                ))
+            
+            # Build search query; restricting it to tickets keeps users,
+            # organizations and groups out of the response entirely
+            search_query = _search_template(
+                "type:ticket" not in query, bool(query), bool(status), bool(priority)
+            ).format(query=query, status=status, priority=priority)
             
             # Use search API
-            url = f"https://{creds['subdomain']}.zendesk.com/api/v2/search.json"
+            url = f"{self._api_url}/search.json"
             params = {
                 "query": search_query,
                 "per_page": per_page
             }
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Executing ticket search..."
-            ))
-            
-            response = await self._make_request("GET", url, headers=headers, params=params)
-            result_data = response.json()
-            
-            # Process tickets
-            tickets = []
-            for result in result_data.get("results", []):
-                if result.get("result_type") == "ticket":
-                    ticket = {
-                        "id": result.get("id"),
-                        "subject": result.get("subject"),
-                        "description": result.get("description"),
-                        "status": result.get("status"),
-                        "priority": result.get("priority"),
-                        "type": result.get("type"),
-                        "requester_id": result.get("requester_id"),
-                        "assignee_id": result.get("assignee_id"),
-                        "created_at": result.get("created_at"),
-                        "updated_at": result.get("updated_at"),
-                        "url": result.get("url"),
-                        "tags": result.get("tags", [])
-                    }
-                    tickets.append(ticket)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Found {len(tickets)} tickets"
-            ))
+            # Tickets are projected as the response streams in; top-level
+            # fields such as the total count are collected into meta
+            meta: Dict[str, Any] = {}
+            tickets = [
+                _project_ticket(result)
+                async for result in self._stream_json_items(
+                    "GET", url, "results.item", headers=self._headers, params=params, meta=meta
+                )
+                if result.get("result_type") == "ticket"
+            ]
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Found {} tickets",
+                    args=(len(tickets),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
                 data={
                     "tickets": tickets,
-                    "total_count": result_data.get("count", 0),
+                    "total_count": meta.get("count", 0),
                     "query": search_query
                 },
                 tool_name=self.tool_name,
@@ -149,14 +204,16 @@ class ZendeskSearchTicketsTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Ticket search failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Ticket search failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -168,7 +225,7 @@ class ZendeskSearchTicketsTool(BaseBusinessTool):
 
 
 @register_tool("zendesk", {"category": ToolCategory.CREATE, "priority": 2})
-class ZendeskCreateTicketTool(BaseBusinessTool):
+class ZendeskCreateTicketTool(_ZendeskTool):
     """Create new Zendesk tickets."""
     
     @property
@@ -179,30 +236,12 @@ class ZendeskCreateTicketTool(BaseBusinessTool):
     def description(self) -> str:
         return "Create a new Zendesk ticket. Requires subject and description, optionally priority, type, and requester information."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["subdomain", "email", "api_token"]
-    
-    async def _get_auth_header(self) -> str:
-        """Get basic auth header."""
-        creds = self.credentials.credentials
-        auth_string = f"{creds['email']}/token:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        return f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
-    
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test by getting ticket fields."""
-        creds = self.credentials.credentials
-        
-        headers = {
-            "Authorization": await self._get_auth_header(),
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://{creds['subdomain']}.zendesk.com/api/v2/ticket_fields.json"
+        url = f"{self._api_url}/ticket_fields.json"
         
-        response = await self._make_request("GET", url, headers=headers)
-        fields = response.json()
+        response = await self._make_request("GET", url, headers=self._headers)
+        fields = orjson.loads(response.content)
         
         return {
             "available_fields": len(fields.get("ticket_fields", [])),
@@ -220,21 +259,15 @@ class ZendeskCreateTicketTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Create a new Zendesk ticket."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message="Creating Zendesk ticket"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            headers = {
-                "Authorization": await self._get_auth_header(),
-                "Content-Type": "application/json"
-            }
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Creating Zendesk ticket"
+                ))
             
             # Build ticket data
             ticket_data = {
@@ -254,26 +287,22 @@ class ZendeskCreateTicketTool(BaseBusinessTool):
             
             payload = {"ticket": ticket_data}
             
-            url = f"https://{creds['subdomain']}.zendesk.com/api/v2/tickets.json"
-            
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Submitting ticket creation..."
-            ))
+            url = f"{self._api_url}/tickets.json"
             
-            response = await self._make_request("POST", url, headers=headers, data=payload)
-            result_data = response.json()
+            response = await self._make_request("POST", url, headers=self._headers, data=payload)
+            result_data = orjson.loads(response.content)
             
             ticket = result_data.get("ticket", {})
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Created ticket #{ticket.get('id')}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Created ticket #{}",
+                    args=(ticket.get("id"),)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -292,14 +321,16 @@ class ZendeskCreateTicketTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
-                tool_name=self.tool_name,
-                message=f"Ticket creation failed: {error_msg}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Ticket creation failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
@@ -311,7 +342,7 @@ class ZendeskCreateTicketTool(BaseBusinessTool):
 
 
 @register_tool("zendesk", {"category": ToolCategory.UPDATE, "priority": 3})
-class ZendeskUpdateTicketTool(BaseBusinessTool):
+class ZendeskUpdateTicketTool(_ZendeskTool):
     """Update existing Zendesk tickets."""
     
     @property
@@ -322,16 +353,7 @@ class ZendeskUpdateTicketTool(BaseBusinessTool):
     def description(self) -> str:
         return "Update an existing Zendesk ticket. Can modify status, priority, assignee, add comments, and update other fields."
     
-    @property
-    def required_credentials(self) -> List[str]:
-        return ["subdomain", "email", "api_token"]
-    
-    async def _get_auth_header(self) -> str:
-        """Get basic auth header."""
-        creds = self.credentials.credentials
-        auth_string = f"{creds['email']}/token:{creds['api_token']}"
-        auth_bytes = auth_string.encode('utf-8')
-        return f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+    _trivial_test = True
     
     async def _test_connection_impl(self) -> Dict[str, Any]:
         """Test connection."""
@@ -348,65 +370,38 @@ class ZendeskUpdateTicketTool(BaseBusinessTool):
         **kwargs
     ) -> ToolExecutionResult:
         """Update a Zendesk ticket."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            await self.emit_event(ToolExecutionEvent(
-                type="start",
-                tool_name=self.tool_name,
-                message=f"Updating Zendesk ticket #{ticket_id}"
-            ))
-            
-            creds = self.credentials.credentials
-            
-            headers = {
-                "Authorization": await self._get_auth_header(),
-                "Content-Type": "application/json"
-            }
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Updating Zendesk ticket #{}",
+                    args=(ticket_id,)
+                ))
             
             # Build update data
-            ticket_updates = {}
-            
-            if status:
-                ticket_updates["status"] = status
-            
-            if priority:
-                ticket_updates["priority"] = priority
-            
-            if assignee_email:
-                ticket_updates["assignee"] = {"email": assignee_email}
-            
-            if tags:
-                ticket_updates["tags"] = tags
-            
-            if comment:
-                ticket_updates["comment"] = {
-                    "body": comment,
-                    "public": True
-                }
+            ticket_updates = _ticket_updates(status, priority, assignee_email, comment, tags)
             
             payload = {"ticket": ticket_updates}
             
-            url = f"https://{creds['subdomain']}.zendesk.com/api/v2/tickets/{ticket_id}.json"
+            url = f"{self._api_url}/tickets/{ticket_id}.json"
             
-            await self.emit_event(ToolExecutionEvent(
-                type="progress",
-                tool_name=self.tool_name,
-                message="Submitting ticket update..."
-            ))
-            
-            response = await self._make_request("PUT", url, headers=headers, data=payload)
-            result_data = response.json()
+            response = await self._make_request("PUT", url, headers=self._headers, data=payload)
+            result_data = orjson.loads(response.content)
             
             ticket = result_data.get("ticket", {})
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            await self.emit_event(ToolExecutionEvent(
-                type="complete",
-                tool_name=self.tool_name,
-                message=f"Successfully updated ticket #{ticket_id}"
-            ))
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="complete",
+                    tool_name=self.tool_name,
+                    message="Successfully updated ticket #{}",
+                    args=(ticket_id,)
+                ))
             
             return ToolExecutionResult(
                 success=True,
@@ -423,19 +418,234 @@ class ZendeskUpdateTicketTool(BaseBusinessTool):
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             
-            await self.emit_event(ToolExecutionEvent(
-                type="error",
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Ticket update failed: {}",
+                    args=(error_msg,)
+                ))
+            
+            return ToolExecutionResult(
+                success=False,
+                error=error_msg,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "update", "ticket_id": ticket_id}
+            )
+    
+    async def execute_many(self, updates: List[Dict[str, Any]]) -> List[ToolExecutionResult]:
+        """
+        Update several tickets through the update_many endpoint.
+        
+        Each entry holds ``ticket_id`` plus the ``execute`` arguments. Tickets
+        getting identical changes share ``?ids=`` requests; the others are
+        sent together as per-ticket bodies, up to 100 tickets per request.
+        Zendesk applies bulk updates in a background job, so each result
+        carries that job's status rather than the updated ticket. A single
+        update is applied directly through ``execute``; updates without a
+        ``ticket_id`` fail without being sent.
+        """
+        results: List[Optional[ToolExecutionResult]] = [None] * len(updates)
+        
+        # Updates without a ticket to apply to fail on their own, before any
+        # request is built
+        valid = []
+        for index, update in enumerate(updates):
+            if update.get("ticket_id") is None:
+                results[index] = ToolExecutionResult(
+                    success=False,
+                    error="An update needs a ticket_id",
+                    tool_name=self.tool_name,
+                    execution_time=0.0,
+                    metadata={"action": "update_many", "ticket_id": None}
+                )
+            else:
+                valid.append(index)
+        
+        if len(updates) == 1 and valid:
+            return [await self.execute(**updates[0])]
+        
+        start_time = time.perf_counter()
+        
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
+                type="start",
                 tool_name=self.tool_name,
-                message=f"Ticket update failed: {error_msg}"
+                message="Updating {} Zendesk tickets",
+                args=(len(updates),)
             ))
+        
+        changes = {
+            index: _ticket_updates(
+                updates[index].get("status"), updates[index].get("priority"), updates[index].get("assignee_email"),
+                updates[index].get("comment"), updates[index].get("tags")
+            )
+            for index in valid
+        }
+        
+        # Indices of the updates making each distinct change
+        groups: Dict[bytes, List[int]] = {}
+        for index, change in changes.items():
+            groups.setdefault(orjson.dumps(change, option=orjson.OPT_SORT_KEYS), []).append(index)
+        shared = [indices for indices in groups.values() if len(indices) > 1]
+        individual = [indices[0] for indices in groups.values() if len(indices) == 1]
+        
+        # Request arguments per chunk; the requests themselves are only
+        # created inside gather below
+        url = f"{self._api_url}/tickets/update_many.json"
+        batches: List[Tuple[List[int], Dict[str, Any]]] = []
+        for indices in shared:
+            for start in range(0, len(indices), _UPDATE_MANY_SIZE):
+                chunk = indices[start:start + _UPDATE_MANY_SIZE]
+                batches.append((chunk, {
+                    "params": {"ids": ",".join(str(updates[index]["ticket_id"]) for index in chunk)},
+                    "data": {"ticket": changes[chunk[0]]}
+                }))
+        for start in range(0, len(individual), _UPDATE_MANY_SIZE):
+            chunk = individual[start:start + _UPDATE_MANY_SIZE]
+            batches.append((chunk, {
+                "data": {"tickets": [{"id": updates[index]["ticket_id"], **changes[index]} for index in chunk]}
+            }))
+        
+        responses = await asyncio.gather(
+            *(self._make_request("PUT", url, headers=self._headers, **request) for _, request in batches),
+            return_exceptions=True
+        )
+        execution_time = time.perf_counter() - start_time
+        
+        for (chunk, _), response in zip(batches, responses):
+            error = response if isinstance(response, Exception) else None
+            job: Dict[str, Any] = {}
+            if error is None:
+                try:
+                    job = orjson.loads(response.content).get("job_status") or {}
+                except Exception as e:
+                    error = e
+            for index in chunk:
+                ticket_id = updates[index]["ticket_id"]
+                if error is not None:
+                    results[index] = ToolExecutionResult(
+                        success=False,
+                        error=str(error),
+                        tool_name=self.tool_name,
+                        execution_time=execution_time,
+                        metadata={"action": "update_many", "ticket_id": ticket_id}
+                    )
+                else:
+                    results[index] = ToolExecutionResult(
+                        success=True,
+                        data={
+                            "ticket_id": ticket_id,
+                            "job_id": job.get("id"),
+                            "job_status": job.get("status"),
+                            "updated_fields": list(changes[index].keys())
+                        },
+                        tool_name=self.tool_name,
+                        execution_time=execution_time,
+                        metadata={"action": "update_many", "ticket_id": ticket_id}
+                    )
+        
+        failed = sum(not result.success for result in results)
+        if self._events_enabled:
+            self.emit_event_nowait(ToolExecutionEvent(
+                type="error" if failed else "complete",
+                tool_name=self.tool_name,
+                message="Submitted updates for {} of {} tickets",
+                args=(len(updates) - failed, len(updates))
+            ))
+        
+        return results
+
+
+@register_tool("zendesk", {"category": ToolCategory.UPDATE, "priority": 4})
+class ZendeskBulkUpdateTicketsTool(_ZendeskTool):
+    """Update many Zendesk tickets in one go."""
+    
+    @property
+    def tool_name(self) -> str:
+        return "zendesk_bulk_update_tickets"
+    
+    @property
+    def description(self) -> str:
+        return "Update several Zendesk tickets at once. Takes a list of updates, each with a ticket_id and optional status, priority, assignee_email, comment and tags."
+    
+    _trivial_test = True
+    
+    async def _test_connection_impl(self) -> Dict[str, Any]:
+        """Test connection."""
+        return {"status": "connected"}
+    
+    async def execute(self, updates: List[Dict[str, Any]], **kwargs) -> ToolExecutionResult:
+        """Apply ``updates`` through ZendeskUpdateTicketTool.execute_many."""
+        start_time = time.perf_counter()
+        
+        try:
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="start",
+                    tool_name=self.tool_name,
+                    message="Updating {} Zendesk tickets",
+                    args=(len(updates),)
+                ))
+            
+            missing = [index for index, update in enumerate(updates) if update.get("ticket_id") is None]
+            if missing:
+                raise ValueError(f"Updates at positions {missing} have no ticket_id")
+            
+            results = await ZendeskUpdateTicketTool(self.credentials, timeout=self.timeout).execute_many(updates)
+            
+            failed = {
+                update["ticket_id"]: result.error
+                for update, result in zip(updates, results) if not result.success
+            }
+            job_ids = list(dict.fromkeys(
+                result.data["job_id"] for result in results
+                if result.success and result.data and result.data.get("job_id") is not None
+            ))
+            
+            execution_time = time.perf_counter() - start_time
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error" if failed else "complete",
+                    tool_name=self.tool_name,
+                    message="Submitted updates for {} of {} tickets",
+                    args=(len(updates) - len(failed), len(updates))
+                ))
+            
+            return ToolExecutionResult(
+                success=not failed,
+                data={
+                    "ticket_ids": [update["ticket_id"] for update in updates],
+                    "job_ids": job_ids,
+                    "failed": failed
+                },
+                error=f"{len(failed)} ticket updates failed" if failed else None,
+                tool_name=self.tool_name,
+                execution_time=execution_time,
+                metadata={"action": "bulk_update", "ticket_count": len(updates)}
+            )
+            
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
+            error_msg = str(e)
+            
+            if self._events_enabled:
+                self.emit_event_nowait(ToolExecutionEvent(
+                    type="error",
+                    tool_name=self.tool_name,
+                    message="Bulk ticket update failed: {}",
+                    args=(error_msg,)
+                ))
             
             return ToolExecutionResult(
                 success=False,
                 error=error_msg,
                 tool_name=self.tool_name,
                 execution_time=execution_time,
-                metadata={"action": "update", "ticket_id": ticket_id}
-            )
\ No newline at end of file
+                metadata={"action": "bulk_update", "ticket_count": len(updates)}
+            )
@@ -35,38 +35,76 @@ def create_indexes():
             # Integration table indexes
             "CREATE INDEX IF NOT EXISTS idx_integrations_type ON integrations(integration_type)",
             "CREATE INDEX IF NOT EXISTS idx_integrations_status ON integrations(status)",
-            "CREATE INDEX IF NOT EXISTS idx_integrations_owner_id ON integrations(owner_id)",
-            "CREATE INDEX IF NOT EXISTS idx_integrations_tenant_id ON integrations(tenant_id)",
             "CREATE INDEX IF NOT EXISTS idx_integrations_created_at ON integrations(created_at)",
             "CREATE INDEX IF NOT EXISTS idx_integrations_health_status ON integrations(health_status)",
-            "CREATE INDEX IF NOT EXISTS idx_integrations_owner_status ON integrations(owner_id, status)",
-            "CREATE INDEX IF NOT EXISTS idx_integrations_tenant_type ON integrations(tenant_id, integration_type)",
+            # Composites named as in the models' __table_args__, so databases
+            # built by create_all and by this script end up with one copy each
+            "CREATE INDEX IF NOT EXISTS idx_integration_owner_status ON integrations(owner_id, status)",
+            "CREATE INDEX IF NOT EXISTS idx_integration_tenant_type ON integrations(tenant_id, integration_type)",
             
             # Chat session indexes
             "CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_id ON chat_sessions(user_id)",
             "CREATE INDEX IF NOT EXISTS idx_chat_sessions_status ON chat_sessions(status)",
-            "CREATE INDEX IF NOT EXISTS idx_chat_sessions_tenant_id ON chat_sessions(tenant_id)",
             "CREATE INDEX IF NOT EXISTS idx_chat_sessions_created_at ON chat_sessions(created_at)",
-            "CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_status ON chat_sessions(user_id, status)",
+            "CREATE INDEX IF NOT EXISTS idx_chat_session_user_status ON chat_sessions(user_id, status)",
             
             # Chat message indexes
-            "CREATE INDEX IF NOT EXISTS idx_chat_messages_session_id ON chat_messages(session_id)",
             "CREATE INDEX IF NOT EXISTS idx_chat_messages_message_type ON chat_messages(message_type)",
             "CREATE INDEX IF NOT EXISTS idx_chat_messages_role ON chat_messages(role)",
-            "CREATE INDEX IF NOT EXISTS idx_chat_messages_tenant_id ON chat_messages(tenant_id)",
             "CREATE INDEX IF NOT EXISTS idx_chat_messages_created_at ON chat_messages(created_at)",
-            "CREATE INDEX IF NOT EXISTS idx_chat_messages_session_created ON chat_messages(session_id, created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_chat_message_session_created ON chat_messages(session_id, created_at)",
         ]
         
-        created_count = 0
-        for index_query in indexes:
-            try:
-                cursor.execute(index_query)
-                created_count += 1
-                print(f"✓ Created index: {index_query.split()[-1].split('(')[0]}")
-            except sqlite3.Error as e:
-                print(f"✗ Failed to create index: {e}")
+        # Earlier copies of the composites above under script-only names, the
+        # single-column prefixes they make redundant, copies of the models'
+        # ix_*_tenant_id indexes, and wide covering indexes no query reads
+        # from; each only adds write cost
+        obsolete_indexes = [
+            "DROP INDEX IF EXISTS idx_integrations_tenant_id",
+            "DROP INDEX IF EXISTS idx_chat_sessions_tenant_id",
+            "DROP INDEX IF EXISTS idx_chat_messages_tenant_id",
+            "DROP INDEX IF EXISTS idx_integrations_owner_id",
+            "DROP INDEX IF EXISTS idx_integrations_owner_status",
+            "DROP INDEX IF EXISTS idx_integrations_owner_listing",
+            "DROP INDEX IF EXISTS idx_integrations_tenant_type",
+            "DROP INDEX IF EXISTS idx_chat_sessions_user_status",
+            "DROP INDEX IF EXISTS idx_chat_messages_session_id",
+            "DROP INDEX IF EXISTS idx_chat_messages_session_created",
+            "DROP INDEX IF EXISTS idx_chat_messages_session_history",
+        ]
+        
+        # WAL and relaxed syncing keep the DDL from fsyncing per statement;
+        # the other pragmas only last for this connection
+        cursor.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+            "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-200000;"
+        )
+        
+        try:
+            # All indexes in one transaction and one script
+            cursor.executescript("BEGIN;\n" + ";\n".join(obsolete_indexes + indexes) + ";\nCOMMIT;")
+            created_count = len(indexes)
+            for index_query in indexes:
+                print(f"✓ Created index: {index_query.split()[5]}")
+        except sqlite3.Error as e:
+            # Fall back to one statement at a time to report which index failed
+            print(f"Batched index creation failed ({e}); retrying individually")
+            if conn.in_transaction:
+                conn.rollback()
+            for drop_query in obsolete_indexes:
+                cursor.execute(drop_query)
+            created_count = 0
+            for index_query in indexes:
+                try:
+                    cursor.execute(index_query)
+                    created_count += 1
+                    print(f"✓ Created index: {index_query.split()[5]}")
+                except sqlite3.Error as e:
+                    print(f"✗ Failed to create index: {e}")
+            conn.commit()
         
+        # Refresh planner statistics so the new indexes get used
+        cursor.execute("ANALYZE")
         conn.commit()
         conn.close()
         
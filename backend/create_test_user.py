@@ -4,25 +4,23 @@ Simple script to create a test user directly in the database
 """
 import sqlite3
 import sys
-from passlib.context import CryptContext
-from datetime import datetime
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
 def create_test_user():
     # Connect to the database
     conn = sqlite3.connect('business_platform.db')
     cursor = conn.cursor()
     
-    # Hash the password
-    hashed_password = pwd_context.hash("demo123")
+    # Hash the password; $2b$ hashes with passlib's default 12 rounds, so the
+    # app's CryptContext verifies them as usual
+    hashed_password = bcrypt.hashpw(b"demo123", bcrypt.gensalt(rounds=12)).decode()
     
     try:
         # Insert the test user
         cursor.execute("""
             INSERT INTO users (username, email, hashed_password, full_name, role, is_verified, is_active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now'))
         """, (
             'demo',
             'demo@example.com', 
@@ -30,8 +28,7 @@ def create_test_user():
             'Demo User',
             'USER',
             True,
-            True,
-            datetime.utcnow().isoformat()
+            True
         ))
         
         conn.commit()
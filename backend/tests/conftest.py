@@ -3,9 +3,10 @@ Test fixtures and configuration for pytest
 """
 import pytest
 import asyncio
+import functools
 from typing import Generator, AsyncGenerator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import tempfile
@@ -17,10 +18,17 @@ from app.models.user import User, UserRole
 from app.models.integration import Integration, IntegrationType, IntegrationStatus
 from app.models.chat import ChatSession, ChatMessage
 from app.db.database import get_db_session
-from app.core.security import get_password_hash
+from app.core.security import pwd_context
 from app.services.redis_service import redis_service
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_hash(password: str) -> str:
+    """Hash a fixture password once, at bcrypt's minimum cost"""
+    # verify() reads the cost from the hash, so logins in tests stay cheap too
+    return pwd_context.handler("bcrypt").using(rounds=4).hash(password)
+
+
 # Test database setup
 @pytest.fixture(scope="session")
 def test_engine():
@@ -33,6 +41,16 @@ def test_engine():
         echo=False  # Set to True for SQL debugging
     )
     
+    # pysqlite defers BEGIN until the first write, which breaks SAVEPOINT;
+    # let SQLAlchemy emit BEGIN itself so per-test savepoints roll back cleanly
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create all tables
     BaseModel.metadata.create_all(bind=engine)
     
@@ -46,14 +64,19 @@ def test_session_factory(test_engine):
 
 
 @pytest.fixture
-def db_session(test_session_factory):
-    """Create test database session"""
-    session = test_session_factory()
+def db_session(test_engine, test_session_factory):
+    """Create test database session rolled back after each test"""
+    # Commits inside the test only release a SAVEPOINT; the outer transaction
+    # is rolled back at teardown so no rows leak into the next test
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = test_session_factory(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
@@ -75,39 +98,49 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def test_user(db_session) -> User:
-    """Create a test user"""
+@pytest.fixture(scope="session")
+def test_user(test_session_factory) -> User:
+    """Create a test user once for the whole run"""
+    session = test_session_factory()
     user = User(
         email="test@example.com",
         username="testuser",
-        hashed_password=get_password_hash("testpassword"),
+        hashed_password=_cached_hash("testpassword"),
         full_name="Test User",
         role=UserRole.USER,
         is_active=True,
         is_verified=True
     )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    try:
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+    finally:
+        # Detached with its attributes loaded, so every test can read it
+        session.close()
     return user
 
 
-@pytest.fixture
-def test_admin_user(db_session) -> User:
-    """Create a test admin user"""
+@pytest.fixture(scope="session")
+def test_admin_user(test_session_factory) -> User:
+    """Create a test admin user once for the whole run"""
+    session = test_session_factory()
     user = User(
         email="admin@example.com",
         username="admin",
-        hashed_password=get_password_hash("adminpassword"),
+        hashed_password=_cached_hash("adminpassword"),
         full_name="Admin User",
         role=UserRole.ADMIN,
         is_active=True,
         is_verified=True
     )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    try:
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+    finally:
+        # Detached with its attributes loaded, so every test can read it
+        session.close()
     return user
 
 
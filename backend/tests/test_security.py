@@ -348,6 +348,19 @@ class TestEncryptionSecurity:
         decrypted_new = encryption_service.decrypt(encrypted_new)
         assert decrypted_new == test_data
     
+    def test_key_rotation_rejects_old_credentials(self):
+        """Test credentials encrypted before a key rotation no longer decrypt"""
+        from cryptography.fernet import InvalidToken
+        from app.core.encryption import encryption_service
+        
+        encrypted = encryption_service.encrypt_credentials({"api_key": "secret_key_123"})
+        assert encryption_service.decrypt_credentials(encrypted) == {"api_key": "secret_key_123"}
+        
+        encryption_service.rotate_keys()
+        
+        with pytest.raises(InvalidToken):
+            encryption_service.decrypt_credentials(encrypted)
+    
     def test_api_key_storage_security(self, db_session: Session):
         """Test that API keys are stored encrypted"""
         from app.models.integration import Integration
@@ -0,0 +1,1569 @@
+"""
+Tests for business system integration tools
+"""
+import asyncio
+import json
+from datetime import datetime, timezone
+import pytest
+import httpx
+from unittest.mock import AsyncMock, Mock
+
+from app.tools import base, github, hubspot, jira, salesforce, slack, zendesk
+from app.tools import registry as registry_module
+from app.tools.base import ToolCredentials
+
+
+def make_credentials(integration_type: str, **credentials) -> ToolCredentials:
+    """Build tool credentials for tests"""
+    return ToolCredentials(integration_type=integration_type, credentials=credentials)
+
+
+def make_response(status_code: int = 200, json_data=None, headers=None) -> Mock:
+    """Build a fake httpx response"""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json = Mock(return_value=json_data)
+    response.content = json.dumps(json_data).encode()
+    return response
+
+
+def make_salesforce_credentials(username: str = "u@example.com") -> ToolCredentials:
+    """Build Salesforce password-flow credentials for tests"""
+    return make_credentials(
+        "salesforce", username=username, password="p", security_token="s",
+        client_id="cid", client_secret="secret", sandbox=False
+    )
+
+
+def make_zendesk_credentials(api_token: str = "t") -> ToolCredentials:
+    """Build Zendesk API token credentials for tests"""
+    return make_credentials("zendesk", subdomain="acme", email="a@b.c", api_token=api_token)
+
+
+class TestGitHubETagCache:
+    """Test conditional GET caching for GitHub resources"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty ETag cache"""
+        github._ETAG_CACHE.clear()
+        yield
+        github._ETAG_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_body(self):
+        """Test a 304 answer reuses the previously parsed body"""
+        tool = github.GitHubGetRepositoryTool(make_credentials("github", token="abc"))
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"name": "repo"}, {"ETag": '"v1"'}),
+            make_response(304),
+        ])
+        headers = {"Authorization": "token abc"}
+        url = "https://api.github.com/repos/octo/repo"
+
+        first = await github._get_json_cached(tool, url, headers)
+        second = await github._get_json_cached(tool, url, headers)
+
+        assert first == second == {"name": "repo"}
+        revalidation_headers = tool._make_request.call_args_list[1].kwargs["headers"]
+        assert revalidation_headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, monkeypatch):
+        """Test least recently used entries are evicted"""
+        monkeypatch.setattr(github, "_ETAG_CACHE_MAX", 2)
+        tool = github.GitHubGetRepositoryTool(make_credentials("github", token="abc"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {}, {"ETag": '"v"'}))
+
+        for name in ("a", "b", "c"):
+            await github._get_json_cached(tool, f"https://api.github.com/repos/octo/{name}", {})
+
+        assert len(github._ETAG_CACHE) == 2
+        assert ("", "https://api.github.com/repos/octo/a", ()) not in github._ETAG_CACHE
+
+
+class TestGitHubCreateIssueBatch:
+    """Test concurrent issue creation"""
+
+    @pytest.mark.asyncio
+    async def test_execute_many_preserves_order(self):
+        """Test results line up with the submitted items"""
+        tool = github.GitHubCreateIssueTool(make_credentials("github", token="abc"))
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(201, {"number": 1}),
+            make_response(201, {"number": 2}),
+        ])
+
+        results = await tool.execute_many([
+            {"repository": "octo/repo", "title": "first"},
+            {"repository": "octo/repo", "title": "second"},
+        ])
+
+        assert [r.success for r in results] == [True, True]
+        assert [r.data["title"] for r in results] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_backs_off_when_rate_limit_is_low(self, monkeypatch):
+        """Test the Retry-After header delays the next write"""
+        sleep = AsyncMock()
+        monkeypatch.setattr(github.asyncio, "sleep", sleep)
+
+        await github._respect_rate_limit(make_response(201, headers={"Retry-After": "3"}))
+
+        sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_issue_body_is_pre_encoded(self):
+        """Test the issue payload is sent as raw JSON bytes"""
+        tool = github.GitHubCreateIssueTool(make_credentials("github", token="abc"))
+        tool._make_request = AsyncMock(return_value=make_response(201, {"number": 1}))
+
+        await tool.execute(repository="octo/repo", title="bug", labels=["p1"])
+
+        kwargs = tool._make_request.call_args.kwargs
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert json.loads(kwargs["content"]) == {"title": "bug", "body": "", "labels": ["p1"]}
+
+    @pytest.mark.asyncio
+    async def test_execute_many_reports_invalid_items(self):
+        """Test an item without a repository or title fails on its own"""
+        tool = github.GitHubCreateIssueTool(make_credentials("github", token="abc"))
+        tool._make_request = AsyncMock(return_value=make_response(201, {"number": 1}))
+
+        results = await tool.execute_many([
+            {"repository": "octo/repo", "title": "first"},
+            {"title": "no repository"},
+            {"repository": "octo/repo"},
+        ])
+
+        assert [r.success for r in results] == [True, False, False]
+        assert "repository and a title" in results[1].error
+        assert tool._make_request.await_count == 1
+
+
+class TestStreamJsonItems:
+    """Test incremental parsing of JSON listings"""
+
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Route tool HTTP traffic to a fixed JSON body"""
+        def _serve(body: bytes):
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+            client_cls = httpx.AsyncClient
+            monkeypatch.setattr(
+                base.httpx, "AsyncClient",
+                lambda **kwargs: client_cls(transport=transport, **kwargs)
+            )
+        return _serve
+
+    @pytest.mark.asyncio
+    async def test_search_items_are_projected_while_streaming(self, serve):
+        """Test search results and total_count come from the streamed body"""
+        serve(json.dumps({
+            "total_count": 2,
+            "incomplete_results": False,
+            "items": [
+                {"name": "a", "full_name": "octo/a", "owner": {"login": "octo"}, "stargazers_count": 1.5},
+                {"name": "b", "full_name": "octo/b", "owner": {"login": "octo"}},
+            ]
+        }).encode())
+        tool = github.GitHubSearchTool(make_credentials("github", token="abc"))
+
+        result = await tool.execute(query="octo")
+
+        assert result.success
+        assert result.data["total_count"] == 2
+        assert [item["full_name"] for item in result.data["items"]] == ["octo/a", "octo/b"]
+        assert result.data["items"][0]["stars"] == 1.5
+
+    @pytest.mark.asyncio
+    async def test_top_level_array(self, serve):
+        """Test elements of a top-level array are yielded in order"""
+        serve(b'[{"sha": "1", "commit": {"author": {"name": "x"}}}, {"sha": "2"}]')
+        tool = github.GitHubSearchTool(make_credentials("github", token="abc"))
+
+        items = [item async for item in tool._stream_json_items("GET", "https://api.github.com/x", "item")]
+
+        assert [item["sha"] for item in items] == ["1", "2"]
+        assert items[0]["commit"]["author"]["name"] == "x"
+
+    @pytest.mark.asyncio
+    async def test_search_query_is_encoded_in_url(self, monkeypatch):
+        """Test the search query string is built without httpx params"""
+        seen = []
+        transport = httpx.MockTransport(
+            lambda request: seen.append(request.url) or httpx.Response(200, content=b'{"items": []}')
+        )
+        client_cls = httpx.AsyncClient
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        tool = github.GitHubSearchTool(make_credentials("github", token="abc"))
+
+        await tool.execute(query="lang:python stars:>10", per_page=50)
+
+        assert seen[0].params["q"] == "lang:python stars:>10"
+        assert seen[0].params["per_page"] == "50"
+
+    @pytest.mark.asyncio
+    async def test_parse_dates(self, serve):
+        """Test timestamps are returned as datetimes on request"""
+        serve(b'{"total_count": 1, "items": [{"name": "a", "created_at": "2024-05-01T12:00:00Z", "updated_at": null}]}')
+        tool = github.GitHubSearchTool(make_credentials("github", token="abc"))
+
+        result = await tool.execute(query="octo", parse_dates=True)
+
+        item = result.data["items"][0]
+        assert item["created_at"] == datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        assert item["updated_at"] is None
+
+
+class TestEventSubscribers:
+    """Test tool event delivery"""
+
+    @pytest.mark.asyncio
+    async def test_events_reach_subscribers(self):
+        """Test subscribed callbacks receive execution events"""
+        received = []
+        base.BaseBusinessTool.subscribe_events(received.append)
+        try:
+            tool = github.GitHubCreateIssueTool(make_credentials("github", token="abc"))
+            tool._make_request = AsyncMock(return_value=make_response(201, {"number": 7}))
+            await tool.execute(repository="octo/repo", title="bug")
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(received.append)
+
+        assert [event.type for event in received] == ["start", "progress", "complete"]
+
+    def test_events_disabled_without_subscribers(self):
+        """Test events are skipped when nobody listens"""
+        tool = github.GitHubCreateIssueTool(make_credentials("github", token="abc"))
+
+        assert not tool._events_enabled
+
+    @pytest.mark.asyncio
+    async def test_nowait_events_are_delivered_in_order(self):
+        """Test fire-and-forget events arrive once drained"""
+        received = []
+        base.BaseBusinessTool.subscribe_events(received.append)
+        try:
+            tool = hubspot.HubSpotCreateContactTool(make_credentials("hubspot", access_token="t"))
+            tool._make_request = AsyncMock(return_value=make_response(201, {"id": "1"}))
+            await tool.execute(email="a@b.co")
+            await base.drain_events()
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(received.append)
+
+        assert [event.type for event in received] == ["start", "progress", "complete"]
+
+    def test_event_message_is_formatted_lazily(self):
+        """Test message arguments are applied on render"""
+        event = base.ToolExecutionEvent(
+            type="progress", tool_name="t", message="Found {} of {}", args=(2, "{x}")
+        )
+
+        assert event.message == "Found {} of {}"
+        assert event.render() == "Found 2 of {x}"
+
+    @pytest.mark.asyncio
+    async def test_progress_events_only_in_verbose_mode(self, monkeypatch):
+        """Test Jira progress events are skipped unless emit_progress is set"""
+        received = []
+        base.BaseBusinessTool.subscribe_events(received.append)
+        try:
+            tool = jira.JiraCreateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+            tool._make_request = AsyncMock(return_value=make_response(201, {"key": "OPS-1", "id": "1"}))
+            await tool.execute(project_key="OPS", issue_type="Task", summary="s")
+            monkeypatch.setattr(tool, "emit_progress", True)
+            await tool.execute(project_key="OPS", issue_type="Task", summary="s")
+            await base.drain_events()
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(received.append)
+
+        assert [event.type for event in received] == ["start", "complete", "start", "progress", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_slack_events_rendered_from_args(self):
+        """Test Slack events are queued without blocking and render their arguments"""
+        received = []
+        base.BaseBusinessTool.subscribe_events(received.append)
+        try:
+            tool = slack.SlackGetChannelsTool(make_credentials("slack", bot_token="xoxb-1"))
+            tool._make_request = AsyncMock(return_value=make_response(200, {"ok": True, "channels": [{"id": "C1", "name": "general"}]}))
+            await tool.execute()
+            await base.drain_events()
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(received.append)
+
+        assert [event.type for event in received] == ["start", "progress", "complete"]
+        assert received[-1].render() == "Retrieved 1 channels"
+
+    @pytest.mark.asyncio
+    async def test_zendesk_start_and_progress_merged(self):
+        """Test Zendesk tools emit only a start and a terminal event"""
+        received = []
+        base.BaseBusinessTool.subscribe_events(received.append)
+        try:
+            tool = zendesk.ZendeskCreateTicketTool(make_zendesk_credentials())
+            tool._make_request = AsyncMock(return_value=make_response(201, {"ticket": {"id": 42}}))
+            await tool.execute(subject="s", description="d")
+            await base.drain_events()
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(received.append)
+
+        assert [event.type for event in received] == ["start", "complete"]
+        assert received[-1].render() == "Created ticket #42"
+
+
+class TestGitHubCredentials:
+    """Test GitHub credential handling"""
+
+    def test_auth_value_follows_credential_rotation(self):
+        """Test the cached Authorization value is rebuilt for new credentials"""
+        tool = github.GitHubSearchTool(make_credentials("github", token="old"))
+        assert tool._auth_value == "token old"
+
+        tool.credentials = make_credentials("github", personal_access_token="new")
+
+        assert tool._auth_value == "token new"
+
+    @pytest.mark.asyncio
+    async def test_trivial_connection_test_skips_events(self):
+        """Test static connection checks return without the event path"""
+        tool = github.GitHubGetRepositoryTool(make_credentials("github", token="abc"))
+        tool.emit_event = AsyncMock()
+
+        result = await tool.test_connection()
+
+        assert result.success and result.data == {"status": "connected"}
+        tool.emit_event.assert_not_called()
+
+
+class TestSharedHttpClient:
+    """Test the per event loop HTTP client pool"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_a_loop(self):
+        """Test repeated lookups return the same pooled client"""
+        client = base.get_http_client()
+
+        assert base.get_http_client() is client
+
+        await base.close_http_clients()
+        assert client.is_closed
+        assert base.get_http_client() is not client
+        await base.close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_client_negotiates_http2_when_available(self, monkeypatch):
+        """Test the pooled client enables HTTP/2 if h2 is installed"""
+        created = {}
+        client_cls = httpx.AsyncClient
+
+        def make_client(**kwargs):
+            created.update(kwargs)
+            return client_cls(**kwargs)
+
+        monkeypatch.setattr(base.httpx, "AsyncClient", make_client)
+        monkeypatch.setattr(base, "_HTTP2_AVAILABLE", True)
+
+        base.get_http_client()
+        await base.close_http_clients()
+
+        assert created["http2"] is True
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_are_kept_alive(self, monkeypatch):
+        """Test pooled connections outlive the short httpx default idle timeout"""
+        created = {}
+        client_cls = httpx.AsyncClient
+
+        def make_client(**kwargs):
+            created.update(kwargs)
+            return client_cls(**kwargs)
+
+        monkeypatch.setattr(base.httpx, "AsyncClient", make_client)
+
+        base.get_http_client()
+        await base.close_http_clients()
+
+        assert created["limits"].keepalive_expiry == base.settings.TOOL_HTTP_KEEPALIVE_EXPIRY
+        assert created["limits"].keepalive_expiry > httpx.Limits().keepalive_expiry
+
+    @pytest.mark.asyncio
+    async def test_dict_bodies_encoded_as_json(self, monkeypatch):
+        """Test data= bodies are sent as JSON without mutating the caller's headers"""
+        seen = []
+        transport = httpx.MockTransport(lambda request: seen.append(request) or httpx.Response(200, content=b"{}"))
+        client_cls = httpx.AsyncClient
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        tool = zendesk.ZendeskCreateTicketTool(make_zendesk_credentials())
+        headers = {"Authorization": "Basic x"}
+
+        await tool._make_request("POST", "https://acme.zendesk.com/api/v2/tickets.json", headers=headers, data={"ticket": {"subject": "ü", 1: True}})
+
+        assert json.loads(seen[0].content) == {"ticket": {"subject": "ü", "1": True}}
+        assert seen[0].headers["Content-Type"] == "application/json"
+        assert headers == {"Authorization": "Basic x"}
+        await base.close_http_clients()
+
+    def test_crewai_calls_share_one_client(self):
+        """Test agent tool calls reuse one loop and pooled client across calls"""
+        tool = zendesk.ZendeskCreateTicketTool(make_zendesk_credentials())
+        clients = []
+
+        async def execute(**kwargs):
+            clients.append(base.get_http_client())
+            return base.ToolExecutionResult(success=True, data={}, tool_name=tool.tool_name)
+
+        tool.execute = execute
+        wrapper = base.CrewAITool(tool)
+        try:
+            for _ in range(3):
+                wrapper.func()
+            assert len(set(map(id, clients))) == 1
+            assert not clients[0].is_closed
+        finally:
+            base.shutdown_tool_loop()
+
+        assert clients[0].is_closed
+
+
+class TestHubSpotCache:
+    """Test Redis caching of HubSpot searches"""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Replace Redis with an in-memory dict"""
+        store = {}
+
+        async def get(namespace, key):
+            return store.get(key)
+
+        async def set_(namespace, key, value, ttl=None):
+            store[key] = value
+            return True
+
+        monkeypatch.setattr(hubspot.cache_service, "get", get)
+        monkeypatch.setattr(hubspot.cache_service, "set", set_)
+        monkeypatch.setattr(hubspot.redis_service, "is_usable_in_running_loop", lambda: True)
+        return store
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_hubspot(self, cache):
+        """Test a repeated search is answered from the cache"""
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"results": [{"id": "1"}]}))
+
+        first = await tool.execute(query="acme")
+        second = await tool.execute(query="acme")
+
+        assert tool._make_request.await_count == 1
+        assert second.data == first.data
+        assert second.metadata["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_fallback_on_error(self, cache):
+        """Test a stale entry is served when HubSpot fails"""
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"results": [{"id": "1"}]}))
+        await tool.execute(query="acme")
+        for entry in cache.values():
+            entry["stale_at"] = 0
+        tool._make_request = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await tool.execute(query="acme")
+
+        assert result.success
+        assert result.metadata["stale"] is True
+        assert result.data["deals"][0]["id"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_lookups_share_a_request(self, monkeypatch):
+        """Test duplicate in-flight lookups are coalesced"""
+        monkeypatch.setattr(hubspot.redis_service, "is_usable_in_running_loop", lambda: False)
+        tool = hubspot.HubSpotSearchContactsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"id": "9", "properties": {}}))
+
+        results = await asyncio.gather(*(tool.execute(email="a@b.co") for _ in range(3)))
+
+        assert tool._make_request.await_count == 1
+        assert all(result.data["contacts"][0]["id"] == "9" for result in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_only_matching_fallback(self, cache):
+        """Test a call without the stale fallback does not join one that has it"""
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"results": [{"id": "1"}]}))
+        await tool.execute(query="acme")
+        for entry in cache.values():
+            entry["stale_at"] = 0
+        tool._make_request = AsyncMock(side_effect=RuntimeError("boom"))
+
+        fallback, strict = await asyncio.gather(
+            tool.execute(query="acme"),
+            tool.execute(query="acme", cache_fallback=False)
+        )
+
+        assert tool._make_request.await_count == 2
+        assert fallback.success and fallback.metadata["stale"] is True
+        assert not strict.success
+
+    @pytest.mark.asyncio
+    async def test_unknown_email_is_empty_result(self, monkeypatch):
+        """Test a 404 email lookup returns no contacts instead of an error"""
+        monkeypatch.setattr(hubspot.redis_service, "is_usable_in_running_loop", lambda: False)
+        tool = hubspot.HubSpotSearchContactsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(404, {"status": "error"}))
+
+        result = await tool.execute(email="nobody@x.co")
+
+        assert result.success
+        assert result.data["contacts"] == []
+        assert tool._make_request.call_args.kwargs["allow_status"] == (404,)
+
+
+class TestHubSpotBatchCreate:
+    """Test batched contact creation"""
+
+    @pytest.mark.asyncio
+    async def test_batch_create_chunks_by_hundred(self):
+        """Test contacts are created in batches of at most 100"""
+        tool = hubspot.HubSpotCreateContactTool(make_credentials("hubspot", access_token="t"))
+
+        async def fake_request(method, url, headers=None, content=None, **kwargs):
+            inputs = json.loads(content)["inputs"]
+            return make_response(201, {"results": [
+                {"id": item["properties"]["email"], "properties": item["properties"]} for item in inputs
+            ]})
+
+        tool._make_request = AsyncMock(side_effect=fake_request)
+
+        result = await tool.execute_batch([{"email": f"{i}@x.co"} for i in range(150)])
+
+        assert result.success
+        assert result.data["created"] == 150
+        sizes = [len(json.loads(call.kwargs["content"])["inputs"]) for call in tool._make_request.call_args_list]
+        assert sizes == [100, 50]
+
+    @pytest.mark.asyncio
+    async def test_batch_create_reports_invalid_items(self):
+        """Test items without an email are listed by index while the rest are created"""
+        tool = hubspot.HubSpotCreateContactTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(201, {"results": [
+            {"id": "1", "properties": {"email": "a@x.co"}}
+        ]}))
+
+        result = await tool.execute_batch([{"email": "a@x.co"}, {"firstname": "No email"}, "not a contact"])
+
+        assert result.success is False
+        assert result.data["created"] == 1
+        assert [item["index"] for item in result.data["failed"]] == [1, 2]
+        assert json.loads(tool._make_request.call_args.kwargs["content"])["inputs"] == [{"properties": {"email": "a@x.co"}}]
+
+
+class TestHubSpotLargeSearches:
+    """Test large HubSpot search result sets"""
+
+    @pytest.mark.asyncio
+    async def test_large_pages_are_streamed(self, monkeypatch):
+        """Test results above the threshold come from the streaming parser"""
+        monkeypatch.setattr(hubspot.redis_service, "is_usable_in_running_loop", lambda: False)
+        body = json.dumps({"results": [{"id": str(i), "properties": {}} for i in range(50)]}).encode()
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        client_cls = httpx.AsyncClient
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+        tool._make_request = AsyncMock()
+
+        result = await tool.execute(query="acme", limit=50)
+
+        assert result.success
+        assert len(result.data["deals"]) == 50
+        tool._make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_collects_pages(self, monkeypatch):
+        """Test fetch_all requests later pages by offset and stops at a short page"""
+        monkeypatch.setattr(hubspot.redis_service, "is_usable_in_running_loop", lambda: False)
+        monkeypatch.setattr(hubspot, "_STREAM_THRESHOLD", 1000)
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+
+        async def fake_request(method, url, headers=None, content=None, **kwargs):
+            after = json.loads(content)["after"]
+            count = 100 if after < 200 else 30
+            return make_response(200, {"results": [{"id": str(after + i)} for i in range(count)]})
+
+        tool._make_request = AsyncMock(side_effect=fake_request)
+
+        result = await tool.execute(fetch_all=True, max_total=500)
+
+        assert len(result.data["deals"]) == 230
+        assert result.data["deals"][-1]["id"] == "229"
+
+
+class TestHubSpotRateLimiting:
+    """Test HubSpot concurrency and rate limits"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_bounded(self, monkeypatch):
+        """Test no more than the configured number of requests run at once"""
+        monkeypatch.setattr(hubspot, "_MAX_CONCURRENT_REQUESTS", 2)
+        monkeypatch.setattr(hubspot, "_SEMAPHORES", hubspot.weakref.WeakKeyDictionary())
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={})
+
+        client_cls = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        tool = hubspot.HubSpotSearchContactsTool(make_credentials("hubspot", access_token="t"))
+
+        try:
+            await asyncio.gather(*(tool._make_request("GET", "https://api.hubapi.com/x") for _ in range(6)))
+        finally:
+            await base.close_http_clients()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_when_empty(self, monkeypatch):
+        """Test the token bucket sleeps once its burst is used up"""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            bucket._tokens = 1
+
+        monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+        bucket = base.AsyncTokenBucket(2, 1.0)
+
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert len(sleeps) == 1
+        assert sleeps[0] > 0
+
+    def test_rate_limits_are_per_account(self):
+        """Test each HubSpot token gets its own request bucket"""
+        first = hubspot.HubSpotSearchContactsTool(make_credentials("hubspot", access_token="t1"))
+        same = hubspot.HubSpotCreateContactTool(make_credentials("hubspot", access_token="t1"))
+        other = hubspot.HubSpotSearchContactsTool(make_credentials("hubspot", access_token="t2"))
+
+        assert first._rate_limit is same._rate_limit
+        assert first._rate_limit is not other._rate_limit
+
+
+class TestJiraUpdateIssue:
+    """Test Jira issue updates"""
+
+    @pytest.fixture(autouse=True)
+    def clear_transition_ids(self):
+        jira._TRANSITION_IDS.clear()
+        yield
+        jira._TRANSITION_IDS.clear()
+
+    @pytest.mark.asyncio
+    async def test_transition_runs_before_field_update(self):
+        """Test the field update is sent only after the status transition succeeded"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"transitions": [{"id": "31", "to": {"name": "Done"}}]}),
+            make_response(204, {}),
+            make_response(204, {}),
+        ])
+
+        result = await tool.execute(issue_key="OPS-1", status="done", summary="New title")
+
+        assert result.success
+        assert [call.args[0] for call in tool._make_request.call_args_list] == ["GET", "POST", "PUT"]
+        assert json.loads(tool._make_request.call_args_list[1].kwargs["content"]) == {"transition": {"id": "31"}}
+
+    @pytest.mark.asyncio
+    async def test_rejected_transition_skips_field_update(self):
+        """Test a failed status transition stops the field edit"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"transitions": [{"id": "31", "to": {"name": "Done"}}]}),
+            RuntimeError("transition rejected"),
+        ])
+
+        result = await tool.execute(issue_key="OPS-1", status="done", summary="New title")
+
+        assert result.success is False
+        assert "PUT" not in [call.args[0] for call in tool._make_request.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_cached_transition_skips_lookup(self):
+        """Test a repeat status update for the same project and issue type posts the cached transition directly"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"fields": {"issuetype": {"name": "Bug"}}, "transitions": [{"id": "31", "to": {"name": "Done"}}]}),
+            make_response(204, {}),
+            make_response(204, {}),
+        ])
+
+        await tool.execute(issue_key="OPS-1", status="Done")
+        result = await tool.execute(issue_key="OPS-2", status="Done", issue_type="Bug")
+
+        assert result.success
+        assert [call.args[0] for call in tool._make_request.call_args_list] == ["GET", "POST", "POST"]
+        assert tool._make_request.call_args_list[0].kwargs["params"] == {"fields": "issuetype", "expand": "transitions"}
+        assert tool._make_request.call_args_list[2].args[1].endswith("/issue/OPS-2/transitions")
+
+    @pytest.mark.asyncio
+    async def test_cached_transition_needs_issue_type(self):
+        """Test ids cached for one issue type are not reused when the type is unknown or different"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        jira._TRANSITION_IDS[(tool._base_url, "OPS", "bug")] = {"done": "31"}
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"fields": {"issuetype": {"name": "Story"}}, "transitions": [{"id": "71", "to": {"name": "Done"}}]}),
+            make_response(204, {}),
+            make_response(200, {"fields": {"issuetype": {"name": "Story"}}, "transitions": [{"id": "71", "to": {"name": "Done"}}]}),
+            make_response(204, {}),
+        ])
+
+        await tool.execute(issue_key="OPS-4", status="Done")
+        await tool.execute(issue_key="OPS-5", status="Done", issue_type="Task")
+
+        posted = [json.loads(call.kwargs["content"]) for call in tool._make_request.call_args_list if call.args[0] == "POST"]
+        assert posted == [{"transition": {"id": "71"}}, {"transition": {"id": "71"}}]
+        assert jira._TRANSITION_IDS.get((tool._base_url, "OPS", "story")) == {"done": "71"}
+
+    @pytest.mark.asyncio
+    async def test_rejected_cached_transition_is_looked_up_again(self):
+        """Test a 400 for a cached transition falls back to fetching the issue's transitions"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        jira._TRANSITION_IDS[(tool._base_url, "OPS", "bug")] = {"done": "31"}
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(400, {"errorMessages": ["invalid transition"]}),
+            make_response(200, {"fields": {"issuetype": {"name": "Bug"}}, "transitions": [{"id": "41", "to": {"name": "Done"}}]}),
+            make_response(204, {}),
+        ])
+
+        result = await tool.execute(issue_key="OPS-3", status="Done", issue_type="Bug")
+
+        assert result.success
+        assert json.loads(tool._make_request.call_args_list[2].kwargs["content"]) == {"transition": {"id": "41"}}
+        assert jira._TRANSITION_IDS.get((tool._base_url, "OPS", "bug")) == {"done": "41"}
+
+    @pytest.mark.asyncio
+    async def test_description_sent_as_adf(self):
+        """Test plain text descriptions are wrapped in an ADF paragraph"""
+        tool = jira.JiraUpdateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        tool._make_request = AsyncMock(return_value=make_response(204, {}))
+
+        await tool.execute(issue_key="OPS-1", description="Steps to reproduce")
+
+        fields = json.loads(tool._make_request.call_args.kwargs["content"])["fields"]
+        assert fields["description"]["content"][0]["content"] == [{"type": "text", "text": "Steps to reproduce"}]
+        assert jira._adf_paragraph("Steps to reproduce") is jira._adf_paragraph("Steps to reproduce")
+
+
+class TestJiraSearchPagination:
+    """Test Jira search pagination"""
+
+    @pytest.fixture
+    def requests_seen(self, monkeypatch):
+        """Serve /search pages from a 1000 issue result set and record request bodies"""
+        seen = []
+        fields_requested = self.fields_requested = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            seen.append((body["startAt"], body["maxResults"]))
+            fields_requested.append(body["fields"])
+            total = 1 if "OPS-1" in body["jql"] else 1000
+            size = min(body["maxResults"], total - body["startAt"])
+            fields = {field: {} for field in body["fields"] if field == "description"}
+            issues = [{"key": f"OPS-{body['startAt'] + i}", "fields": {"summary": "s", **fields}} for i in range(size)]
+            return httpx.Response(200, json={"startAt": body["startAt"], "total": total, "issues": issues})
+
+        client_cls = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        return seen
+
+    @pytest.mark.asyncio
+    async def test_remaining_pages_fetched_by_offset(self, requests_seen):
+        """Test pages after the first are requested by startAt up to max_results"""
+        tool = jira.JiraSearchTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+
+        try:
+            result = await tool.execute(query="project = OPS", max_results=250)
+        finally:
+            await base.close_http_clients()
+
+        assert result.success
+        assert result.data["total"] == 1000
+        assert [issue["key"] for issue in result.data["issues"]] == [f"OPS-{i}" for i in range(250)]
+        assert result.data["issues"][0]["url"] == "https://acme.atlassian.net/browse/OPS-0"
+        assert sorted(requests_seen) == [(0, 100), (100, 100), (200, 50)]
+
+    @pytest.mark.asyncio
+    async def test_single_page_when_total_is_small(self, requests_seen):
+        """Test no extra pages are requested when the first page holds every match"""
+        tool = jira.JiraSearchTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+
+        try:
+            result = await tool.execute(query="key = OPS-1", max_results=500)
+        finally:
+            await base.close_http_clients()
+
+        assert len(result.data["issues"]) == 1
+        assert requests_seen == [(0, 100)]
+
+    @pytest.mark.asyncio
+    async def test_description_only_requested_on_opt_in(self, requests_seen):
+        """Test descriptions are left out of the field list unless include_description is set"""
+        tool = jira.JiraSearchTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+
+        try:
+            lean = await tool.execute(query="key = OPS-1")
+            full = await tool.execute(query="key = OPS-1", include_description=True)
+        finally:
+            await base.close_http_clients()
+
+        assert "description" not in self.fields_requested[0]
+        assert "description" in self.fields_requested[1]
+        assert "description" not in lean.data["issues"][0]
+        assert full.data["issues"][0]["description"] == {}
+
+    def test_null_fields_project_to_none(self):
+        """Test unset nested fields such as priority come back as None"""
+        tool = jira.JiraSearchTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+
+        issue = tool._project_issue({
+            "key": "OPS-1",
+            "fields": {"status": {"name": "Open"}, "priority": None, "assignee": None}
+        })
+
+        assert issue["status"] == "Open"
+        assert issue["priority"] is None
+        assert issue["assignee"] is None
+        assert issue["reporter"] is None
+
+
+class TestJiraCredentials:
+    """Test cached Jira credential derivatives"""
+
+    def test_headers_rebuilt_when_credentials_change(self):
+        """Test the Basic auth header and base URL follow replaced credentials"""
+        tool = jira.JiraCreateIssueTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        headers = tool._headers
+
+        assert headers["Authorization"] == "Basic YUBiLmM6dA=="
+        assert tool._headers is headers
+        assert tool._base_url == "https://acme.atlassian.net"
+        assert tool._api_url == "https://acme.atlassian.net/rest/api/3"
+
+        tool.credentials = make_credentials("jira", domain="other", email="a@b.c", api_token="u")
+
+        assert tool._headers["Authorization"] == "Basic YUBiLmM6dQ=="
+        assert tool._base_url == "https://other.atlassian.net"
+        assert tool._api_url == "https://other.atlassian.net/rest/api/3"
+        assert tool._browse_url == "https://other.atlassian.net/browse/"
+
+
+class TestToolRegistry:
+    """Test tool registry bookkeeping"""
+
+    def test_crewai_wrappers_cached_until_unload(self):
+        """Test CrewAI wrappers are built once per integration and dropped on unload"""
+        registry = registry_module.ToolRegistry()
+        tool = hubspot.HubSpotSearchDealsTool(make_credentials("hubspot", access_token="t"))
+        registry._active_tools["7"] = {tool.tool_name: tool}
+        integration = Mock(id=7, is_active=True)
+
+        first = registry.get_crewai_tools_for_integration("7")
+        combined = registry.get_all_crewai_tools_for_user([integration, Mock(id=8, is_active=False)])
+
+        assert combined == first
+        assert first[0] is registry.get_crewai_tools_for_integration("7")[0]
+
+        registry.unload_tools_for_integration("7")
+
+        assert registry.get_crewai_tools_for_integration("7") == []
+
+    def test_available_tools_indexed_by_type(self):
+        """Test tool classes are looked up by integration type regardless of case"""
+        registry = registry_module.ToolRegistry()
+        registry.register_tool_class("jira", jira.JiraSearchTool)
+        registry.register_tool_class("github", github.GitHubSearchTool)
+
+        tools = registry.get_available_tools("Jira")
+
+        assert [tool["name"] for tool in tools] == ["JiraSearchTool"]
+        assert registry.get_available_tools("zendesk") == []
+
+    @pytest.mark.asyncio
+    async def test_connections_tested_concurrently(self, monkeypatch):
+        """Test every candidate tool's connection test is in flight at once"""
+        monkeypatch.setattr(registry_module.encryption_service, "decrypt_credentials", lambda encrypted: {"domain": "acme", "email": "a@b.c", "api_token": "t"})
+        registry = registry_module.ToolRegistry()
+        for tool_class in (jira.JiraSearchTool, jira.JiraCreateIssueTool, jira.JiraUpdateIssueTool):
+            registry.register_tool_class("jira", tool_class)
+        active = peak = 0
+
+        async def fake_test_connection(self):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if isinstance(self, jira.JiraUpdateIssueTool):
+                raise RuntimeError("boom")
+            return base.ToolExecutionResult(success=True, tool_name=self.tool_name)
+
+        monkeypatch.setattr(jira._JiraTool, "test_connection", fake_test_connection)
+        integration = Mock(id=3, integration_type="Jira", is_active=True, encrypted_credentials="x")
+
+        tools = await registry.load_tools_for_integration(integration)
+
+        assert peak == 3
+        assert [tool.tool_name for tool in tools] == ["jira_search", "jira_create_issue"]
+
+        stats = registry.get_integration_stats()
+        assert stats["total_active_tools"] == 2
+        assert stats["tools_by_integration"] == {"3": ("jira_search", "jira_create_issue")}
+
+        await registry.load_tools_for_integration(integration)
+        assert registry.get_integration_stats()["total_active_tools"] == 2
+
+        registry.unload_tools_for_integration("3")
+        stats = registry.get_integration_stats()
+        assert stats["total_active_tools"] == 0
+        assert stats["tools_by_integration"] == {}
+
+    def test_decrypted_credentials_reused_until_ciphertext_changes(self, monkeypatch):
+        """Test credentials are decrypted once per ciphertext and forgotten on unload"""
+        decrypt = Mock(return_value={"access_token": "t"})
+        monkeypatch.setattr(registry_module.encryption_service, "decrypt_credentials", decrypt)
+        registry = registry_module.ToolRegistry()
+        integration = Mock(id=5, encrypted_credentials="cipher-1")
+
+        assert registry._decrypt_credentials(integration) == {"access_token": "t"}
+        registry._decrypt_credentials(integration)
+        assert decrypt.call_count == 1
+
+        integration.encrypted_credentials = "cipher-2"
+        registry._decrypt_credentials(integration)
+        assert decrypt.call_count == 2
+
+        registry.unload_tools_for_integration("5")
+        registry._decrypt_credentials(integration)
+        assert decrypt.call_count == 3
+
+
+class TestJiraBulkUpdate:
+    """Test bulk Jira issue updates"""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        jira._TRANSITION_IDS.clear()
+        jira._PRIORITY_IDS.clear()
+        yield
+        jira._TRANSITION_IDS.clear()
+        jira._PRIORITY_IDS.clear()
+
+    @pytest.mark.asyncio
+    async def test_many_issues_use_bulk_endpoints(self):
+        """Test one field edit and one transition per project and issue type are submitted"""
+        tool = jira.JiraBulkUpdateTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        jira._TRANSITION_IDS[(tool._base_url, "OPS", "bug")] = {"done": "31"}
+        issue_types = {"OPS-1": "Bug", "OPS-2": "Bug", "OPS-3": "Story", "WEB-1": "Task", "WEB-2": "Task"}
+        transition_ids = {"Story": "61", "Task": "51"}
+
+        async def fake_stream(method, url, prefix, headers=None, params=None, meta=None, content=None):
+            jql = json.loads(content)["jql"]
+            for key, issue_type in issue_types.items():
+                if key in jql:
+                    yield {"key": key, "fields": {"issuetype": {"name": issue_type}}}
+
+        async def fake_request(method, url, headers=None, content=None, **kwargs):
+            if url.endswith("/priority"):
+                return make_response(200, [{"id": "2", "name": "High"}])
+            if method == "GET":
+                issue_type = issue_types[url.rsplit("/", 1)[-1]]
+                return make_response(200, {
+                    "fields": {"issuetype": {"name": issue_type}},
+                    "transitions": [{"id": transition_ids[issue_type], "to": {"name": "Done"}}]
+                })
+            return make_response(201, {"taskId": url.rsplit("/", 1)[-1]})
+
+        tool._stream_json_items = fake_stream
+        tool._make_request = AsyncMock(side_effect=fake_request)
+        keys = ["OPS-1", "OPS-2", "OPS-3", "WEB-1", "WEB-2"]
+
+        result = await tool.execute(issue_keys=keys, status="Done", priority="high")
+
+        assert result.success
+        assert result.data["bulk"] is True
+        posts = {}
+        for call in tool._make_request.call_args_list:
+            if call.args[0] == "POST":
+                posts.setdefault(call.args[1].rsplit("/", 1)[-1], []).append(json.loads(call.kwargs["content"]))
+        assert posts["fields"] == [{
+            "selectedIssueIdsOrKeys": keys,
+            "selectedActions": ["priority"],
+            "editedFieldsInput": {"priority": {"priorityId": "2"}}
+        }]
+        transitions = sorted(
+            (body["bulkTransitionInputs"][0]["transitionId"], body["bulkTransitionInputs"][0]["selectedIssueIdsOrKeys"])
+            for body in posts["transition"]
+        )
+        assert transitions == [("31", ["OPS-1", "OPS-2"]), ("51", ["WEB-1", "WEB-2"]), ("61", ["OPS-3"])]
+
+    @pytest.mark.asyncio
+    async def test_few_issues_use_single_updates(self, monkeypatch):
+        """Test small batches go through the single-issue update path"""
+        tool = jira.JiraBulkUpdateTool(make_credentials("jira", domain="acme", email="a@b.c", api_token="t"))
+        single_execute = AsyncMock(return_value=base.ToolExecutionResult(success=True, tool_name="jira_update_issue"))
+
+        monkeypatch.setattr(jira.JiraUpdateIssueTool, "execute", single_execute)
+
+        result = await tool.execute(issue_keys=["OPS-1", "OPS-2"], summary="Renamed")
+
+        assert result.success
+        assert result.data["bulk"] is False
+        assert [call.kwargs["issue_key"] for call in single_execute.call_args_list] == ["OPS-1", "OPS-2"]
+
+
+class TestSalesforceTokens:
+    """Test Salesforce OAuth session reuse"""
+
+    @pytest.fixture(autouse=True)
+    def clear_tokens(self):
+        salesforce._TOKEN_CACHE.clear()
+        yield
+        salesforce._TOKEN_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_token_shared_across_tools_and_calls(self):
+        """Test concurrent calls from different tools request a single token"""
+        fetch = AsyncMock(return_value=("tok", "https://acme.my.salesforce.com"))
+        tools = [
+            salesforce.SalesforceQueryTool(make_salesforce_credentials()),
+            salesforce.SalesforceCreateRecordTool(make_salesforce_credentials()),
+        ]
+        for tool in tools:
+            tool._fetch_access_token = fetch
+
+        tokens = await asyncio.gather(*(tool._get_access_token() for tool in tools * 3))
+
+        assert set(tokens) == {("tok", "https://acme.my.salesforce.com")}
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_session_refreshed_once(self):
+        """Test a 401 drops the cached token and retries with a new one"""
+        tool = salesforce.SalesforceUpdateRecordTool(make_salesforce_credentials())
+        tool._fetch_access_token = AsyncMock(side_effect=[
+            ("old", "https://acme.my.salesforce.com"),
+            ("new", "https://acme.my.salesforce.com"),
+        ])
+        tool._make_request = AsyncMock(side_effect=[make_response(401, []), make_response(200, [{"id": "001", "success": True}])])
+
+        result = await tool.execute(record_id="001", object_type="Account", fields={"Name": "Acme"})
+
+        assert result.success
+        auth = [call.kwargs["headers"]["Authorization"] for call in tool._make_request.call_args_list]
+        assert auth == ["Bearer old", "Bearer new"]
+        assert salesforce._TOKEN_CACHE[tool._token_key][0] == "new"
+
+    @pytest.mark.asyncio
+    async def test_session_fetched_while_events_are_emitted(self):
+        """Test the token request is already running when the start event is delivered"""
+        tool = salesforce.SalesforceCreateRecordTool(make_salesforce_credentials())
+        tool._fetch_access_token = AsyncMock(return_value=("tok", "https://acme.my.salesforce.com"))
+        tool._make_request = AsyncMock(return_value=make_response(200, [{"id": "001", "success": True}]))
+        fetched_at_start = []
+
+        async def on_event(event):
+            if event.type == "start":
+                await asyncio.sleep(0)
+                fetched_at_start.append(tool._fetch_access_token.await_count)
+
+        base.BaseBusinessTool.subscribe_events(on_event)
+        try:
+            result = await tool.execute(object_type="Account", fields={"Name": "Acme"})
+        finally:
+            base.BaseBusinessTool.unsubscribe_events(on_event)
+
+        assert result.success
+        assert fetched_at_start == [1]
+
+    @pytest.mark.asyncio
+    async def test_different_secrets_never_share_a_session(self):
+        """Test a cached session is only reused with the same password, secret and security token"""
+        victim = salesforce.SalesforceQueryTool(make_salesforce_credentials())
+        victim._fetch_access_token = AsyncMock(return_value=("VICTIM_TOKEN", "https://acme.my.salesforce.com"))
+        await victim._get_access_token()
+
+        for field in ("password", "client_secret", "security_token"):
+            credentials = make_salesforce_credentials()
+            credentials.credentials[field] = "WRONG"
+            other = salesforce.SalesforceQueryTool(credentials)
+            other._fetch_access_token = AsyncMock(side_effect=RuntimeError("invalid_grant"))
+
+            assert other._token_key != victim._token_key
+            with pytest.raises(RuntimeError):
+                await other._get_access_token()
+
+
+class TestSalesforceCollections:
+    """Test sObject Collections batching"""
+
+    @pytest.fixture(autouse=True)
+    def session(self, monkeypatch):
+        salesforce._TOKEN_CACHE.clear()
+        monkeypatch.setattr(
+            salesforce._SalesforceTool, "_fetch_access_token",
+            AsyncMock(return_value=("tok", "https://acme.my.salesforce.com"))
+        )
+        yield
+        salesforce._TOKEN_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_creates_sent_in_chunks_of_200(self):
+        """Test records are chunked and results keep input order and per-record errors"""
+        tool = salesforce.SalesforceCreateRecordTool(make_salesforce_credentials())
+
+        async def fake_request(method, url, headers=None, content=None, **kwargs):
+            return make_response(200, [
+                {"id": record["Name"], "success": record["Name"] != "bad", "errors": [] if record["Name"] != "bad" else [{"message": "REQUIRED_FIELD_MISSING"}]}
+                for record in json.loads(content)["records"]
+            ])
+
+        tool._make_request = AsyncMock(side_effect=fake_request)
+        records = [{"Name": str(i)} for i in range(450)] + [{"Name": "bad"}]
+
+        results = await tool.execute_many(records, "Account")
+
+        sizes = [len(json.loads(call.kwargs["content"])["records"]) for call in tool._make_request.call_args_list]
+        assert sorted(sizes) == [51, 200, 200]
+        assert tool._make_request.call_args.args[1] == "https://acme.my.salesforce.com/services/data/v58.0/composite/sobjects"
+        assert json.loads(tool._make_request.call_args.kwargs["content"])["records"][0]["attributes"] == {"type": "Account"}
+        assert [result.data["id"] for result in results[:3]] == ["0", "1", "2"]
+        assert results[-1].success is False
+        assert results[-1].error == "REQUIRED_FIELD_MISSING"
+
+    @pytest.mark.asyncio
+    async def test_update_sends_record_ids(self):
+        """Test single updates go through the collections PATCH with the record Id"""
+        tool = salesforce.SalesforceUpdateRecordTool(make_salesforce_credentials())
+        tool._make_request = AsyncMock(return_value=make_response(200, [{"id": "001", "success": True}]))
+
+        result = await tool.execute(record_id="001", object_type="Contact", fields={"Title": "CTO"})
+
+        assert result.success
+        assert result.data["updated_fields"] == ["Title"]
+        assert tool._make_request.call_args.args[0] == "PATCH"
+        assert json.loads(tool._make_request.call_args.kwargs["content"])["records"] == [
+            {"attributes": {"type": "Contact"}, "Title": "CTO", "Id": "001"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sobjects_summary_cached_per_instance(self):
+        """Test the sobjects listing is fetched once and summarised from the first matches"""
+        salesforce._SOBJECTS_SUMMARIES.clear()
+        tool = salesforce.SalesforceCreateRecordTool(make_salesforce_credentials())
+        sobjects = [{"name": f"Obj{i}", "createable": i % 2 == 0} for i in range(40)]
+        tool._make_request = AsyncMock(return_value=make_response(200, {"sobjects": sobjects}))
+
+        first = await tool._test_connection_impl()
+        second = await tool._test_connection_impl()
+
+        assert first == second
+        assert first["createable_objects"] == [f"Obj{i}" for i in range(0, 20, 2)]
+        assert first["total_objects"] == 40
+        assert tool._make_request.await_count == 1
+        salesforce._SOBJECTS_SUMMARIES.clear()
+
+    @pytest.mark.asyncio
+    async def test_describe_cached_per_instance(self):
+        """Test the Organization describe is fetched once per org"""
+        salesforce._DESCRIBES.clear()
+        tool = salesforce.SalesforceQueryTool(make_salesforce_credentials())
+        tool._make_request = AsyncMock(return_value=make_response(200, {"label": "Acme"}))
+
+        first = await tool._test_connection_impl()
+        second = await salesforce.SalesforceQueryTool(make_salesforce_credentials())._test_connection_impl()
+
+        assert first == second
+        assert first["organization"] == "Acme"
+        assert tool._make_request.await_count == 1
+        salesforce._DESCRIBES.clear()
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_fails_every_record_once(self, monkeypatch):
+        """Test a failed session fetch is reported per record without retrying per chunk"""
+        fetch = AsyncMock(side_effect=RuntimeError("invalid_grant"))
+        monkeypatch.setattr(salesforce._SalesforceTool, "_fetch_access_token", fetch)
+        tool = salesforce.SalesforceCreateRecordTool(make_salesforce_credentials())
+        tool._make_request = AsyncMock()
+
+        results = await tool.execute_many([{"Name": str(i)} for i in range(401)], "Account")
+
+        assert len(results) == 401
+        assert all(not result.success and result.error == "invalid_grant" for result in results)
+        assert fetch.await_count == 1
+        tool._make_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_malformed_save_response_returns_failure(self):
+        """Test an unexpected collections body becomes a failed result"""
+        tool = salesforce.SalesforceUpdateRecordTool(make_salesforce_credentials())
+        tool._make_request = AsyncMock(return_value=make_response(200, {"message": "unexpected"}))
+
+        result = await tool.execute(record_id="001", object_type="Contact", fields={"Title": "CTO"})
+
+        assert result.success is False
+        assert result.metadata["action"] == "update"
+
+
+class TestSalesforceQuery:
+    """Test SOQL query execution"""
+
+    @pytest.fixture(autouse=True)
+    def session(self, monkeypatch):
+        salesforce._TOKEN_CACHE.clear()
+        monkeypatch.setattr(
+            salesforce._SalesforceTool, "_fetch_access_token",
+            AsyncMock(return_value=("tok", "https://acme.my.salesforce.com"))
+        )
+        yield
+        salesforce._TOKEN_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_follows_next_records_url_until_limit(self):
+        """Test later batches are fetched through nextRecordsUrl and stop at the limit"""
+        tool = salesforce.SalesforceQueryTool(make_salesforce_credentials())
+        batch = [{"attributes": {"type": "Account"}, "Id": str(i)} for i in range(300)]
+        tool._make_request = AsyncMock(side_effect=[
+            make_response(200, {"totalSize": 9000, "records": batch, "nextRecordsUrl": "/services/data/v58.0/query/01g-300"}),
+            make_response(200, {"totalSize": 9000, "records": batch, "nextRecordsUrl": "/services/data/v58.0/query/01g-600"}),
+        ])
+
+        result = await tool.execute(object_type="Account", limit=500)
+
+        assert result.success
+        assert len(result.data["records"]) == 600
+        assert result.data["records"][0] == {"Id": "0"}
+        calls = tool._make_request.call_args_list
+        assert calls[1].args[1] == "https://acme.my.salesforce.com/services/data/v58.0/query/01g-300"
+        assert calls[0].kwargs["headers"]["Sforce-Query-Options"] == "batchSize=500"
+
+    @pytest.mark.asyncio
+    async def test_large_queries_are_streamed(self, monkeypatch):
+        """Test queries above the streaming threshold are parsed from the response stream"""
+        batch = [{"attributes": {"type": "Account"}, "Id": str(i)} for i in range(2000)]
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            next_url = "/services/data/v58.0/query/01g-2000" if len(seen) == 1 else "/services/data/v58.0/query/01g-4000"
+            return httpx.Response(200, content=json.dumps({"totalSize": 9000, "records": batch, "nextRecordsUrl": next_url}).encode())
+
+        client_cls = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        tool = salesforce.SalesforceQueryTool(make_salesforce_credentials())
+
+        result = await tool.execute(object_type="Account", limit=3000)
+
+        assert result.success
+        assert len(result.data["records"]) == 4000
+        assert result.data["records"][0] == {"Id": "0"}
+        assert result.data["total_size"] == 9000
+        assert str(seen[1].url) == "https://acme.my.salesforce.com/services/data/v58.0/query/01g-2000"
+        assert seen[0].headers["Sforce-Query-Options"] == "batchSize=2000"
+        assert seen[0].headers["Authorization"] == "Bearer tok"
+
+
+class TestSlackTools:
+    """Test Slack request handling"""
+
+    @pytest.mark.asyncio
+    async def test_message_sent_as_encoded_json(self):
+        """Test the message body is pre-encoded and the cached headers are reused"""
+        tool = slack.SlackSendMessageTool(make_credentials("slack", bot_token="xoxb-1"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"ok": True, "ts": "1.5", "channel": "C1"}))
+
+        result = await tool.execute(channel="C1", text="hi")
+
+        assert result.success
+        kwargs = tool._make_request.call_args.kwargs
+        assert json.loads(kwargs["content"]) == {"channel": "C1", "text": "hi"}
+        assert kwargs["headers"] is tool._headers
+        assert kwargs["headers"]["Authorization"] == "Bearer xoxb-1"
+
+    @pytest.mark.asyncio
+    async def test_large_history_processed_in_thread(self, monkeypatch):
+        """Test long histories are formatted in a worker thread with UTC timestamps"""
+        tool = slack.SlackGetMessagesTool(make_credentials("slack", bot_token="xoxb-1"))
+        history = [{"ts": "0.5", "text": str(i)} for i in range(3)] + [{"text": "no ts"}]
+        tool._make_request = AsyncMock(return_value=make_response(200, {"ok": True, "messages": history}))
+        to_thread = AsyncMock(side_effect=lambda func, *args: func(*args))
+        monkeypatch.setattr(slack.asyncio, "to_thread", to_thread)
+        monkeypatch.setattr(slack, "_THREADED_PROCESSING_THRESHOLD", 2)
+
+        result = await tool.execute(channel="C1")
+
+        assert result.success
+        to_thread.assert_awaited_once()
+        messages = result.data["messages"]
+        assert [m["text"] for m in messages] == ["0", "1", "2", "no ts"]
+        assert messages[0]["timestamp"] == "1970-01-01T00:00:00.500000+00:00"
+        assert messages[-1]["timestamp"] is None
+
+    @pytest.mark.asyncio
+    async def test_channels_follow_cursor_until_limit(self):
+        """Test channel pages are followed by cursor and trimmed to the limit"""
+        tool = slack.SlackGetChannelsTool(make_credentials("slack", bot_token="xoxb-1"))
+        pages = [
+            {"ok": True, "channels": [{"id": f"C{i}"} for i in range(200)], "response_metadata": {"next_cursor": "p2"}},
+            {"ok": True, "channels": [{"id": f"C{i}"} for i in range(200, 260)], "response_metadata": {"next_cursor": ""}},
+        ]
+        tool._make_request = AsyncMock(side_effect=[make_response(200, page) for page in pages])
+
+        result = await tool.execute(limit=250)
+
+        assert result.success
+        assert result.data["total"] == 250
+        assert result.data["channels"][-1]["id"] == "C249"
+        params = [call.kwargs["params"] for call in tool._make_request.call_args_list]
+        assert params[0]["limit"] == 200
+        assert params[1] == {"types": "public_channel,private_channel", "limit": 50, "cursor": "p2"}
+
+
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_waits_for_retry_after(self, monkeypatch):
+        """Test a 429 is retried after the advertised Retry-After delay"""
+        tool = slack.SlackSendMessageTool(make_credentials("slack", bot_token="xoxb-1"))
+        limited = make_response(429, {"ok": False, "error": "ratelimited"}, headers={"Retry-After": "7"})
+        tool._make_request = AsyncMock(side_effect=[limited, make_response(200, {"ok": True, "ts": "1.5", "channel": "C1"})])
+        sleep = AsyncMock()
+        monkeypatch.setattr(slack.asyncio, "sleep", sleep)
+        monkeypatch.setattr(slack.random, "uniform", lambda a, b: 0.5)
+
+        result = await tool.execute(channel="C1", text="hi")
+
+        assert result.success
+        assert tool._make_request.await_count == 2
+        assert tool._make_request.call_args.args[1] == "https://slack.com/api/chat.postMessage"
+        sleep.assert_awaited_once_with(7.5)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_are_bounded(self, monkeypatch):
+        """Test a persistently rate limited call gives up after three retries"""
+        tool = slack.SlackGetChannelsTool(make_credentials("slack", bot_token="xoxb-1"))
+        limited = make_response(429, {"ok": False, "error": "ratelimited"})
+        limited.raise_for_status.side_effect = RuntimeError("429 Too Many Requests")
+        tool._make_request = AsyncMock(return_value=limited)
+        monkeypatch.setattr(slack.asyncio, "sleep", AsyncMock())
+
+        result = await tool.execute()
+
+        assert not result.success
+        assert tool._make_request.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_permalink_built_from_posted_message(self):
+        """Test the permalink uses the returned channel and the dotless timestamp"""
+        tool = slack.SlackSendMessageTool(make_credentials("slack", bot_token="xoxb-1"))
+        tool._make_request = AsyncMock(return_value=make_response(200, {"ok": True, "ts": "1712345678.123456", "channel": "C9"}))
+
+        result = await tool.execute(channel="#general", text="hi")
+
+        assert result.data["permalink"] == "https://slack.com/archives/C9/p1712345678123456"
+        assert result.data["message_ts"] == "1712345678.123456"
+
+    def test_rate_limits_are_per_workspace(self):
+        """Test each bot token gets its own bucket per method"""
+        first = slack.SlackSendMessageTool(make_credentials("slack", bot_token="xoxb-1"))
+        same = slack.SlackGetChannelsTool(make_credentials("slack", bot_token="xoxb-1"))
+        other = slack.SlackSendMessageTool(make_credentials("slack", bot_token="xoxb-2"))
+
+        assert first._rate_limit("chat.postMessage") is same._rate_limit("chat.postMessage")
+        assert first._rate_limit("chat.postMessage") is not other._rate_limit("chat.postMessage")
+        assert first._rate_limit("chat.postMessage") is not first._rate_limit("conversations.list")
+        assert first._rate_limit("auth.test") is None
+
+
+class TestZendeskTools:
+    """Test Zendesk request handling"""
+
+    @pytest.fixture
+    def search_requests(self, monkeypatch):
+        """Serve a fixed search body through the shared client and record the requests"""
+        seen = []
+        body = json.dumps({
+            "count": 3,
+            "results": [
+                {"result_type": "ticket", "id": 1, "subject": "Printer jam", "status": "open", "via": {"channel": "email"}},
+                {"result_type": "user", "id": 7, "name": "Ann"},
+                {"result_type": "ticket", "id": 2, "subject": "Toner", "status": "open", "tags": ["hw"]},
+            ]
+        }).encode()
+        transport = httpx.MockTransport(lambda request: seen.append(request) or httpx.Response(200, content=body))
+        client_cls = httpx.AsyncClient
+        monkeypatch.setattr(base.httpx, "AsyncClient", lambda **kwargs: client_cls(transport=transport, **kwargs))
+        return seen
+
+    @pytest.mark.asyncio
+    async def test_cached_headers_follow_credentials(self, search_requests):
+        """Test the Basic auth header is built once and rebuilt for new credentials"""
+        tool = zendesk.ZendeskSearchTicketsTool(make_zendesk_credentials())
+        headers = tool._headers
+
+        await tool.execute(status="open")
+
+        assert tool._headers is headers
+        assert search_requests[0].headers["Authorization"] == "Basic YUBiLmMvdG9rZW46dA=="
+
+        tool.credentials = make_zendesk_credentials(api_token="u")
+
+        assert tool._headers["Authorization"] == "Basic YUBiLmMvdG9rZW46dQ=="
+
+    @pytest.mark.asyncio
+    async def test_search_results_projected_while_streaming(self, search_requests):
+        """Test tickets are kept, other result types dropped and the count read from the stream"""
+        tool = zendesk.ZendeskSearchTicketsTool(make_zendesk_credentials())
+
+        result = await tool.execute(query="printer")
+
+        assert result.success
+        assert [ticket["id"] for ticket in result.data["tickets"]] == [1, 2]
+        assert "via" not in result.data["tickets"][0]
+        assert result.data["tickets"][1]["tags"] == ["hw"]
+        assert result.data["total_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_update_many_groups_identical_changes(self):
+        """Test identical changes share an ids= request and the rest go as per-ticket bodies"""
+        tool = zendesk.ZendeskUpdateTicketTool(make_zendesk_credentials())
+        tool._make_request = AsyncMock(return_value=make_response(200, {"job_status": {"id": "J1", "status": "queued"}}))
+        updates = [{"ticket_id": i, "status": "solved"} for i in range(150)] + [
+            {"ticket_id": 900, "priority": "high"},
+            {"ticket_id": 901, "comment": "Looking into it"},
+        ]
+
+        results = await tool.execute_many(updates)
+
+        calls = tool._make_request.call_args_list
+        assert len(calls) == 3
+        assert all(call.args == ("PUT", "https://acme.zendesk.com/api/v2/tickets/update_many.json") for call in calls)
+        shared = [call.kwargs for call in calls if call.kwargs.get("params")]
+        assert [kwargs["params"]["ids"].count(",") + 1 for kwargs in shared] == [100, 50]
+        assert shared[0]["data"] == {"ticket": {"status": "solved"}}
+        individual = next(call.kwargs["data"] for call in calls if not call.kwargs.get("params"))
+        assert individual["tickets"] == [
+            {"id": 900, "priority": "high"},
+            {"id": 901, "comment": {"body": "Looking into it", "public": True}},
+        ]
+        assert all(result.success for result in results)
+        assert results[-1].data == {"ticket_id": 901, "job_id": "J1", "job_status": "queued", "updated_fields": ["comment"]}
+
+    @pytest.mark.asyncio
+    async def test_update_many_fails_missing_ids_and_unreadable_jobs(self):
+        """Test updates without a ticket_id and chunks with an unreadable reply fail on their own"""
+        tool = zendesk.ZendeskUpdateTicketTool(make_zendesk_credentials())
+        unreadable = Mock(content=b"<html>")
+
+        async def fake_request(method, url, headers=None, params=None, data=None, **kwargs):
+            if params:
+                return make_response(200, {"job_status": {"id": "J1", "status": "queued"}})
+            return unreadable
+
+        tool._make_request = AsyncMock(side_effect=fake_request)
+        results = await tool.execute_many([
+            {"ticket_id": 1, "status": "solved"},
+            {"status": "solved"},
+            {"ticket_id": 2, "status": "solved"},
+            {"ticket_id": 3, "tags": ["vip"]},
+        ])
+
+        assert tool._make_request.await_count == 2
+        assert [result.success for result in results] == [True, False, True, False]
+        assert results[1].error == "An update needs a ticket_id"
+        assert results[3].metadata["ticket_id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_tool_reports_failed_tickets(self, monkeypatch):
+        """Test the bulk tool lists tickets whose batch failed"""
+        tool = zendesk.ZendeskBulkUpdateTicketsTool(make_zendesk_credentials())
+
+        async def fake_request(method, url, headers=None, params=None, data=None, **kwargs):
+            if params:
+                return make_response(200, {"job_status": {"id": "J1", "status": "queued"}})
+            raise RuntimeError("422 Unprocessable Entity")
+
+        monkeypatch.setattr(zendesk.ZendeskUpdateTicketTool, "_make_request", AsyncMock(side_effect=fake_request))
+        result = await tool.execute(updates=[
+            {"ticket_id": 1, "status": "solved"},
+            {"ticket_id": 2, "status": "solved"},
+            {"ticket_id": 3, "tags": ["vip"]},
+        ])
+
+        assert not result.success
+        assert result.data["job_ids"] == ["J1"]
+        assert result.data["failed"] == {3: "422 Unprocessable Entity"}
+
+    @pytest.mark.asyncio
+    async def test_search_restricted_to_tickets(self, search_requests):
+        """Test free-text searches only ask Zendesk for ticket results"""
+        tool = zendesk.ZendeskSearchTicketsTool(make_zendesk_credentials())
+
+        await tool.execute(query="printer jam", status="open")
+        await tool.execute(query="type:ticket printer")
+
+        queries = [request.url.params["query"] for request in search_requests]
+        assert queries == ["type:ticket printer jam status:open", "type:ticket printer"]
+
+    @pytest.mark.asyncio
+    async def test_urls_follow_credentials(self):
+        """Test API URLs are derived once and rebuilt for a new subdomain"""
+        tool = zendesk.ZendeskUpdateTicketTool(make_zendesk_credentials())
+        tool._make_request = AsyncMock(return_value=make_response(200, {"ticket": {"id": 5}}))
+
+        await tool.execute(ticket_id=5, status="solved")
+        tool.credentials = make_credentials("zendesk", subdomain="other", email="a@b.c", api_token="t")
+        await tool.execute(ticket_id=5, status="solved")
+
+        urls = [call.args[1] for call in tool._make_request.call_args_list]
+        assert urls == [
+            "https://acme.zendesk.com/api/v2/tickets/5.json",
+            "https://other.zendesk.com/api/v2/tickets/5.json",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_query_built_from_cached_template(self, search_requests):
+        """Test each argument combination formats its own cached template"""
+        tool = zendesk.ZendeskSearchTicketsTool(make_zendesk_credentials())
+
+        await tool.execute(priority="high")
+        await tool.execute(query="{braces} kept", status="open", priority="low")
+
+        queries = [request.url.params["query"] for request in search_requests]
+        assert queries == ["type:ticket priority:high", "type:ticket {braces} kept status:open priority:low"]
+        assert zendesk._search_template(True, False, False, True) == "type:ticket priority:{priority}"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_without_ticket_id_fails_cleanly(self):
+        """Test a malformed bulk update returns a failed result instead of raising"""
+        tool = zendesk.ZendeskBulkUpdateTicketsTool(make_zendesk_credentials())
+        tool._make_request = AsyncMock()
+
+        result = await tool.execute(updates=[{"ticket_id": 1, "status": "solved"}, {"status": "open"}])
+
+        assert result.success is False
+        assert "[1]" in result.error
+        assert result.metadata["action"] == "bulk_update"
+        tool._make_request.assert_not_awaited()